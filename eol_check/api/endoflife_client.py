@@ -2,23 +2,76 @@
 Client for the endoflife.date API.
 """
 
+import functools
 import json
 import re
+import threading
 import time
-from typing import Dict, Optional, Any, List
+from concurrent.futures import Future
+from typing import Dict, FrozenSet, Iterable, Optional, Any, List, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from eol_check.utils.cache import Cache
 from eol_check.utils.logger import debug, info, warning, error
 from eol_check.utils.version import normalize_version
 
+# Map of package names to endoflife.date product names, keyed by normalized
+# (lowercase, "-" separated) package name
+_PRODUCT_MAPPING = {
+    # Node.js packages
+    "react": "react",
+    "angular": "angular",
+    "vue": "vue",
+    "node": "nodejs",
+    "nodejs": "nodejs",
+    
+    # Python packages
+    "django": "django",
+    "python": "python",
+    
+    # Java packages
+    "spring": "spring",
+    "spring-boot": "spring-boot",
+    "java": "java",
+    "spring-boot-starter-parent": "spring-boot",
+    
+    # Add more mappings as needed
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_product_name(package_name: str) -> str:
+    """Resolve a package name to an endoflife.date product name.
+    
+    Args:
+        package_name: Package name
+        
+    Returns:
+        Product name
+    """
+    # Convert to lowercase for case-insensitive matching
+    package_name_lower = package_name.lower()
+    
+    # Look up the normalized name, defaulting to the package name itself
+    normalized_name = package_name_lower.replace("_", "-")
+    return _PRODUCT_MAPPING.get(normalized_name, package_name_lower)
+
 
 class EndOfLifeClient:
     """Client for interacting with the endoflife.date API."""
     
     BASE_URL = "https://endoflife.date/api"
     DEFAULT_CACHE_TTL = 24 * 60 * 60  # 1 day in seconds
+    REQUEST_TIMEOUT = (3.05, 10)  # (connect, read) timeouts in seconds
+    POOL_MAXSIZE = 16
+    
+    # Per-endpoint cache TTLs, used unless an explicit cache TTL is configured
+    CACHE_TTL_POLICIES = {
+        "all": 6 * 60 * 60,  # Product list picks up new products more often
+    }
     
     def __init__(
         self,
@@ -26,6 +79,7 @@ class EndOfLifeClient:
         offline_mode: bool = False,
         force_update: bool = False,
         cache_ttl: int = None,
+        pool_maxsize: Optional[int] = None,
     ):
         """Initialize the client.
         
@@ -33,55 +87,122 @@ class EndOfLifeClient:
             cache: Cache instance for storing API responses
             offline_mode: If True, only use cached data
             force_update: If True, ignore cache and fetch fresh data
-            cache_ttl: Cache time-to-live in seconds (default: 1 day)
+            cache_ttl: Cache time-to-live in seconds. Defaults to 1 day, or the
+                per-endpoint policy in CACHE_TTL_POLICIES when one exists.
+            pool_maxsize: Number of concurrent requests expected, usually the
+                worker count. The connection pool is grown to match so no
+                worker waits for, or throws away, a connection.
         """
         self.cache = cache
         self.offline_mode = offline_mode
         self.force_update = force_update
+        self._explicit_cache_ttl = cache_ttl is not None
         self.cache_ttl = cache_ttl if cache_ttl is not None else self.DEFAULT_CACHE_TTL
         
-        # Map of package managers to endoflife.date product names
-        self.product_mapping = {
-            # Node.js packages
-            "react": "react",
-            "angular": "angular",
-            "vue": "vue",
-            "node": "nodejs",
-            "nodejs": "nodejs",
-            
-            # Python packages
-            "django": "django",
-            "python": "python",
-            
-            # Java packages
-            "spring": "spring",
-            "spring-boot": "spring-boot",
-            "java": "java",
-            "spring-boot-starter-parent": "spring-boot",
-            
-            # Add more mappings as needed
-        }
-        
         # Cache for product availability
         self.available_products_cache = {}
+        
+        # In-memory copy of API responses already loaded during this run, so
+        # repeat lookups skip reading and parsing the cache file again
+        self._mem_cache: Dict[str, Any] = {}
+        
+        # Set of all products known to endoflife.date (loaded lazily)
+        self._product_index: Optional[FrozenSet[str]] = None
+        self._product_index_failed = False
+        
+        # Per-product lookup tables over release cycles (built lazily)
+        self._cycle_indexes: Dict[str, Any] = {}
+        
+        # Shared HTTP session so all requests to endoflife.date reuse pooled
+        # keep-alive connections instead of a new TCP+TLS handshake each
+        self._session = requests.Session()
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max(self.POOL_MAXSIZE, pool_maxsize or 0),
+            max_retries=retries,
+        )
+        self._session.mount("https://", adapter)
+        
+        # In-flight API requests, so concurrent lookups of the same endpoint
+        # share a single HTTP round-trip
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
     
-    def _fetch_from_api(self, endpoint: str) -> Dict[str, Any]:
+    def _fetch_from_api(
+        self, endpoint: str, validators: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[Any], Dict[str, str]]:
         """Fetch data from the API.
         
         Args:
             endpoint: API endpoint path
+            validators: "etag" and/or "last_modified" values from a previous
+                response, sent so the server can answer 304 Not Modified
             
         Returns:
-            Data as dictionary
+            Tuple of (data, validators). Data is None if the server answered
+            304 Not Modified.
             
         Raises:
             requests.HTTPError: If the API request fails
         """
         url = f"{self.BASE_URL}/{endpoint}"
         debug(f"Fetching from API: {url}")
-        response = requests.get(url)
+        
+        validators = validators or {}
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        
+        response = self._session.get(url, headers=headers, timeout=self.REQUEST_TIMEOUT)
         response.raise_for_status()  # This will raise an exception for 404s and other errors
-        return response.json()
+        
+        new_validators = {
+            "etag": response.headers.get("ETag") or validators.get("etag"),
+            "last_modified": response.headers.get("Last-Modified") or validators.get("last_modified"),
+        }
+        new_validators = {k: v for k, v in new_validators.items() if v}
+        
+        if response.status_code == 304:
+            return None, new_validators
+        return response.json(), new_validators
+    
+    def _ttl_for(self, endpoint: str) -> int:
+        """Get the cache TTL for an endpoint.
+        
+        Args:
+            endpoint: API endpoint path without the .json extension
+            
+        Returns:
+            Cache TTL in seconds
+        """
+        if self._explicit_cache_ttl:
+            return self.cache_ttl
+        return self.CACHE_TTL_POLICIES.get(endpoint, self.cache_ttl)
+    
+    def reset(self) -> None:
+        """Forget the responses and lookups kept in memory by earlier runs.
+        
+        Called at the start of each project check, so a client that outlives
+        one run, such as the UI's shared checker, reads the cache again,
+        honoring its TTLs and force_update, instead of reusing old results.
+        """
+        self._mem_cache.clear()
+        self.available_products_cache.clear()
+        self._product_index = None
+        self._product_index_failed = False
+        self._cycle_indexes.clear()
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
     
     def _get_with_cache(self, endpoint: str) -> Dict[str, Any]:
         """Get data from cache or API.
@@ -108,34 +229,106 @@ class EndOfLifeClient:
         if self.offline_mode or self.force_update:
             debug(f"Cache mode: offline={self.offline_mode}, force_update={self.force_update}")
         
+        # Responses loaded earlier in this run are always fresh enough. The
+        # in-memory copies are dropped by reset() before each run, so with
+        # force_update they can only come from this run's own API requests.
+        mem_data = self._mem_cache.get(cache_key)
+        if mem_data is not None:
+            return mem_data
+        
         # Check if we should use cache
         if not self.force_update:
             cached_data = self.cache.get(cache_key)
             if cached_data:
                 if self.offline_mode:
                     info(f"Using cached data for {endpoint}")
+                self._mem_cache[cache_key] = cached_data
                 return cached_data
         
-        # If offline mode and no cache, raise error
+        # If offline mode and no fresh cache, fall back to expired data or raise error
         if self.offline_mode:
+            stale_data = self.cache.get_stale(cache_key)
+            if stale_data is not None:
+                info(f"Using expired cached data for {endpoint}")
+                self._mem_cache[cache_key] = stale_data
+                return stale_data
+            
             error_msg = f"No cached data available for {endpoint} and offline mode is enabled"
             error(error_msg)
             raise ValueError(error_msg)
         
-        # Fetch from API
+        # Fetch from API, joining any request already in flight for this key
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[cache_key] = future
+        
+        if not is_owner:
+            debug("Waiting for in-flight request for %s", endpoint)
+            return future.result()
+        
         try:
-            data = self._fetch_from_api(endpoint)
+            data = self._fetch_and_cache(endpoint, cache_key, self._ttl_for(clean_endpoint))
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            self._mem_cache[cache_key] = data
+            future.set_result(data)
+            return data
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+    
+    def _fetch_and_cache(self, endpoint: str, cache_key: str, ttl: int) -> Dict[str, Any]:
+        """Fetch data from the API and store it in the cache.
+        
+        If the request fails for any reason other than a 404, expired cached
+        data is returned when available.
+        
+        Args:
+            endpoint: API endpoint path
+            cache_key: Cache key for the endpoint
+            ttl: Cache time-to-live in seconds
+            
+        Returns:
+            Data as dictionary
+            
+        Raises:
+            requests.RequestException: If the API request fails and no cached data exists
+        """
+        try:
+            # Revalidate the expired entry instead of downloading it again
+            data, validators = self._fetch_from_api(endpoint, self.cache.get_metadata(cache_key))
+            if data is None:
+                data = self.cache.get_stale(cache_key)
+                if data is None:
+                    # The cached body is gone, so fetch it unconditionally
+                    data, validators = self._fetch_from_api(endpoint)
+                else:
+                    debug(f"{endpoint} not modified, refreshing cached data")
             
             # Update cache with successful response
-            self.cache.set(cache_key, data, ttl=self.cache_ttl)
+            self.cache.set(cache_key, data, ttl=ttl, metadata=validators)
             return data
             
-        except requests.HTTPError as e:
+        except requests.RequestException as e:
             # If it's a 404 error, cache the negative result
-            if e.response.status_code == 404:
+            response = getattr(e, "response", None)
+            if response is not None and response.status_code == 404:
                 debug(f"Product {endpoint} not found (404), caching negative result")
                 # We'll cache an empty dict to indicate the product doesn't exist
-                self.cache.set(cache_key, {}, ttl=self.cache_ttl)
+                self.cache.set(cache_key, {}, ttl=ttl)
+                raise
+            
+            # Fall back to expired data rather than failing the lookup
+            stale_data = self.cache.get_stale(cache_key)
+            if stale_data is not None:
+                warning(f"Could not fetch {endpoint} ({e}), using expired cached data")
+                return stale_data
+            
             # Re-raise the exception
             raise
     
@@ -148,20 +341,44 @@ class EndOfLifeClient:
         Returns:
             Product name
         """
-        # Convert to lowercase for case-insensitive matching
-        package_name_lower = package_name.lower()
+        return _resolve_product_name(package_name)
+    
+    def _load_product_index(self) -> Optional[FrozenSet[str]]:
+        """Load the set of all products known to the API.
+        
+        Returns:
+            Set of product names, or None if the product list is unavailable
+        """
+        if self._product_index is None and not self._product_index_failed:
+            try:
+                if self.offline_mode:
+                    # Read the cached list directly: without it, products are
+                    # probed individually, so its absence isn't an error
+                    products = self.cache.get("eol_api_all")
+                    if products is None:
+                        products = self.cache.get_stale("eol_api_all")
+                else:
+                    products = self._get_with_cache("all.json")
+                if products:
+                    self._product_index = frozenset(products)
+                else:
+                    self._product_index_failed = True
+            except Exception as e:
+                debug(f"Could not load product list, probing products individually: {e}")
+                self._product_index_failed = True
         
-        # Check if we have a direct mapping
-        if package_name_lower in self.product_mapping:
-            return self.product_mapping[package_name_lower]
+        return self._product_index
+    
+    def prefetch_product_index(self) -> bool:
+        """Load the list of all products known to the API ahead of lookups.
         
-        # Try to normalize the name
-        normalized_name = package_name_lower.replace("_", "-")
-        if normalized_name in self.product_mapping:
-            return self.product_mapping[normalized_name]
+        Needs no dependency names, so it can run while the project is still
+        being parsed.
         
-        # Default to the package name itself
-        return package_name_lower
+        Returns:
+            True if the product list was loaded, False otherwise
+        """
+        return self._load_product_index() is not None
     
     def _is_product_available(self, product_name: str) -> bool:
         """Check if a product is available in the API.
@@ -176,6 +393,13 @@ class EndOfLifeClient:
         if product_name in self.available_products_cache:
             return self.available_products_cache[product_name]
         
+        # Check against the full product list, which needs a single request
+        product_index = self._load_product_index()
+        if product_index is not None:
+            available = product_name in product_index
+            self.available_products_cache[product_name] = available
+            return available
+        
         # Check persistent cache for negative results
         cache_key = f"eol_api_product_availability_{product_name}"
         cached_availability = self.cache.get(cache_key)
@@ -212,6 +436,67 @@ class EndOfLifeClient:
         """
         return self._get_with_cache(product_name)
     
+    def preload_cache(self, product_names: Iterable[str]) -> None:
+        """Read the cached responses for the given products into memory.
+        
+        Args:
+            product_names: Product names about to be looked up
+        """
+        # A forced update ignores cached responses anyway
+        if self.force_update:
+            return
+        
+        keys = ["eol_api_all"]
+        keys.extend(f"eol_api_{product_name}" for product_name in product_names)
+        loaded = self.cache.preload(keys)
+        debug(f"Preloaded {loaded} of {len(keys)} cached responses")
+    
+    def prefetch_product(self, product_name: str) -> bool:
+        """Load the release cycles of a product ahead of get_eol_info calls.
+        
+        Lookups for every package that maps to the product are then answered
+        from memory. Errors are not raised here; they surface again from the
+        lookups themselves.
+        
+        Args:
+            product_name: Product name
+            
+        Returns:
+            True if version information was loaded, False otherwise
+        """
+        if not self._is_product_available(product_name):
+            return False
+        
+        try:
+            return bool(self.get_product_versions(product_name))
+        except Exception as e:
+            debug(f"Could not prefetch {product_name}: {e}")
+            return False
+    
+    def _get_cycle_index(self, product_name: str, versions: List[Dict[str, Any]]):
+        """Get lookup tables over the release cycles of a product.
+        
+        Args:
+            product_name: Product name
+            versions: Version information for the product, in API order
+            
+        Returns:
+            Tuple of (cycle -> (position, info), major -> info) dicts. Both keep
+            the first entry in API order when several share a key.
+        """
+        index = self._cycle_indexes.get(product_name)
+        if index is None:
+            by_cycle = {}
+            by_major = {}
+            for position, ver_info in enumerate(versions):
+                if "cycle" in ver_info:
+                    ver_cycle = str(ver_info["cycle"])
+                    by_cycle.setdefault(ver_cycle, (position, ver_info))
+                    by_major.setdefault(ver_cycle.split(".")[0], ver_info)
+            index = (by_cycle, by_major)
+            self._cycle_indexes[product_name] = index
+        return index
+    
     def get_eol_info(self, package_name: str, version: str) -> Optional[Dict[str, Any]]:
         """Get EOL information for a package version.
         
@@ -223,11 +508,18 @@ class EndOfLifeClient:
             EOL information or None if not found
         """
         product_name = self._get_product_name(package_name)
-        debug(f"Looking up EOL info for {package_name} {version} (product: {product_name})")
+        debug("Looking up EOL info for %s %s (product: %s)", package_name, version, product_name)
+        
+        # Most transitive dependencies have no EOL data, so reject them with a
+        # single set lookup once the product list is loaded
+        product_index = self._load_product_index()
+        if product_index is not None and product_name not in product_index:
+            debug("Product %s not available in endoflife.date API", product_name)
+            return None
         
         # Check if the product is available
         if not self._is_product_available(product_name):
-            debug(f"Product {product_name} not available in endoflife.date API")
+            debug("Product %s not available in endoflife.date API", product_name)
             return None
         
         try:
@@ -236,33 +528,35 @@ class EndOfLifeClient:
             
             # If versions is empty (cached negative result), return None
             if not versions:
-                debug(f"No version information available for {product_name}")
+                debug("No version information available for %s", product_name)
                 return None
-                
+            
+            by_cycle, by_major = self._get_cycle_index(product_name, versions)
+            
             # Normalize the version for comparison
             normalized_version = normalize_version(version)
             
-            # Find the matching version
-            for ver_info in versions:
-                if "cycle" in ver_info:
-                    ver_cycle = ver_info["cycle"]
-                    
-                    # Try to match the version with the cycle
-                    if normalized_version.startswith(ver_cycle):
-                        debug(f"Found exact match for {package_name} {version}: cycle {ver_cycle}")
-                        return ver_info
+            # Find the matching version: the first cycle in API order that is a
+            # prefix of the version. Only the version's own prefixes can match,
+            # so look those up instead of scanning every cycle.
+            best = None
+            for end in range(len(normalized_version) + 1):
+                entry = by_cycle.get(normalized_version[:end])
+                if entry is not None and (best is None or entry[0] < best[0]):
+                    best = entry
             
-            # If no exact match, try to find the closest match
-            for ver_info in versions:
-                if "cycle" in ver_info:
-                    ver_cycle = ver_info["cycle"]
-                    
-                    # Check if the major version matches
-                    if normalized_version.split(".")[0] == ver_cycle.split(".")[0]:
-                        debug(f"Found closest match for {package_name} {version}: cycle {ver_cycle}")
-                        return ver_info
+            if best is not None:
+                ver_info = best[1]
+                debug("Found exact match for %s %s: cycle %s", package_name, version, ver_info["cycle"])
+                return ver_info
+            
+            # If no exact match, try to find the closest match by major version
+            ver_info = by_major.get(normalized_version.split(".")[0])
+            if ver_info is not None:
+                debug("Found closest match for %s %s: cycle %s", package_name, version, ver_info["cycle"])
+                return ver_info
             
-            debug(f"No EOL info found for {package_name} {version}")
+            debug("No EOL info found for %s %s", package_name, version)
             return None
         
         except Exception as e:
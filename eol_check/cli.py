@@ -8,9 +8,8 @@ import sys
 from datetime import datetime
 from typing import Optional
 
-from eol_check.core import EOLChecker
-from eol_check.reporters import get_reporter
 from eol_check.utils.logger import configure_logger, info, error, debug
+from eol_check.utils.time_parser import parse_ttl
 
 
 def parse_cache_ttl(value: str) -> int:
@@ -25,25 +24,9 @@ def parse_cache_ttl(value: str) -> int:
     Raises:
         argparse.ArgumentTypeError: If the value is invalid
     """
-    # Simple implementation for now
-    if value.endswith('d'):
-        try:
-            days = int(value[:-1])
-            return days * 24 * 60 * 60
-        except ValueError:
-            pass
-    elif value.endswith('h'):
-        try:
-            hours = int(value[:-1])
-            return hours * 60 * 60
-        except ValueError:
-            pass
-    elif value.endswith('m'):
-        try:
-            minutes = int(value[:-1])
-            return minutes * 60
-        except ValueError:
-            pass
+    seconds = parse_ttl(value)
+    if seconds is not None:
+        return seconds
     
     raise argparse.ArgumentTypeError(
         f"Invalid cache TTL format: {value}. "
@@ -90,8 +73,8 @@ def parse_args():
     parser.add_argument(
         "--cache-ttl",
         type=parse_cache_ttl,
-        default="1d",
-        help="Cache time-to-live duration (default: 1d). "
+        default=None,
+        help="Cache time-to-live duration (default: 1d, 6h for the product list). "
              "Formats: '1d' (1 day), '12h' (12 hours), '30m' (30 minutes).",
     )
     parser.add_argument(
@@ -108,6 +91,11 @@ def parse_args():
         type=int,
         help="Maximum number of parallel workers for API requests (default: CPU count * 2)",
     )
+    parser.add_argument(
+        "--direct-only",
+        action="store_true",
+        help="Only check direct dependencies, skipping transitive ones",
+    )
     parser.add_argument(
         "--ui",
         action="store_true",
@@ -145,6 +133,11 @@ def main():
         error(f"Project path '{args.project_path}' does not exist.")
         sys.exit(1)
     
+    # Imported here so the UI and argument errors don't pay for loading the
+    # checker, API client and reporters
+    from eol_check.core import EOLChecker
+    from eol_check.reporters import get_reporter
+    
     # Initialize the checker - verbose flag controls debug output, not progress bar
     checker = EOLChecker(
         threshold_days=args.threshold,
@@ -154,6 +147,7 @@ def main():
         ignore_file=args.ignore_file,
         cache_ttl=args.cache_ttl,
         max_workers=args.max_workers,
+        include_transitive=not args.direct_only,
     )
     
     # Run the check
@@ -167,6 +161,8 @@ def main():
             import traceback
             error(traceback.format_exc())
         sys.exit(1)
+    finally:
+        checker.close()
     
     # Generate the report
     reporter = get_reporter(args.format)
@@ -174,25 +170,25 @@ def main():
     # Get execution time from results if available
     execution_time = results.get("execution_time")
     
-    report = reporter.generate_report(
-        results=results,
-        project_path=args.project_path,
-        scan_date=datetime.now(),
-        threshold_days=args.threshold,
-        execution_time=execution_time,
-    )
+    report_args = {
+        "results": results,
+        "project_path": args.project_path,
+        "scan_date": datetime.now(),
+        "threshold_days": args.threshold,
+        "execution_time": execution_time,
+    }
     
-    # Output the report
+    # Output the report, writing it straight to the file when saving it
     if args.output:
         try:
             with open(args.output, "w", encoding="utf-8") as f:
-                f.write(report)
+                reporter.generate_report_to(f, **report_args)
             print(f"Report saved to {args.output}")
         except Exception as e:
             print(f"Error saving report: {e}", file=sys.stderr)
             sys.exit(1)
     else:
-        print(report)
+        print(reporter.generate_report(**report_args))
     
     # Exit with non-zero status if critical issues found
     if results.get("summary", {}).get("critical", 0) > 0:
@@ -6,7 +6,8 @@ import os
 import sys
 import time
 import concurrent.futures
-from datetime import datetime
+import functools
+from datetime import date, datetime
 from typing import Dict, List, Optional, Any
 
 from eol_check.api.endoflife_client import EndOfLifeClient
@@ -14,11 +15,48 @@ from eol_check.parsers import get_parsers_for_project
 from eol_check.utils.cache import Cache
 from eol_check.utils.logger import debug, info, warning, error
 from eol_check.utils.request_pool import RequestPool
+from eol_check.utils.version import has_major_version_change
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date(value: str) -> date:
+    """Parse an ISO date, as used for endoflife.date EOL dates.
+    
+    Many dependencies share a release cycle, and so an EOL date, so parsed
+    dates are cached.
+    
+    Args:
+        value: Date string in YYYY-MM-DD format
+        
+    Returns:
+        Parsed date
+    """
+    return date.fromisoformat(value)
+
+
+def _is_active(eol: Any, today: date) -> bool:
+    """Check whether a release cycle is still supported.
+    
+    Args:
+        eol: The cycle's "eol" field, False or an ISO date string
+        today: Current date
+        
+    Returns:
+        True if the cycle has no EOL date or it is still in the future
+    """
+    if eol is False:
+        return True
+    if isinstance(eol, str):
+        return _parse_date(eol) > today
+    return False
 
 
 class EOLChecker:
     """Main class for checking end-of-life status of dependencies."""
     
+    # Minimum number of seconds between progress bar redraws
+    PROGRESS_INTERVAL = 0.05
+    
     def __init__(
         self,
         threshold_days: int = 90,
@@ -28,6 +66,7 @@ class EOLChecker:
         ignore_file: Optional[str] = None,
         cache_ttl: int = None,
         max_workers: Optional[int] = None,
+        include_transitive: bool = True,
     ):
         """Initialize the EOL checker.
         
@@ -39,6 +78,7 @@ class EOLChecker:
             ignore_file: Path to file containing dependencies to ignore
             cache_ttl: Cache time-to-live in seconds
             max_workers: Maximum number of parallel workers for API requests
+            include_transitive: Check transitive dependencies as well as direct ones
         """
         self.threshold_days = threshold_days
         self.offline_mode = offline_mode
@@ -46,6 +86,7 @@ class EOLChecker:
         self.verbose = verbose
         self.ignore_list = self._load_ignore_list(ignore_file) if ignore_file else []
         self.max_workers = max_workers
+        self.include_transitive = include_transitive
         
         self.cache = Cache()
         self.api_client = EndOfLifeClient(
@@ -53,7 +94,29 @@ class EOLChecker:
             offline_mode=offline_mode,
             force_update=force_update,
             cache_ttl=cache_ttl,
+            pool_maxsize=max_workers or RequestPool.default_max_workers(),
         )
+        
+        # Worker pool for API requests, created on first use and reused by
+        # every check_project call until close()
+        self._pool: Optional[RequestPool] = None
+    
+    def _get_pool(self) -> RequestPool:
+        """Get the worker pool for API requests, creating it on first use.
+        
+        Returns:
+            Request pool
+        """
+        if self._pool is None:
+            self._pool = RequestPool(max_workers=self.max_workers)
+        return self._pool
+    
+    def close(self) -> None:
+        """Shut down the worker pool and close the API client's HTTP session."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self.api_client.close()
     
     def _load_ignore_list(self, ignore_file: str) -> List[str]:
         """Load list of dependencies to ignore from file."""
@@ -102,8 +165,11 @@ class EOLChecker:
         if self.verbose:
             info(f"Checking project: {abs_project_path}")
         
+        # Start from the cache rather than data kept from an earlier run
+        self.api_client.reset()
+        
         # Detect project type and get all appropriate parsers
-        parsers = get_parsers_for_project(project_path)
+        parsers = get_parsers_for_project(project_path, self.include_transitive, self.force_update)
         if not parsers:
             raise ValueError(f"Could not determine project type for {abs_project_path}")
         
@@ -120,14 +186,26 @@ class EOLChecker:
             }
         }
         
-        # Process each parser
+        # Use the shared request pool for parsing and parallel API requests
+        pool = self._get_pool()
+        
+        # Run the parsers in parallel, since most of their time is spent
+        # waiting on package manager subprocesses (npm, yarn, mvn, gradle)
         all_dependencies = []
+        parser_futures = []
         for parser in parsers:
             if self.verbose:
                 print(f"Using parser: {parser.__class__.__name__}")
             
-            # Parse dependencies
-            dependencies = parser.parse_dependencies()
+            parser_futures.append(pool.submit(parser.parse_dependencies))
+        
+        # Load the API's product list meanwhile, overlapping the request with
+        # the package manager subprocesses
+        product_index_future = pool.submit(self.api_client.prefetch_product_index)
+        
+        # Collect results in parser order so the output is deterministic
+        for parser, future in zip(parsers, parser_futures):
+            dependencies = future.result()
             
             if self.verbose:
                 print(f"Found {len(dependencies)} dependencies with {parser.__class__.__name__}")
@@ -137,8 +215,13 @@ class EOLChecker:
         if self.verbose:
             print(f"Found {len(all_dependencies)} total dependencies across all parsers")
         
-        # Filter out ignored dependencies
-        all_dependencies = [dep for dep in all_dependencies if dep["name"] not in self.ignore_list]
+        # Filter out ignored dependencies, and transitive ones unless they are
+        # checked too (Java parsers already skip them while parsing)
+        all_dependencies = [
+            dep for dep in all_dependencies
+            if dep["name"] not in self.ignore_list
+            and (self.include_transitive or not dep.get("transitive"))
+        ]
         
         if self.verbose and self.ignore_list:
             print(f"Filtered to {len(all_dependencies)} dependencies after applying ignore list")
@@ -147,118 +230,139 @@ class EOLChecker:
         today = datetime.now().date()
         total_deps = len(all_dependencies)
         
-        # Use request pool for parallel API requests
-        with RequestPool(max_workers=self.max_workers) as pool:
-            # Define a function to check a single dependency
-            def check_dependency(dep):
-                try:
-                    eol_info = self.api_client.get_eol_info(dep["name"], dep["version"])
+        # Latest supported release cycle of each product, looked up once per
+        # product rather than once per outdated dependency
+        latest_active_by_product = {}
+        
+        def latest_active_cycle(product_name):
+            if product_name not in latest_active_by_product:
+                # Cycles are listed newest first
+                all_versions = self.api_client.get_product_versions(product_name)
+                latest_active_by_product[product_name] = next(
+                    (v for v in all_versions if _is_active(v.get("eol"), today)), None
+                )
+            return latest_active_by_product[product_name]
+        
+        # Define a function to check a single dependency. The parsed record is
+        # extended with the result in place rather than copied, so each
+        # dependency is held in memory once.
+        def check_dependency(dep):
+            try:
+                eol_info = self.api_client.get_eol_info(dep["name"], dep["version"])
+                
+                if not eol_info or "eol" not in eol_info:
+                    # No EOL info available
+                    dep.update({
+                        "status": "UNKNOWN",
+                        "eol_date": None,
+                        "days_remaining": None,
+                        "recommended_version": None,
+                    })
+                    return dep, "unknown"
+                else:
+                    eol_date = _parse_date(eol_info["eol"])
+                    days_remaining = (eol_date - today).days
                     
-                    if not eol_info or "eol" not in eol_info:
-                        # No EOL info available
-                        return {
-                            **dep,
-                            "status": "UNKNOWN",
-                            "eol_date": None,
-                            "days_remaining": None,
-                            "recommended_version": None,
-                        }, "unknown"
+                    if days_remaining < 0:
+                        status = "CRITICAL"
+                        summary_key = "critical"
+                    elif days_remaining < self.threshold_days:
+                        status = "WARNING"
+                        summary_key = "warning"
                     else:
-                        eol_date = datetime.strptime(eol_info["eol"], "%Y-%m-%d").date()
-                        days_remaining = (eol_date - today).days
-                        
-                        if days_remaining < 0:
-                            status = "CRITICAL"
-                            summary_key = "critical"
-                        elif days_remaining < self.threshold_days:
-                            status = "WARNING"
-                            summary_key = "warning"
-                        else:
-                            status = "OK"
-                            summary_key = "ok"
-                        
-                        # Determine recommended version
-                        recommended_version = None
-                        has_breaking_changes = False
-                        
-                        if status in ["CRITICAL", "WARNING"]:
-                            # For EOL or approaching EOL dependencies, find the latest non-EOL version
-                            product_name = self.api_client._get_product_name(dep["name"])
-                            if product_name:
-                                try:
-                                    all_versions = self.api_client.get_product_versions(product_name)
-                                    # Sort versions by release date (newest first)
-                                    active_versions = [v for v in all_versions if v.get("eol") is False or 
-                                                      (isinstance(v.get("eol"), str) and 
-                                                       datetime.strptime(v["eol"], "%Y-%m-%d").date() > today)]
+                        status = "OK"
+                        summary_key = "ok"
+                    
+                    # Determine recommended version
+                    recommended_version = None
+                    has_breaking_changes = False
+                    
+                    if status in ["CRITICAL", "WARNING"]:
+                        # For EOL or approaching EOL dependencies, find the latest non-EOL version
+                        product_name = self.api_client._get_product_name(dep["name"])
+                        if product_name:
+                            try:
+                                latest_active = latest_active_cycle(product_name)
+                                
+                                if latest_active is not None:
+                                    # Get the latest version that's not EOL
+                                    recommended_version = latest_active.get("latest")
                                     
-                                    if active_versions:
-                                        # Get the latest version that's not EOL
-                                        latest_active = active_versions[0]
-                                        recommended_version = latest_active.get("latest")
-                                        
-                                        # Check if this is a major version change
-                                        from eol_check.utils.version import has_major_version_change
-                                        if recommended_version and has_major_version_change(dep["version"], recommended_version):
-                                            has_breaking_changes = True
-                                    else:
-                                        # If all versions are EOL, recommend the latest version
-                                        recommended_version = eol_info.get("latest")
-                                except Exception as e:
-                                    if self.verbose:
-                                        print(f"Error getting recommended version for {dep['name']}: {e}")
-                        
-                        return {
-                            **dep,
-                            "status": status,
-                            "eol_date": eol_info["eol"],
-                            "days_remaining": days_remaining,
-                            "recommended_version": recommended_version,
-                            "has_breaking_changes": has_breaking_changes,
-                        }, summary_key
-                except Exception as e:
-                    if self.verbose:
-                        print(f"Error checking {dep['name']}: {e}")
-                    return {
-                        **dep,
-                        "status": "ERROR",
-                        "error": str(e),
-                    }, "unknown"
-            
-            # Show progress message
-            info(f"Checking {total_deps} dependencies...")
-            
-            # Show cache status if verbose
-            if self.verbose:
-                cache_dir = self.api_client.cache.cache_dir
-                cache_files = os.listdir(cache_dir) if os.path.exists(cache_dir) else []
-                cache_count = len([f for f in cache_files if f.endswith('.json')])
-                info(f"Using cache directory: {cache_dir}")
-                info(f"Found {cache_count} cached items")
-                info(f"Using {self.max_workers or 'default'} workers")
-                info("")  # Add an empty line before progress bar
-            
-            # Process dependencies in parallel
-            futures = []
-            for dep in all_dependencies:
-                future = pool.submit(check_dependency, dep)
-                futures.append(future)
+                                    # Check if this is a major version change
+                                    if recommended_version and has_major_version_change(dep["version"], recommended_version):
+                                        has_breaking_changes = True
+                                else:
+                                    # If all versions are EOL, recommend the latest version
+                                    recommended_version = eol_info.get("latest")
+                            except Exception as e:
+                                if self.verbose:
+                                    print(f"Error getting recommended version for {dep['name']}: {e}")
+                    
+                    dep.update({
+                        "status": status,
+                        "eol_date": eol_info["eol"],
+                        "days_remaining": days_remaining,
+                        "recommended_version": recommended_version,
+                        "has_breaking_changes": has_breaking_changes,
+                    })
+                    return dep, summary_key
+            except Exception as e:
+                if self.verbose:
+                    print(f"Error checking {dep['name']}: {e}")
+                dep.update({
+                    "status": "ERROR",
+                    "error": str(e),
+                })
+                return dep, "unknown"
+        
+        # Show progress message
+        info(f"Checking {total_deps} dependencies...")
+        
+        # Show cache status if verbose
+        if self.verbose:
+            cache_dir = self.api_client.cache.cache_dir
+            cache_files = os.listdir(cache_dir) if os.path.exists(cache_dir) else []
+            cache_count = len([f for f in cache_files if f.endswith('.json')])
+            info(f"Using cache directory: {cache_dir}")
+            info(f"Found {cache_count} cached items")
+            info(f"Using {self.max_workers or 'default'} workers")
+            info("")  # Add an empty line before progress bar
+        
+        # Fetch each product's release cycles once up front. Dependencies that
+        # share a product are then resolved from memory instead of each
+        # making their own request.
+        products = dict.fromkeys(
+            self.api_client._get_product_name(dep["name"]) for dep in all_dependencies
+        )
+        if self.verbose:
+            info(f"Fetching EOL data for {len(products)} products")
+        self.api_client.preload_cache(products)
+        product_index_future.result()
+        concurrent.futures.wait(
+            [pool.submit(self.api_client.prefetch_product, product) for product in products]
+        )
+        
+        # Process dependencies in parallel, collecting results and tracking
+        # progress as they arrive
+        dependencies = results["dependencies"]
+        summary = results["summary"]
+        last_update = 0.0
+        for i, (dep_result, summary_key) in enumerate(pool.imap(check_dependency, all_dependencies)):
+            dependencies.append(dep_result)
+            summary[summary_key] += 1
             
-            # Track progress as futures complete
-            dep_results = []
-            for i, future in enumerate(concurrent.futures.as_completed(futures)):
-                result = future.result()
-                dep_results.append(result)
-                
-                # Always update progress bar
+            # Redraw the progress bar at a limited rate, since cache hits can
+            # complete far faster than the terminal is worth updating. The
+            # final state is always drawn.
+            now = time.monotonic()
+            if i + 1 == total_deps or now - last_update >= self.PROGRESS_INTERVAL:
+                last_update = now
                 self._print_progress_bar(i + 1, total_deps, 
-                                       prefix='Checking dependencies:', 
-                                       suffix='Complete', length=40)
-            
-            # Update results
-            for dep_result, summary_key in dep_results:
-                results["dependencies"].append(dep_result)
-                results["summary"][summary_key] += 1
+                                         prefix='Checking dependencies:', 
+                                         suffix='Complete', length=40)
+        
+        # Write the cache entries collected during the check to disk in one batch
+        self.cache.sync()
         
         # Add execution time to results
         end_time = time.time()
@@ -2,49 +2,97 @@
 Parsers for different project types.
 """
 
+import importlib
 import os
 from typing import List, Optional
 
 from eol_check.parsers.base import BaseParser
-from eol_check.parsers.java import MavenParser, GradleParser
-from eol_check.parsers.nodejs import NpmParser, YarnParser
-from eol_check.parsers.python import PipParser, PoetryParser, PipenvParser
 
+# Module defining each parser class. Parser modules are only imported when a
+# project needs them, so checking a Python project doesn't load the Java and
+# Node.js parsers.
+_PARSER_MODULES = {
+    "MavenParser": "eol_check.parsers.java",
+    "GradleParser": "eol_check.parsers.java",
+    "NpmParser": "eol_check.parsers.nodejs",
+    "YarnParser": "eol_check.parsers.nodejs",
+    "PipParser": "eol_check.parsers.python",
+    "PoetryParser": "eol_check.parsers.python",
+    "PipenvParser": "eol_check.parsers.python",
+}
 
-def get_parsers_for_project(project_path: str) -> List[BaseParser]:
+
+def __getattr__(name: str):
+    """Import parser classes on first access.
+    
+    Args:
+        name: Attribute name
+        
+    Returns:
+        Parser class
+        
+    Raises:
+        AttributeError: If name is not a parser class
+    """
+    module_name = _PARSER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
+
+
+def get_parsers_for_project(
+    project_path: str, include_transitive: bool = True, force_update: bool = False
+) -> List[BaseParser]:
     """Get all appropriate parsers for a project.
     
     Args:
         project_path: Path to the project directory
+        include_transitive: Whether parsers should include transitive dependencies
+        force_update: Whether parsers should resolve dependency trees again
+            instead of reusing cached ones
         
     Returns:
         List of parser instances for the project
     """
     parsers = []
     
+    # List the project directory once instead of checking each file
+    try:
+        with os.scandir(project_path) as it:
+            entries = {entry.name for entry in it}
+    except OSError:
+        return parsers
+    
     # Check for Python projects
-    if os.path.exists(os.path.join(project_path, "requirements.txt")):
-        parsers.append(PipParser(project_path))
+    if "requirements.txt" in entries:
+        from eol_check.parsers.python import PipParser
+        parsers.append(PipParser(project_path, include_transitive, force_update))
     
-    if os.path.exists(os.path.join(project_path, "pyproject.toml")):
-        parsers.append(PoetryParser(project_path))
+    if "pyproject.toml" in entries:
+        from eol_check.parsers.python import PoetryParser
+        parsers.append(PoetryParser(project_path, include_transitive, force_update))
     
-    if os.path.exists(os.path.join(project_path, "Pipfile")):
-        parsers.append(PipenvParser(project_path))
+    if "Pipfile" in entries:
+        from eol_check.parsers.python import PipenvParser
+        parsers.append(PipenvParser(project_path, include_transitive, force_update))
     
     # Check for Node.js projects
-    if os.path.exists(os.path.join(project_path, "package.json")):
-        if os.path.exists(os.path.join(project_path, "yarn.lock")):
-            parsers.append(YarnParser(project_path))
+    if "package.json" in entries:
+        if "yarn.lock" in entries:
+            from eol_check.parsers.nodejs import YarnParser
+            parsers.append(YarnParser(project_path, include_transitive, force_update))
         else:
-            parsers.append(NpmParser(project_path))
+            from eol_check.parsers.nodejs import NpmParser
+            parsers.append(NpmParser(project_path, include_transitive, force_update))
     
     # Check for Java projects
-    if os.path.exists(os.path.join(project_path, "pom.xml")):
-        parsers.append(MavenParser(project_path))
+    if "pom.xml" in entries:
+        from eol_check.parsers.java import MavenParser
+        parsers.append(MavenParser(project_path, include_transitive, force_update))
     
-    if os.path.exists(os.path.join(project_path, "build.gradle")):
-        parsers.append(GradleParser(project_path))
+    if "build.gradle" in entries:
+        from eol_check.parsers.java import GradleParser
+        parsers.append(GradleParser(project_path, include_transitive, force_update))
     
     return parsers
 
@@ -2,27 +2,85 @@
 Base parser class for project dependencies.
 """
 
+import functools
 import os
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any
+from typing import List, Optional, TypedDict
+
+
+class Dependency(TypedDict, total=False):
+    """A dependency record produced by a parser.
+    
+    Records stay plain dicts so they can be extended with check results in
+    place and serialized by the reporters as they are.
+    """
+    
+    name: str
+    version: str
+    type: str
+    dev: bool
+    transitive: bool
+    group_id: Optional[str]
+    is_parent: bool
+
+
+def cached_dependencies(method):
+    """Cache the result of a parse_dependencies implementation on the parser.
+    
+    Package manager commands are slow, so parsing the same project twice with
+    one parser instance reuses the first result.
+    
+    Args:
+        method: parse_dependencies implementation
+        
+    Returns:
+        Wrapped method
+    """
+    @functools.wraps(method)
+    def wrapper(self):
+        if self._cached_deps is None:
+            self._cached_deps = method(self)
+        return self._cached_deps
+    
+    return wrapper
 
 
 class BaseParser(ABC):
     """Base class for project parsers."""
     
-    def __init__(self, project_path: str):
+    def __init__(self, project_path: str, include_transitive: bool = True, force_update: bool = False):
         """Initialize the parser.
         
         Args:
             project_path: Path to the project directory
+            include_transitive: Whether parsers that resolve the full
+                dependency tree should include transitive dependencies
+            force_update: Whether to resolve the dependency tree again
+                instead of reusing a cached one
         """
         self.project_path = project_path
+        self.include_transitive = include_transitive
+        self.force_update = force_update
+        
+        # Result of parse_dependencies (set on first call)
+        self._cached_deps: Optional[List[Dependency]] = None
     
     @abstractmethod
-    def parse_dependencies(self) -> List[Dict[str, Any]]:
+    def parse_dependencies(self) -> List[Dependency]:
         """Parse dependencies from the project.
         
         Returns:
             List of dictionaries with dependency information
         """
         pass
+    
+    def build_files(self) -> List[str]:
+        """List the build files read beyond the project's top-level manifests.
+        
+        Parsers of multi-module projects override this to add the build
+        files of submodules, so callers can tell when those change.
+        
+        Returns:
+            Paths of the files, not all of which need to exist
+        """
+        return []
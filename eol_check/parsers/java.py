@@ -2,18 +2,381 @@
 Parsers for Java projects.
 """
 
+import hashlib
+import itertools
+import multiprocessing
 import os
 import re
+import shutil
 import subprocess
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Any, Optional, Set
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Set, Tuple
 
-from eol_check.parsers.base import BaseParser
+from eol_check.parsers.base import BaseParser, cached_dependencies
+from eol_check.utils.cache import Cache, default_cache_dir
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+# Qualified names of the pom.xml elements read by MavenParser
+_POM_NS = "{http://maven.apache.org/POM/4.0.0}"
+_POM_NS_LEN = len(_POM_NS)
+_POM_PROPERTIES = _POM_NS + "properties"
+_POM_PARENT = _POM_NS + "parent"
+_POM_DEPENDENCIES = _POM_NS + "dependencies"
+_POM_DEPENDENCY = _POM_NS + "dependency"
+_POM_JAVA_VERSION = _POM_NS + "java.version"
+_POM_VERSION = _POM_NS + "version"
+_POM_MODULES = _POM_NS + "modules"
+_POM_MODULE = _POM_NS + "module"
+
+# Elements of which only the first occurrence in pom.xml is read
+_POM_FIRST_ONLY = (_POM_PROPERTIES, _POM_PARENT, _POM_DEPENDENCIES)
+
+# Property reference such as ${spring.version} in pom.xml values
+_PROPERTY_REF_RE = re.compile(r"\$\{([^}]+)\}")
+
+# Patterns used when parsing mvn and gradle dependency trees
+_MVN_LINE_RE = re.compile(r'[+\\]-\s+([^:]+):([^:]+):([^:]+):([^:]+)(?::([^:]+))?')
+_MVN_LOG_PREFIX = "[INFO] "
+_MVN_LOG_PREFIX_LEN = len(_MVN_LOG_PREFIX)
+_GRADLE_LINE_RE = re.compile(r'[+\\]---\s+([^:]+):([^:]+):([^(\s]+)')
+
+# Patterns used when parsing build.gradle
+_JAVA_VER_RE = re.compile(r"sourceCompatibility\s*=\s*['\"]([^'\"]+)['\"]")
+_DEP_BLOCK_START_RE = re.compile(r"\s*dependencies\s*\{")
+_GRADLE_INCLUDE_RE = re.compile(r"^\s*include\b(.*)$", re.MULTILINE)
+_GRADLE_PROJECT_PATH_RE = re.compile(r"['\"]:?([^'\"]+)['\"]")
+_DEP_DECL_RE = re.compile(r"(implementation|api|compile|runtime|testImplementation|testCompile)\s*['\"]([^'\"]+)['\"]")
+
+# How long a resolved dependency tree is reused while its build files are unchanged
+TREE_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days
+
+# Number of submodule POMs at one level of the module tree from which they
+# are parsed in a process pool. Workers are spawned rather than forked,
+# since parsers run on the request pool's threads and forking a threaded
+# process can deadlock; each spawned worker starts a fresh interpreter, so
+# the pool only pays off for large reactors.
+POM_PROCESS_POOL_MIN = 64
+
+# Files in a Gradle project's root that affect its dependency tree
+_GRADLE_ROOT_FILES = (
+    "build.gradle", "build.gradle.kts", "settings.gradle", "settings.gradle.kts",
+    "gradle.properties", "gradle.lockfile", os.path.join("gradle", "libs.versions.toml"),
+)
+
+# Files in a Gradle subproject's directory that affect its dependency tree
+_GRADLE_SUBPROJECT_FILES = ("build.gradle", "build.gradle.kts", "gradle.lockfile")
+
+# Subdirectory of the cache directory holding resolved dependency trees,
+# kept apart from the cached API responses listed in the UI
+TREE_CACHE_SUBDIR = "trees"
+
+
+def _resolve_properties(properties: Dict[str, Optional[str]]) -> Dict[str, str]:
+    """Resolve property references inside pom.xml property values.
+    
+    Values may reference other properties, any number of times and to any
+    depth. Unknown and circular references are left in place.
+    
+    Args:
+        properties: Property values as written in pom.xml
+        
+    Returns:
+        Fully resolved values of the non-empty properties
+    """
+    resolved: Dict[str, str] = {}
+    
+    def resolve(name: str, seen: Tuple[str, ...]) -> str:
+        if name in resolved:
+            return resolved[name]
+        
+        def substitute(match: "re.Match[str]") -> str:
+            ref = match.group(1)
+            if ref in seen or not properties.get(ref):
+                return match.group(0)
+            return resolve(ref, seen + (ref,))
+        
+        value = _PROPERTY_REF_RE.sub(substitute, properties[name])
+        # Values resolved inside a cycle depend on where it was entered
+        if len(seen) == 1:
+            resolved[name] = value
+        return value
+    
+    for name, value in properties.items():
+        if value:
+            resolve(name, (name,))
+    
+    return resolved
+
+
+def _filter_transitive(dependencies: List[Dict[str, Any]], include_transitive: bool) -> List[Dict[str, Any]]:
+    """Drop transitive dependencies from a resolved tree unless they are wanted.
+    
+    Args:
+        dependencies: Dependencies read from the whole tree
+        include_transitive: Whether to keep transitive dependencies
+        
+    Returns:
+        The dependencies, without transitive ones if include_transitive is False
+    """
+    if include_transitive:
+        return dependencies
+    return [dep for dep in dependencies if not dep["transitive"]]
+
+
+def _tree_cache() -> Cache:
+    """Open the cache of resolved dependency trees.
+    
+    Returns:
+        Cache in its own subdirectory of the default cache directory
+    """
+    return Cache(os.path.join(default_cache_dir(), TREE_CACHE_SUBDIR))
+
+
+def _build_files_digest(paths: List[str]) -> str:
+    """Hash the location and contents of a project's build files.
+    
+    Args:
+        paths: Build file paths; missing files are hashed as absent
+        
+    Returns:
+        Hex digest identifying this state of the build files
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        digest.update(os.path.abspath(path).encode("utf-8"))
+        try:
+            with open(path, "rb") as f:
+                digest.update(b"\1")
+                digest.update(f.read())
+        except OSError:
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _parse_pom(pom_path: str) -> Tuple[Optional[str], List[Dict[str, Any]], List[str]]:
+    """Parse the Java version, basic dependencies and modules from pom.xml.
+    
+    The file is streamed with iterparse and every element is cleared as
+    soon as it has been read, so memory use stays flat however large the
+    POM is. lxml's parser is used when it is installed, otherwise the
+    standard library's expat-based one. Like a descendant search, only
+    the first <properties>, <parent> and <dependencies> elements are read.
+    
+    Args:
+        pom_path: Path to pom.xml file
+        
+    Returns:
+        Tuple of (Java version or None, basic dependencies used as a
+        fallback when Maven is unavailable, entries of the top-level
+        <modules> element)
+    """
+    java_version = None
+    properties = {}
+    parent_coords = None
+    dep_coords = []
+    modules = []
+    
+    path = []  # Currently open elements, root first
+    open_depth = {}  # Depth of each tracked element while it is open
+    seen = set()  # Tracked elements already encountered
+    current = None  # Coordinates of the dependency being read
+    current_depth = -1
+    
+    if lxml_etree is not None:
+        # Don't expand external entities, matching the expat parser
+        events = lxml_etree.iterparse(
+            pom_path, events=("start", "end"), resolve_entities=False, no_network=True
+        )
+    else:
+        events = ET.iterparse(pom_path, events=("start", "end"))
+    
+    for event, elem in events:
+        tag = elem.tag
+        
+        if event == "start":
+            depth = len(path)
+            if tag in _POM_FIRST_ONLY and tag not in seen:
+                seen.add(tag)
+                open_depth[tag] = depth
+                if tag == _POM_PARENT:
+                    parent_coords = {}
+            elif tag == _POM_DEPENDENCY and open_depth.get(_POM_DEPENDENCIES) == depth - 1:
+                current = {}
+                current_depth = depth
+                dep_coords.append(current)
+            path.append(elem)
+            continue
+        
+        path.pop()
+        depth = len(path)
+        
+        if tag == _POM_JAVA_VERSION and java_version is None:
+            java_version = elem.text
+        elif tag == _POM_VERSION and depth == 1:
+            properties.setdefault("project.version", elem.text)
+        elif tag == _POM_MODULE and depth == 2 and path[-1].tag == _POM_MODULES and elem.text:
+            modules.append(elem.text.strip())
+        
+        if open_depth.get(tag) == depth:
+            del open_depth[tag]
+        elif current is not None and depth == current_depth:
+            current = None
+        elif current is not None and depth == current_depth + 1:
+            if tag.startswith(_POM_NS):
+                current[tag[_POM_NS_LEN:]] = elem.text
+        elif path:
+            parent_tag = path[-1].tag
+            if open_depth.get(parent_tag) == depth - 1:
+                if parent_tag == _POM_PROPERTIES:
+                    # Remove namespace
+                    name = tag[_POM_NS_LEN:] if tag.startswith(_POM_NS) else tag.rpartition("}")[2]
+                    properties[name] = elem.text
+                elif parent_tag == _POM_PARENT and tag.startswith(_POM_NS):
+                    parent_coords[tag[_POM_NS_LEN:]] = elem.text
+        
+        # Everything needed from this element has been read. Earlier
+        # siblings are finished too, so drop them all from the parent.
+        elem.clear()
+        if path:
+            del path[-1][:]
+    
+    # Resolve references between properties once for all dependencies
+    if parent_coords and parent_coords.get("version"):
+        properties.setdefault("project.parent.version", parent_coords["version"])
+    resolved = _resolve_properties(properties)
+    
+    def substitute(match: "re.Match[str]") -> str:
+        return resolved.get(match.group(1), match.group(0))
+    
+    dependencies = []
+    
+    # Extract parent POM information
+    if parent_coords is not None and all(key in parent_coords for key in ("groupId", "artifactId", "version")):
+        dependencies.append({
+            "name": parent_coords["artifactId"],
+            "version": parent_coords["version"],
+            "type": "java",
+            "group_id": parent_coords["groupId"],
+            "is_parent": True
+        })
+    
+    # Extract dependencies
+    for coords in dep_coords:
+        if "artifactId" in coords:
+            name = coords["artifactId"]
+            
+            # Get version, resolving property references if needed
+            version_str = "latest"
+            if "version" in coords:
+                version_str = coords["version"]
+                
+                # Handle property references like ${version.spring}
+                if version_str and "${" in version_str:
+                    version_str = _PROPERTY_REF_RE.sub(substitute, version_str)
+            
+            dependencies.append({
+                "name": name,
+                "version": version_str,
+                "type": "java",
+                "group_id": coords.get("groupId"),
+            })
+    
+    return java_version, dependencies, modules
+
+
+def _gradle_build_files(project_path: str) -> List[str]:
+    """List the files that determine a Gradle project's dependency tree.
+    
+    These are the root build and settings scripts, gradle.properties, the
+    version catalog and lockfile, and the build scripts of the subprojects
+    included in the settings script.
+    
+    Args:
+        project_path: Path to the project directory
+        
+    Returns:
+        Paths of the files, not all of which need to exist
+    """
+    paths = [os.path.join(project_path, name) for name in _GRADLE_ROOT_FILES]
+    
+    for settings_name in ("settings.gradle", "settings.gradle.kts"):
+        try:
+            with open(os.path.join(project_path, settings_name), "r", encoding="utf-8") as f:
+                settings = f.read()
+        except OSError:
+            continue
+        
+        for include in _GRADLE_INCLUDE_RE.finditer(settings):
+            for subproject in _GRADLE_PROJECT_PATH_RE.findall(include.group(1)):
+                subproject_dir = os.path.join(project_path, *subproject.split(":"))
+                paths.extend(os.path.join(subproject_dir, name) for name in _GRADLE_SUBPROJECT_FILES)
+    
+    return paths
+
+
+def _parse_module_pom(pom_path: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Parse the basic dependencies and modules of a submodule POM.
+    
+    Runs in a worker process when submodules are parsed in a pool.
+    
+    Args:
+        pom_path: Path to the submodule's pom.xml
+        
+    Returns:
+        Tuple of (basic dependencies, entries of its <modules> element),
+        both empty if the POM can't be parsed
+    """
+    try:
+        _, dependencies, modules = _parse_pom(pom_path)
+        return dependencies, modules
+    except Exception as e:
+        print(f"Error parsing {pom_path}: {e}")
+        return [], []
+
+
+def _maven_build_files(pom_path: str, module_poms: List[str]) -> List[str]:
+    """List the POMs that determine a Maven project's dependency tree.
+    
+    These are every POM in the reactor and a parent POM at its default
+    location beside the project, which Maven reads from there.
+    
+    Args:
+        pom_path: Path to the project's pom.xml
+        module_poms: Paths of the submodule POMs in the reactor
+        
+    Returns:
+        Paths of the POMs, not all of which need to exist
+    """
+    parent_pom = os.path.join(os.path.dirname(os.path.abspath(pom_path)), os.pardir, "pom.xml")
+    return [pom_path, *module_poms, parent_pom]
+
+
+def _module_pom_path(parent_pom: str, module: str) -> str:
+    """Resolve a <module> entry to the path of the submodule's POM.
+    
+    Args:
+        parent_pom: Path to the pom.xml that lists the module
+        module: Module path relative to the parent POM's directory, either
+            a directory or a POM file
+        
+    Returns:
+        Path to the submodule's pom.xml
+    """
+    path = os.path.join(os.path.dirname(parent_pom), module)
+    if os.path.isdir(path):
+        path = os.path.join(path, "pom.xml")
+    return path
 
 
 class MavenParser(BaseParser):
     """Parser for Maven pom.xml files."""
     
+    @cached_dependencies
     def parse_dependencies(self) -> List[Dict[str, Any]]:
         """Parse dependencies from pom.xml including transitive dependencies.
         
@@ -24,19 +387,8 @@ class MavenParser(BaseParser):
         dependencies = []
         
         try:
-            # Register namespaces
-            ET.register_namespace("", "http://maven.apache.org/POM/4.0.0")
-            ns = {"m": "http://maven.apache.org/POM/4.0.0"}
-            
             # Parse XML
-            tree = ET.parse(pom_path)
-            root = tree.getroot()
-            
-            # Extract Java version
-            java_version = None
-            java_elem = root.find(".//m:java.version", ns)
-            if java_elem is not None:
-                java_version = java_elem.text
+            java_version, basic_deps, modules = _parse_pom(pom_path)
             
             if java_version:
                 dependencies.append({
@@ -45,146 +397,230 @@ class MavenParser(BaseParser):
                     "type": "java",
                 })
             
+            # Submodules are read up front: Maven resolves all of them, so their
+            # POMs identify the cached tree as well as the project's own
+            module_poms = self._parse_module_poms(pom_path, modules)
+            
             # Try to get complete dependency tree using Maven
-            maven_deps = self._get_maven_dependency_tree(pom_path)
+            maven_deps = self._get_maven_dependency_tree(pom_path, [path for path, _ in module_poms])
             if maven_deps:
                 dependencies.extend(maven_deps)
             else:
-                # Fallback to basic parsing if Maven command fails
-                basic_deps = self._parse_basic_dependencies(root, ns)
-                dependencies.extend(basic_deps)
+                # Fallback to basic parsing if Maven command fails, covering
+                # submodules too, which Maven would have included in the tree
+                seen = set()  # (group, artifact, version) already added
+                module_deps = (dep for _, deps in module_poms for dep in deps)
+                for dep in itertools.chain(basic_deps, module_deps):
+                    dep_key = (dep.get("group_id"), dep["name"], dep["version"])
+                    if dep_key not in seen:
+                        seen.add(dep_key)
+                        dependencies.append(dep)
         
         except Exception as e:
             print(f"Error parsing pom.xml: {e}")
         
         return dependencies
     
-    def _get_maven_dependency_tree(self, pom_path: str) -> List[Dict[str, Any]]:
+    def build_files(self) -> List[str]:
+        """List the POMs of the reactor and a parent POM beside the project.
+        
+        Returns:
+            Paths of the POMs, not all of which need to exist
+        """
+        pom_path = os.path.join(self.project_path, "pom.xml")
+        try:
+            _, _, modules = _parse_pom(pom_path)
+        except Exception:
+            return [pom_path]
+        module_poms = [path for path, _ in self._parse_module_poms(pom_path, modules)]
+        return _maven_build_files(pom_path, module_poms)
+    
+    def _parse_module_poms(self, pom_path: str, modules: List[str]) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        """Parse the basic dependencies of all submodule POMs.
+        
+        Submodules are the entries of the project's <modules> element,
+        followed recursively through each submodule's own <modules>, so
+        unrelated pom.xml files such as test fixtures are never read. The
+        module tree is parsed one level at a time, and levels with many
+        POMs are parsed in a pool of spawned processes.
+        
+        Args:
+            pom_path: Path to the project's pom.xml
+            modules: Entries of the project's <modules> element
+            
+        Returns:
+            Tuples of (submodule POM path, its basic dependencies), level by
+            level in submodule order
+        """
+        module_poms = []
+        seen = {os.path.realpath(pom_path)}  # POMs already parsed
+        level = [_module_pom_path(pom_path, module) for module in modules]
+        executor = None
+        use_pool = True  # Cleared if the pool fails
+        
+        try:
+            while level:
+                # Skip POMs already parsed, including repeats within the level
+                batch = []
+                for module_pom in level:
+                    real_path = os.path.realpath(module_pom)
+                    if real_path not in seen:
+                        seen.add(real_path)
+                        batch.append(module_pom)
+                
+                results = None
+                max_workers = os.cpu_count() or 1
+                if use_pool and max_workers > 1 and len(batch) >= POM_PROCESS_POOL_MIN:
+                    try:
+                        if executor is None:
+                            executor = ProcessPoolExecutor(
+                                max_workers=max_workers,
+                                mp_context=multiprocessing.get_context("spawn"),
+                            )
+                        chunksize = max(1, len(batch) // (max_workers * 4))
+                        results = list(executor.map(_parse_module_pom, batch, chunksize=chunksize))
+                    except Exception as e:
+                        print(f"Error parsing submodule POMs in parallel: {e}")
+                        use_pool = False
+                
+                if results is None:
+                    results = [_parse_module_pom(module_pom) for module_pom in batch]
+                
+                level = []
+                for module_pom, (module_deps, submodules) in zip(batch, results):
+                    module_poms.append((module_pom, module_deps))
+                    level.extend(_module_pom_path(module_pom, module) for module in submodules)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        
+        return module_poms
+    
+    def _get_maven_dependency_tree(self, pom_path: str, module_poms: List[str]) -> List[Dict[str, Any]]:
         """Get complete dependency tree using Maven command.
         
         Args:
             pom_path: Path to pom.xml file
+            module_poms: Paths of the submodule POMs in the reactor
             
         Returns:
             List of dependencies or empty list if command fails
         """
-        dependencies = []
-        processed_deps = set()  # To avoid duplicates
+        # Reuse the tree resolved for identical POMs instead of running Maven
+        cache = _tree_cache()
+        cache_key = f"java_tree_mvn_{_build_files_digest(_maven_build_files(pom_path, module_poms))}"
+        if not self.include_transitive:
+            cache_key += "_direct"
+        cached = None if self.force_update else cache.get(cache_key)
+        if cached is not None:
+            return [dict(dep) for dep in cached]
         
         try:
-            # Run mvn dependency:tree command
-            cmd = ["mvn", "dependency:tree", "-DoutputType=text", "-f", pom_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            # Prefer the Maven daemon, which keeps a warm JVM between runs. Batch
+            # mode without transfer progress keeps the output down to the tree.
+            tool = shutil.which("mvnd") or "mvn"
+            args = [
+                "-B", "--no-transfer-progress", "dependency:tree",
+                "-DoutputType=text", "-Dverbose=false", "-f", pom_path,
+            ]
             
-            # Parse the dependency tree output
-            for line in result.stdout.splitlines():
-                # Skip non-dependency lines
-                if not re.search(r'[+-\\|]', line):
-                    continue
-                    
-                # Extract dependency information
-                match = re.search(r'[+-\\|]\s+([^:]+):([^:]+):([^:]+):([^:]+)(?::([^:]+))?', line)
-                if match:
-                    groups = match.groups()
-                    group_id = groups[0]
-                    artifact_id = groups[1]
-                    packaging = groups[2]
-                    version = groups[3]
-                    
-                    # Create a unique key to avoid duplicates
-                    dep_key = f"{group_id}:{artifact_id}:{version}"
-                    if dep_key in processed_deps:
-                        continue
-                    
-                    processed_deps.add(dep_key)
-                    
-                    # Determine if it's a direct or transitive dependency
-                    is_direct = line.strip().startswith("+") or line.strip().startswith("\\")
-                    
-                    dependencies.append({
-                        "name": artifact_id,
-                        "version": version,
-                        "type": "java",
-                        "group_id": group_id,
-                        "transitive": not is_direct
-                    })
+            # Resolve from the local repository first and only go online if
+            # something is missing from it
+            try:
+                dependencies = self._run_maven_dependency_tree([tool, "-o"] + args)
+            except subprocess.CalledProcessError:
+                dependencies = self._run_maven_dependency_tree([tool] + args)
+            
+            if dependencies:
+                cache.set(cache_key, dependencies, ttl=TREE_CACHE_TTL)
+                cache.flush()
             
             return dependencies
         except Exception as e:
             print(f"Error getting Maven dependency tree: {e}")
             return []
     
-    def _parse_basic_dependencies(self, root, ns) -> List[Dict[str, Any]]:
-        """Parse basic dependencies from pom.xml as fallback.
+    def _run_maven_dependency_tree(self, cmd: List[str]) -> List[Dict[str, Any]]:
+        """Run a Maven dependency:tree command and parse its output.
         
         Args:
-            root: XML root element
-            ns: XML namespaces
+            cmd: Maven command line
             
         Returns:
             List of dependencies
+            
+        Raises:
+            subprocess.CalledProcessError: If the command fails
         """
         dependencies = []
+        processed_deps = {}  # Record added for each (group, artifact, version)
         
-        # Extract properties for variable substitution
-        properties = {}
-        props_elem = root.find(".//m:properties", ns)
-        if props_elem is not None:
-            for prop in props_elem:
-                tag = prop.tag.split("}")[-1]  # Remove namespace
-                properties[tag] = prop.text
-        
-        # Extract parent POM information
-        parent_elem = root.find(".//m:parent", ns)
-        if parent_elem is not None:
-            parent_group_id = parent_elem.find("m:groupId", ns)
-            parent_artifact_id = parent_elem.find("m:artifactId", ns)
-            parent_version = parent_elem.find("m:version", ns)
-            
-            if parent_group_id is not None and parent_artifact_id is not None and parent_version is not None:
-                dependencies.append({
-                    "name": parent_artifact_id.text,
-                    "version": parent_version.text,
-                    "type": "java",
-                    "group_id": parent_group_id.text,
-                    "is_parent": True
-                })
-        
-        # Extract dependencies
-        deps_elem = root.find(".//m:dependencies", ns)
-        if deps_elem is not None:
-            for dep in deps_elem.findall("m:dependency", ns):
-                group_id = dep.find("m:groupId", ns)
-                artifact_id = dep.find("m:artifactId", ns)
-                version = dep.find("m:version", ns)
+        # Parse the dependency tree output line by line as Maven writes it,
+        # rather than buffering all of it
+        with subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+        ) as proc:
+            for line in proc.stdout:
+                line = line.rstrip("\n")
                 
-                if artifact_id is not None:
-                    name = artifact_id.text
+                # Dependency lines have at least four colon-separated fields,
+                # which rules out most other output without running the regex
+                if line.count(":") < 3:
+                    continue
+                
+                # Extract dependency information, skipping non-dependency lines
+                match = _MVN_LINE_RE.search(line)
+                if match:
+                    groups = match.groups()
+                    group_id = groups[0]
+                    artifact_id = groups[1]
+                    packaging = groups[2]
+                    version = groups[3]
                     
-                    # Get version, resolving property references if needed
-                    version_str = "latest"
-                    if version is not None:
-                        version_str = version.text
-                        
-                        # Handle property references like ${version.spring}
-                        if version_str.startswith("${") and version_str.endswith("}"):
-                            prop_name = version_str[2:-1]
-                            if prop_name in properties:
-                                version_str = properties[prop_name]
+                    # Determine if it's a direct or transitive dependency: direct
+                    # dependencies have their branch marker in the first column
+                    # of the tree, right after Maven's "[INFO] " prefix
+                    tree_start = _MVN_LOG_PREFIX_LEN if line.startswith(_MVN_LOG_PREFIX) else 0
+                    is_direct = line[tree_start:tree_start + 1] in ("+", "\\")
                     
-                    dependencies.append({
-                        "name": name,
-                        "version": version_str,
+                    # Use a unique key to avoid duplicates, keeping a dependency
+                    # direct if any of its occurrences is
+                    dep_key = (group_id, artifact_id, version)
+                    existing = processed_deps.get(dep_key)
+                    if existing is not None:
+                        if is_direct:
+                            existing["transitive"] = False
+                        continue
+                    
+                    processed_deps[dep_key] = dep = {
+                        "name": artifact_id,
+                        "version": version,
                         "type": "java",
-                        "group_id": group_id.text if group_id is not None else None,
-                    })
+                        "group_id": group_id,
+                        "transitive": not is_direct
+                    }
+                    dependencies.append(dep)
         
-        return dependencies
+        # Only trust the output of a successful run
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+        
+        # Only now is it known which dependencies are direct somewhere in the tree
+        return _filter_transitive(dependencies, self.include_transitive)
 
 
 class GradleParser(BaseParser):
     """Parser for Gradle build.gradle files."""
     
+    def build_files(self) -> List[str]:
+        """List the Gradle build files, including those of subprojects.
+        
+        Returns:
+            Paths of the files, not all of which need to exist
+        """
+        return _gradle_build_files(self.project_path)
+    
+    @cached_dependencies
     def parse_dependencies(self) -> List[Dict[str, Any]]:
         """Parse dependencies from build.gradle including transitive dependencies.
         
@@ -199,7 +635,7 @@ class GradleParser(BaseParser):
                 gradle_content = f.read()
             
             # Extract Java version
-            java_version_match = re.search(r"sourceCompatibility\s*=\s*['\"]([^'\"]+)['\"]", gradle_content)
+            java_version_match = _JAVA_VER_RE.search(gradle_content)
             if java_version_match:
                 java_version = java_version_match.group(1)
                 dependencies.append({
@@ -228,46 +664,80 @@ class GradleParser(BaseParser):
         Returns:
             List of dependencies or empty list if command fails
         """
+        # Reuse the tree resolved for identical build files instead of running Gradle
+        cache = _tree_cache()
+        cache_key = "java_tree_gradle_" + _build_files_digest(_gradle_build_files(self.project_path))
+        if not self.include_transitive:
+            cache_key += "_direct"
+        cached = None if self.force_update else cache.get(cache_key)
+        if cached is not None:
+            return [dict(dep) for dep in cached]
+        
         dependencies = []
-        processed_deps = set()  # To avoid duplicates
+        processed_deps = {}  # Record added for each (group, artifact, version)
         
         try:
-            # Run gradle dependencies command
-            cmd = ["gradle", "dependencies", "--configuration", "runtimeClasspath"]
-            result = subprocess.run(cmd, cwd=self.project_path, capture_output=True, text=True, check=True)
+            # Prefer the project's Gradle wrapper, run through the daemon with
+            # plain, quiet console output so only the report is printed
+            wrapper = os.path.join(self.project_path, "gradlew.bat" if os.name == "nt" else "gradlew")
+            tool = wrapper if os.access(wrapper, os.X_OK) else "gradle"
+            cmd = [
+                tool, "--daemon", "--console=plain", "--quiet",
+                "dependencies", "--configuration", "runtimeClasspath",
+            ]
             
-            # Parse the dependency tree output
-            for line in result.stdout.splitlines():
-                # Skip non-dependency lines
-                if not re.search(r'[+\\]---', line):
-                    continue
+            # Parse the dependency tree output line by line as Gradle writes it,
+            # rather than buffering all of it
+            with subprocess.Popen(
+                cmd, cwd=self.project_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            ) as proc:
+                for line in proc.stdout:
+                    line = line.rstrip("\n")
                     
-                # Extract dependency information
-                match = re.search(r'[+\\]---\s+([^:]+):([^:]+):([^(\s]+)', line)
-                if match:
-                    group_id, artifact_id, version = match.groups()
-                    
-                    # Clean up version (remove any trailing characters)
-                    version = version.strip()
-                    
-                    # Create a unique key to avoid duplicates
-                    dep_key = f"{group_id}:{artifact_id}:{version}"
-                    if dep_key in processed_deps:
+                    # Dependency lines always contain a "+---" or "\---" marker
+                    if "---" not in line:
                         continue
                     
-                    processed_deps.add(dep_key)
-                    
-                    # Determine if it's a direct or transitive dependency
-                    indent_level = len(line) - len(line.lstrip())
-                    is_direct = indent_level <= 4  # Direct dependencies are at the top level
-                    
-                    dependencies.append({
-                        "name": artifact_id,
-                        "version": version,
-                        "type": "java",
-                        "group_id": group_id,
-                        "transitive": not is_direct
-                    })
+                    # Extract dependency information, skipping non-dependency lines
+                    match = _GRADLE_LINE_RE.search(line)
+                    if match:
+                        group_id, artifact_id, version = match.groups()
+                        
+                        # Clean up version (remove any trailing characters)
+                        version = version.strip()
+                        
+                        # Determine if it's a direct or transitive dependency from
+                        # where the branch marker starts; each tree level adds 5 columns
+                        is_direct = match.start() <= 4  # Direct dependencies are at the top level
+                        
+                        # Use a unique key to avoid duplicates, keeping a dependency
+                        # direct if any of its occurrences is
+                        dep_key = (group_id, artifact_id, version)
+                        existing = processed_deps.get(dep_key)
+                        if existing is not None:
+                            if is_direct:
+                                existing["transitive"] = False
+                            continue
+                        
+                        processed_deps[dep_key] = dep = {
+                            "name": artifact_id,
+                            "version": version,
+                            "type": "java",
+                            "group_id": group_id,
+                            "transitive": not is_direct
+                        }
+                        dependencies.append(dep)
+            
+            # Only trust the output of a successful run
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, cmd)
+            
+            # Only now is it known which dependencies are direct somewhere in the tree
+            dependencies = _filter_transitive(dependencies, self.include_transitive)
+            
+            if dependencies:
+                cache.set(cache_key, dependencies, ttl=TREE_CACHE_TTL)
+                cache.flush()
             
             return dependencies
         except Exception as e:
@@ -285,15 +755,20 @@ class GradleParser(BaseParser):
         """
         dependencies = []
         
-        # Extract dependencies
-        dep_block_match = re.search(r"dependencies\s*\{([^}]+)\}", gradle_content, re.DOTALL)
-        if dep_block_match:
-            dep_block = dep_block_match.group(1)
+        # Walk the file line by line, tracking brace depth so nested closures
+        # inside a dependencies block don't end it early. Every dependencies
+        # block is read, not just the first one.
+        depth = 0  # Brace depth inside the current dependencies block
+        for line in gradle_content.splitlines():
+            if depth == 0:
+                block_match = _DEP_BLOCK_START_RE.match(line)
+                if not block_match:
+                    continue
+                line = line[block_match.end():]
+                depth = 1
             
             # Find all dependency declarations
-            dep_matches = re.finditer(r"(implementation|api|compile|runtime|testImplementation|testCompile)\s*['\"]([^'\"]+)['\"]", dep_block)
-            
-            for match in dep_matches:
+            for match in _DEP_DECL_RE.finditer(line):
                 dep_type = match.group(1)
                 dep_str = match.group(2)
                 
@@ -311,5 +786,7 @@ class GradleParser(BaseParser):
                         "group_id": group_id,
                         "dev": dep_type.startswith("test"),
                     })
+            
+            depth = max(depth + line.count("{") - line.count("}"), 0)
         
         return dependencies
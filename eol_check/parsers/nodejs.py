@@ -2,44 +2,100 @@
 Parsers for Node.js projects.
 """
 
+import functools
 import json
 import os
 import re
 import subprocess
-from typing import Dict, List, Any, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Set, Tuple
 
-from eol_check.parsers.base import BaseParser
+from eol_check.parsers.base import BaseParser, Dependency, cached_dependencies
+from eol_check.utils import json_utils
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Patterns used when parsing yarn.lock and yarn list output
+_YARN_PKG_RE = re.compile(r'"?(@?[^@\n"]+)@')
+_YARN_VERSION_RE = re.compile(r'version:?\s+"?([^"\s]+)"?')
+_YARN_DEP_RE = re.compile(r"([^@]+)@([^@\s]+)")
+_YARN_CHILD_RE = re.compile(r"└─\s+([^@]+@[^@\s]+)")
+
+# Translation table that drops semver range prefixes from version strings
+_VERSION_STRIP = str.maketrans("", "", "^~")
+
+
+def _clean_version(version: str) -> str:
+    """Strip semver range prefixes from a package.json version.
+    
+    Args:
+        version: Version or range from package.json, e.g. "^1.2.3"
+        
+    Returns:
+        Cleaned version string
+    """
+    if version.startswith(">="):
+        version = version[2:]
+    return version.translate(_VERSION_STRIP).strip()
+
+
+@functools.lru_cache(maxsize=8192)
+def _split_npm_name(full_name: str) -> Tuple[str, str]:
+    """Split an npm package spec into name and version.
+    
+    Scoped names keep their leading "@", e.g. "@babel/core@7.22.0" gives
+    ("@babel/core", "7.22.0") and "@babel/core" gives ("@babel/core", "").
+    
+    Args:
+        full_name: Package name, optionally followed by "@version"
+        
+    Returns:
+        Tuple of (name, version)
+    """
+    name, sep, version = full_name.rpartition("@")
+    if not name:
+        return full_name, ""
+    return name, version
 
 
 class NpmParser(BaseParser):
     """Parser for npm package.json files."""
     
-    def parse_dependencies(self) -> List[Dict[str, Any]]:
+    @cached_dependencies
+    def parse_dependencies(self) -> List[Dependency]:
         """Parse dependencies from package.json and npm list.
         
         Returns:
             List of dictionaries with dependency information
         """
         package_json_path = os.path.join(self.project_path, "package.json")
-        dependencies = []
         
-        # First parse direct dependencies from package.json
-        direct_deps = self._parse_package_json(package_json_path)
-        dependencies.extend(direct_deps)
+        # Dependencies keyed by name, keeping the first occurrence
+        by_name = {}
         
-        # Then try to get complete dependency tree using npm
-        transitive_deps = self._get_npm_dependency_tree()
-        if transitive_deps:
-            # Add only new dependencies that aren't already in the list
-            existing_names = {dep["name"] for dep in dependencies}
-            for dep in transitive_deps:
-                if dep["name"] not in existing_names:
-                    dependencies.append(dep)
-                    existing_names.add(dep["name"])
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Start npm list right away, it is by far the slowest step
+            npm_future = executor.submit(self._get_npm_dependency_tree)
+            
+            # Parse direct dependencies from package.json meanwhile
+            for dep in self._parse_package_json(package_json_path):
+                by_name.setdefault(dep["name"], dep)
+            
+            npm_deps = npm_future.result()
         
-        return dependencies
+        # Then merge in the complete dependency tree from npm
+        for dep in npm_deps:
+            existing = by_name.setdefault(dep["name"], dep)
+            if existing is not dep and "transitive" not in existing and not dep["transitive"]:
+                # Prefer the installed version over the package.json range
+                existing["version"] = dep["version"]
+        
+        return list(by_name.values())
     
-    def _parse_package_json(self, package_json_path: str) -> List[Dict[str, Any]]:
+    def _parse_package_json(self, package_json_path: str) -> List[Dependency]:
         """Parse a package.json file.
         
         Args:
@@ -51,44 +107,32 @@ class NpmParser(BaseParser):
         dependencies = []
         
         try:
-            with open(package_json_path, "r", encoding="utf-8") as f:
-                package_data = json.load(f)
+            with open(package_json_path, "rb") as f:
+                package_data = json_utils.loads(f.read())
             
-            # Parse regular dependencies
+            # Parse regular and dev dependencies in one pass. A package listed
+            # in both is only reported once, as a regular dependency.
             deps = package_data.get("dependencies", {})
-            for name, version in deps.items():
-                # Clean up version string
-                version = version.replace("^", "").replace("~", "")
-                
-                dependencies.append({
-                    "name": name,
-                    "version": version,
-                    "type": "nodejs",
-                })
-            
-            # Parse dev dependencies
             dev_deps = package_data.get("devDependencies", {})
-            for name, version in dev_deps.items():
-                # Clean up version string
-                version = version.replace("^", "").replace("~", "")
-                
-                dependencies.append({
+            for name in {**deps, **dev_deps}:
+                is_dev = name not in deps
+                dep = {
                     "name": name,
-                    "version": version,
+                    "version": _clean_version(dev_deps[name] if is_dev else deps[name]),
                     "type": "nodejs",
-                    "dev": True,
-                })
+                }
+                if is_dev:
+                    dep["dev"] = True
+                
+                dependencies.append(dep)
             
             # Check for Node.js version
             engines = package_data.get("engines", {})
             node_version = engines.get("node")
             if node_version:
-                # Clean up version string
-                node_version = node_version.replace(">=", "").replace("^", "").replace("~", "")
-                
                 dependencies.append({
                     "name": "node",
-                    "version": node_version,
+                    "version": _clean_version(node_version),
                     "type": "nodejs",
                 })
         
@@ -97,7 +141,7 @@ class NpmParser(BaseParser):
         
         return dependencies
     
-    def _get_npm_dependency_tree(self) -> List[Dict[str, Any]]:
+    def _get_npm_dependency_tree(self) -> List[Dependency]:
         """Get complete dependency tree using npm.
         
         Returns:
@@ -109,14 +153,20 @@ class NpmParser(BaseParser):
         try:
             # Run npm list command in JSON format
             cmd = ["npm", "list", "--json", "--all"]
+            
+            # Stream the output when ijson is available so the whole tree is
+            # never held in memory at once
+            if ijson is not None:
+                return self._stream_npm_dependency_tree(cmd)
+            
             # Don't use check=True here to handle non-zero exit codes gracefully
-            result = subprocess.run(cmd, cwd=self.project_path, capture_output=True, text=True)
+            result = subprocess.run(cmd, cwd=self.project_path, capture_output=True)
             
             # Check if the command was successful enough to produce valid JSON
             if result.stdout and result.stdout.strip():
                 try:
                     # Parse the JSON output
-                    npm_list = json.loads(result.stdout)
+                    npm_list = json_utils.loads(result.stdout)
                     
                     # Process the dependency tree
                     self._process_npm_dependencies(npm_list, dependencies, processed_deps)
@@ -132,73 +182,115 @@ class NpmParser(BaseParser):
             print(f"Error getting npm dependency tree: {e}")
             return []
     
-    def _process_npm_dependencies(self, package_data: Dict, dependencies: List, processed_deps: Set, parent: str = None):
-        """Process dependencies from npm list output recursively.
+    def _stream_npm_dependency_tree(self, cmd: List[str]) -> List[Dependency]:
+        """Get the dependency tree by incrementally parsing npm list output.
+        
+        Each top-level dependency subtree is parsed and processed on its own
+        as npm writes it, instead of buffering and parsing the full output.
+        
+        Args:
+            cmd: npm list command to run
+            
+        Returns:
+            List of dependencies
+        """
+        dependencies = []
+        processed_deps = set()  # To avoid duplicates
+        
+        # Don't check the exit code here to handle non-zero exit codes gracefully
+        with subprocess.Popen(
+            cmd, cwd=self.project_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        ) as proc:
+            try:
+                for dep_name, dep_data in ijson.kvitems(proc.stdout, "dependencies"):
+                    self._process_npm_dependencies(
+                        {"dependencies": {dep_name: dep_data}}, dependencies, processed_deps
+                    )
+            except ijson.JSONError as json_err:
+                print(f"Error parsing npm list output: {json_err}")
+                return []
+        
+        return dependencies
+    
+    def _process_npm_dependencies(self, package_data: Dict, dependencies: List, processed_deps: Set):
+        """Process dependencies from npm list output.
+        
+        The tree is walked with an explicit stack rather than recursion, so
+        deeply nested trees don't run into the interpreter's recursion limit.
         
         Args:
-            package_data: Package data from npm list
+            package_data: Root package data from npm list
             dependencies: List to add dependencies to
-            processed_deps: Set of already processed dependencies
-            parent: Name of the parent package
+            processed_deps: Set of already processed (name, version) pairs
         """
-        # Skip the root package
-        if parent is not None:
-            name = package_data.get("name", "").split("@")[0]
-            version = package_data.get("version")
+        # Stack entries are (name, data, is_direct); children are pushed in
+        # reverse so they are visited in the same order as npm lists them
+        stack = [
+            (dep_name, dep_data, True)
+            for dep_name, dep_data in reversed(package_data.get("dependencies", {}).items())
+        ]
+        
+        while stack:
+            dep_name, dep_data, is_direct = stack.pop()
+            
+            name = _split_npm_name(dep_data.get("name", dep_name))[0]
+            version = dep_data.get("version")
             
             if name and version:
-                # Create a unique key to avoid duplicates
-                dep_key = f"{name}:{version}"
+                # Use a unique key to avoid duplicates
+                dep_key = (name, version)
                 if dep_key not in processed_deps:
                     processed_deps.add(dep_key)
                     
-                    # Determine if it's a direct dependency
-                    is_direct = parent is None or parent == package_data.get("name")
-                    
                     dependencies.append({
                         "name": name,
                         "version": version,
                         "type": "nodejs",
                         "transitive": not is_direct
                     })
-        
-        # Process dependencies recursively
-        deps = package_data.get("dependencies", {})
-        for dep_name, dep_data in deps.items():
-            self._process_npm_dependencies(dep_data, dependencies, processed_deps, 
-                                          parent=package_data.get("name"))
+            
+            children = dep_data.get("dependencies")
+            if children:
+                stack.extend(
+                    (child_name, child_data, False)
+                    for child_name, child_data in reversed(children.items())
+                )
 
 
 class YarnParser(BaseParser):
     """Parser for Yarn projects."""
     
-    def parse_dependencies(self) -> List[Dict[str, Any]]:
+    @cached_dependencies
+    def parse_dependencies(self) -> List[Dependency]:
         """Parse dependencies from package.json, yarn.lock and yarn list.
         
         Returns:
             List of dictionaries with dependency information
         """
-        # First get dependencies from package.json
-        npm_parser = NpmParser(self.project_path)
-        direct_deps = npm_parser._parse_package_json(os.path.join(self.project_path, "package.json"))
-        dependencies = direct_deps
+        # Dependencies keyed by name, keeping the first occurrence
+        by_name = {}
         
-        # Then try to get more precise versions from yarn.lock
-        self._update_from_yarn_lock(dependencies)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Start yarn list right away, it is by far the slowest step
+            yarn_future = executor.submit(self._get_yarn_dependency_tree)
+            
+            # First get dependencies from package.json
+            npm_parser = NpmParser(self.project_path)
+            for dep in npm_parser._parse_package_json(os.path.join(self.project_path, "package.json")):
+                by_name.setdefault(dep["name"], dep)
+            
+            # Then try to get more precise versions from yarn.lock
+            self._update_from_yarn_lock(list(by_name.values()))
+            
+            yarn_deps = yarn_future.result()
         
-        # Then try to get complete dependency tree using yarn
-        transitive_deps = self._get_yarn_dependency_tree()
-        if transitive_deps:
-            # Add only new dependencies that aren't already in the list
-            existing_names = {dep["name"] for dep in dependencies}
-            for dep in transitive_deps:
-                if dep["name"] not in existing_names:
-                    dependencies.append(dep)
-                    existing_names.add(dep["name"])
+        # Then merge in the complete dependency tree from yarn
+        for dep in yarn_deps:
+            by_name.setdefault(dep["name"], dep)
         
-        return dependencies
+        return list(by_name.values())
     
-    def _update_from_yarn_lock(self, dependencies: List[Dict[str, Any]]):
+    def _update_from_yarn_lock(self, dependencies: List[Dependency]):
         """Update dependency versions from yarn.lock.
         
         Args:
@@ -207,26 +299,29 @@ class YarnParser(BaseParser):
         yarn_lock_path = os.path.join(self.project_path, "yarn.lock")
         
         try:
-            with open(yarn_lock_path, "r", encoding="utf-8") as f:
-                yarn_lock_content = f.read()
-            
             # Create a map of package names to versions
             version_map = {}
             
-            # Parse yarn.lock
-            package_blocks = re.split(r"\n\n", yarn_lock_content)
-            for block in package_blocks:
-                if not block.strip():
-                    continue
-                
-                # Extract package name and version
-                match = re.match(r'"?([^@\n]+)@[^"]*"?:', block)
-                if match:
-                    package_name = match.group(1)
-                    version_match = re.search(r"version\s+\"([^\"]+)\"", block)
-                    if version_match:
-                        version = version_match.group(1)
-                        version_map[package_name] = version
+            # Parse yarn.lock line by line: an unindented "name@range:" header
+            # opens an entry and its indented "version" line closes it
+            current_package = None
+            with open(yarn_lock_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line[:1].isspace():
+                        current_package = None
+                        if line.startswith("#") or not line.rstrip().endswith(":"):
+                            continue
+                        
+                        # Extract package name
+                        match = _YARN_PKG_RE.match(line)
+                        if match:
+                            current_package = match.group(1)
+                    
+                    elif current_package:
+                        version_match = _YARN_VERSION_RE.match(line.lstrip())
+                        if version_match:
+                            version_map[current_package] = version_match.group(1)
+                            current_package = None
             
             # Update dependencies with more precise versions
             for dep in dependencies:
@@ -236,7 +331,7 @@ class YarnParser(BaseParser):
         except Exception as e:
             print(f"Error parsing yarn.lock: {e}")
     
-    def _get_yarn_dependency_tree(self) -> List[Dict[str, Any]]:
+    def _get_yarn_dependency_tree(self) -> List[Dependency]:
         """Get complete dependency tree using yarn.
         
         Returns:
@@ -249,13 +344,13 @@ class YarnParser(BaseParser):
             # Run yarn list command in JSON format
             cmd = ["yarn", "list", "--json", "--no-progress"]
             # Don't use check=True here to handle non-zero exit codes gracefully
-            result = subprocess.run(cmd, cwd=self.project_path, capture_output=True, text=True)
+            result = subprocess.run(cmd, cwd=self.project_path, capture_output=True)
             
             # Check if the command was successful enough to produce valid JSON
             if result.stdout and result.stdout.strip():
                 try:
                     # Parse the JSON output
-                    yarn_list = json.loads(result.stdout)
+                    yarn_list = json_utils.loads(result.stdout)
                     
                     # Process the dependency tree
                     for dep_data in yarn_list.get("data", {}).get("trees", []):
@@ -283,7 +378,7 @@ class YarnParser(BaseParser):
         """
         # Parse the dependency string
         # Format is usually: package@version [dependencies...]
-        match = re.match(r"([^@]+)@([^@\s]+)", dep_data)
+        match = _YARN_DEP_RE.match(dep_data)
         if match:
             name, version = match.groups()
             
@@ -299,6 +394,6 @@ class YarnParser(BaseParser):
                 })
             
             # Process child dependencies
-            child_deps = re.findall(r"└─\s+([^@]+@[^@\s]+)", dep_data)
+            child_deps = _YARN_CHILD_RE.findall(dep_data)
             for child in child_deps:
                 self._process_yarn_dependency(child, dependencies, processed_deps, is_direct=False)
@@ -2,20 +2,102 @@
 Parsers for Python projects.
 """
 
-import json
 import os
 import re
 import subprocess
-from typing import Dict, List, Any, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set
 
-import toml
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
 
-from eol_check.parsers.base import BaseParser
+from eol_check.parsers.base import BaseParser, cached_dependencies
+from eol_check.utils import json_utils
+
+# Patterns used when parsing requirements files and poetry show output
+_REQ_LINE_RE = re.compile(r"([a-zA-Z0-9_.-]+)([<>=!~]+)([a-zA-Z0-9_.-]+)")
+_POETRY_PKG_RE = re.compile(r"^([a-zA-Z0-9_.-]+)\s+([0-9a-zA-Z.-]+)")
+_POETRY_DEP_RE = re.compile(r"[└├]──\s+([a-zA-Z0-9_.-]+)\s+([0-9a-zA-Z.-]+)")
+_NAME_SEPARATOR_RE = re.compile(r"[-_.]+")
+
+# Version cleanup for Poetry ("^1.2", "~1.2") and Pipfile ("==1.2", ">=1.2") specifiers
+_POETRY_VERSION_STRIP = str.maketrans("", "", "^~")
+_PIPFILE_VERSION_OP_RE = re.compile(r"==|>=|~=")
+
+
+def _normalize_name(package_name: str) -> str:
+    """Normalize a package name so spellings like "PyYAML" and "pyyaml" compare equal.
+    
+    Args:
+        package_name: Package name
+        
+    Returns:
+        Lowercase name with runs of "-", "_" and "." replaced by "-"
+    """
+    return _NAME_SEPARATOR_RE.sub("-", package_name).lower()
+
+
+def _clean_poetry_version(version: str) -> str:
+    """Strip "^" and "~" from a Poetry version constraint."""
+    return version.translate(_POETRY_VERSION_STRIP)
+
+
+def _clean_pipfile_version(version: str) -> str:
+    """Strip "==", ">=" and "~=" from a Pipfile version specifier."""
+    return _PIPFILE_VERSION_OP_RE.sub("", version)
+
+
+def _make_toml_dependency(
+    name: str, version_info: Any, clean_version: Callable[[str], str], dev: bool = False
+) -> Dict[str, Any]:
+    """Build a dependency record from a pyproject.toml or Pipfile entry.
+    
+    Args:
+        name: Package name
+        version_info: Version string, or table with a "version" key
+        clean_version: Function that strips operators from the version
+        dev: Whether this is a dev dependency
+        
+    Returns:
+        Dependency record
+    """
+    if isinstance(version_info, str):
+        version = version_info
+    elif isinstance(version_info, dict):
+        version = version_info.get("version", "latest")
+    else:
+        version = "latest"
+    
+    dep = {
+        "name": name,
+        "version": clean_version(version),
+        "type": "python",
+    }
+    if dev:
+        dep["dev"] = True
+    return dep
 
 
 class PipParser(BaseParser):
     """Parser for pip requirements.txt files."""
     
+    def __init__(self, project_path: str, include_transitive: bool = True, force_update: bool = False):
+        """Initialize the parser.
+        
+        Args:
+            project_path: Path to the project directory
+            include_transitive: Whether to include transitive dependencies
+            force_update: Whether to resolve the dependency tree again
+                instead of reusing a cached one
+        """
+        super().__init__(project_path, include_transitive, force_update)
+        
+        # Normalized names listed in requirements.txt (loaded lazily)
+        self._direct_names: Optional[Set[str]] = None
+    
+    @cached_dependencies
     def parse_dependencies(self) -> List[Dict[str, Any]]:
         """Parse dependencies from requirements.txt.
         
@@ -23,23 +105,26 @@ class PipParser(BaseParser):
             List of dictionaries with dependency information
         """
         requirements_path = os.path.join(self.project_path, "requirements.txt")
-        dependencies = []
         
-        # First parse direct dependencies from requirements.txt
-        direct_deps = self._parse_requirements_file(requirements_path)
-        dependencies.extend(direct_deps)
+        # Dependencies keyed by name, keeping the first occurrence
+        by_name = {}
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Start pip list right away, it is by far the slowest step
+            tree_future = executor.submit(self._get_pip_dependency_tree)
+            
+            # Parse direct dependencies from requirements.txt meanwhile
+            for dep in self._parse_requirements_file(requirements_path):
+                by_name.setdefault(dep["name"], dep)
+            self._direct_names = {_normalize_name(dep["name"]) for dep in by_name.values()}
+            
+            tree_deps = tree_future.result()
         
-        # Then try to get complete dependency tree using pip
-        transitive_deps = self._get_pip_dependency_tree()
-        if transitive_deps:
-            # Add only new dependencies that aren't already in the list
-            existing_names = {dep["name"] for dep in dependencies}
-            for dep in transitive_deps:
-                if dep["name"] not in existing_names:
-                    dependencies.append(dep)
-                    existing_names.add(dep["name"])
+        # Then merge in the complete dependency tree from pip list
+        for dep in tree_deps:
+            by_name.setdefault(dep["name"], dep)
         
-        return dependencies
+        return list(by_name.values())
     
     def _parse_requirements_file(self, requirements_path: str) -> List[Dict[str, Any]]:
         """Parse a requirements.txt file.
@@ -53,36 +138,39 @@ class PipParser(BaseParser):
         dependencies = []
         
         try:
+            # Requirements files are small, so read them in one go and split
             with open(requirements_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    
-                    # Skip comments and empty lines
-                    if not line or line.startswith("#"):
-                        continue
-                    
-                    # Skip options and editable installs
-                    if line.startswith("-") or line.startswith("--"):
-                        continue
-                    
-                    # Parse package name and version
-                    match = re.match(r"([a-zA-Z0-9_.-]+)([<>=!~]+)([a-zA-Z0-9_.-]+)", line)
-                    if match:
-                        name, operator, version = match.groups()
+                content = f.read()
+            
+            for line in content.splitlines():
+                line = line.strip()
+                
+                # Skip comments and empty lines
+                if not line or line.startswith("#"):
+                    continue
+                
+                # Skip options and editable installs
+                if line.startswith("-") or line.startswith("--"):
+                    continue
+                
+                # Parse package name and version
+                match = _REQ_LINE_RE.match(line)
+                if match:
+                    name, operator, version = match.groups()
+                    dependencies.append({
+                        "name": name.strip(),
+                        "version": version.strip(),
+                        "type": "python",
+                    })
+                else:
+                    # Just package name without version
+                    name = line.split("#")[0].strip()  # Remove inline comments
+                    if name:
                         dependencies.append({
-                            "name": name.strip(),
-                            "version": version.strip(),
+                            "name": name,
+                            "version": "latest",
                             "type": "python",
                         })
-                    else:
-                        # Just package name without version
-                        name = line.split("#")[0].strip()  # Remove inline comments
-                        if name:
-                            dependencies.append({
-                                "name": name,
-                                "version": "latest",
-                                "type": "python",
-                            })
         except Exception as e:
             print(f"Error parsing requirements.txt: {e}")
         
@@ -95,37 +183,31 @@ class PipParser(BaseParser):
             List of dependencies or empty list if command fails
         """
         dependencies = []
-        processed_deps = set()  # To avoid duplicates
         
         try:
             # Run pip list command in JSON format
             cmd = ["pip", "list", "--format=json"]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            result = subprocess.run(cmd, capture_output=True, check=True)
             
-            # Parse the JSON output
-            packages = json.loads(result.stdout)
+            # Parse the JSON output straight from bytes, without decoding it first
+            packages = json_utils.loads(result.stdout)
+            
+            # Direct dependencies are approximated by the names listed in
+            # requirements.txt, since pip doesn't provide this info directly
+            direct_names = self._get_direct_names()
             
             for package in packages:
                 name = package.get("name")
                 version = package.get("version")
                 
+                # pip list reports each installed distribution once, so no
+                # deduplication is needed here
                 if name and version:
-                    # Create a unique key to avoid duplicates
-                    dep_key = f"{name}:{version}"
-                    if dep_key in processed_deps:
-                        continue
-                    
-                    processed_deps.add(dep_key)
-                    
-                    # Try to determine if it's a direct or transitive dependency
-                    # This is an approximation since pip doesn't provide this info directly
-                    is_direct = self._is_direct_dependency(name)
-                    
                     dependencies.append({
                         "name": name,
                         "version": version,
                         "type": "python",
-                        "transitive": not is_direct
+                        "transitive": _normalize_name(name) not in direct_names
                     })
             
             return dependencies
@@ -133,29 +215,25 @@ class PipParser(BaseParser):
             print(f"Error getting pip dependency tree: {e}")
             return []
     
-    def _is_direct_dependency(self, package_name: str) -> bool:
-        """Check if a package is a direct dependency.
+    def _get_direct_names(self) -> Set[str]:
+        """Get the normalized names of packages listed in requirements.txt.
         
-        Args:
-            package_name: Package name
-            
         Returns:
-            True if it's a direct dependency, False otherwise
+            Set of normalized package names
         """
-        requirements_path = os.path.join(self.project_path, "requirements.txt")
-        try:
-            with open(requirements_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                # Simple check: if the package name appears in requirements.txt
-                # This is not perfect but a reasonable approximation
-                return re.search(rf"\b{re.escape(package_name)}\b", content) is not None
-        except Exception:
-            return False
+        if self._direct_names is None:
+            requirements_path = os.path.join(self.project_path, "requirements.txt")
+            self._direct_names = {
+                _normalize_name(dep["name"]) for dep in self._parse_requirements_file(requirements_path)
+            }
+        
+        return self._direct_names
 
 
 class PoetryParser(BaseParser):
     """Parser for Poetry pyproject.toml files."""
     
+    @cached_dependencies
     def parse_dependencies(self) -> List[Dict[str, Any]]:
         """Parse dependencies from pyproject.toml.
         
@@ -163,23 +241,25 @@ class PoetryParser(BaseParser):
             List of dictionaries with dependency information
         """
         pyproject_path = os.path.join(self.project_path, "pyproject.toml")
-        dependencies = []
         
-        # First parse direct dependencies from pyproject.toml
-        direct_deps = self._parse_pyproject_toml(pyproject_path)
-        dependencies.extend(direct_deps)
+        # Dependencies keyed by name, keeping the first occurrence
+        by_name = {}
         
-        # Then try to get complete dependency tree using poetry
-        transitive_deps = self._get_poetry_dependency_tree()
-        if transitive_deps:
-            # Add only new dependencies that aren't already in the list
-            existing_names = {dep["name"] for dep in dependencies}
-            for dep in transitive_deps:
-                if dep["name"] not in existing_names:
-                    dependencies.append(dep)
-                    existing_names.add(dep["name"])
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Start poetry show right away, it is by far the slowest step
+            tree_future = executor.submit(self._get_poetry_dependency_tree)
+            
+            # Parse direct dependencies from pyproject.toml meanwhile
+            for dep in self._parse_pyproject_toml(pyproject_path):
+                by_name.setdefault(dep["name"], dep)
+            
+            tree_deps = tree_future.result()
         
-        return dependencies
+        # Then merge in the complete dependency tree from poetry show
+        for dep in tree_deps:
+            by_name.setdefault(dep["name"], dep)
+        
+        return list(by_name.values())
     
     def _parse_pyproject_toml(self, pyproject_path: str) -> List[Dict[str, Any]]:
         """Parse a pyproject.toml file.
@@ -193,50 +273,25 @@ class PoetryParser(BaseParser):
         dependencies = []
         
         try:
-            with open(pyproject_path, "r", encoding="utf-8") as f:
-                pyproject = toml.load(f)
+            with open(pyproject_path, "rb") as f:
+                pyproject = tomllib.load(f)
             
-            # Get dependencies
-            deps = pyproject.get("tool", {}).get("poetry", {}).get("dependencies", {})
-            for name, version_info in deps.items():
-                if name == "python":
-                    continue  # Skip Python itself
-                
-                if isinstance(version_info, str):
-                    version = version_info
-                elif isinstance(version_info, dict):
-                    version = version_info.get("version", "latest")
-                else:
-                    version = "latest"
-                
-                # Clean up version string
-                version = version.replace("^", "").replace("~", "")
-                
-                dependencies.append({
-                    "name": name,
-                    "version": version,
-                    "type": "python",
-                })
+            poetry = pyproject.get("tool", {}).get("poetry", {})
+            
+            # Get dependencies, skipping Python itself
+            deps = poetry.get("dependencies", {})
+            dependencies = [
+                _make_toml_dependency(name, version_info, _clean_poetry_version)
+                for name, version_info in deps.items()
+                if name != "python"
+            ]
             
             # Get dev dependencies
-            dev_deps = pyproject.get("tool", {}).get("poetry", {}).get("dev-dependencies", {})
-            for name, version_info in dev_deps.items():
-                if isinstance(version_info, str):
-                    version = version_info
-                elif isinstance(version_info, dict):
-                    version = version_info.get("version", "latest")
-                else:
-                    version = "latest"
-                
-                # Clean up version string
-                version = version.replace("^", "").replace("~", "")
-                
-                dependencies.append({
-                    "name": name,
-                    "version": version,
-                    "type": "python",
-                    "dev": True,
-                })
+            dev_deps = poetry.get("dev-dependencies", {})
+            dependencies.extend(
+                _make_toml_dependency(name, version_info, _clean_poetry_version, dev=True)
+                for name, version_info in dev_deps.items()
+            )
         
         except Exception as e:
             print(f"Error parsing pyproject.toml: {e}")
@@ -250,7 +305,7 @@ class PoetryParser(BaseParser):
             List of dependencies or empty list if command fails
         """
         dependencies = []
-        processed_deps = set()  # To avoid duplicates
+        processed_deps = {}  # Record added for each (name, version), to avoid duplicates
         
         try:
             # Check if we're in a Poetry project first
@@ -280,38 +335,42 @@ class PoetryParser(BaseParser):
             
             for line in lines:
                 # New package entry starts with a name and version
-                package_match = re.match(r"^([a-zA-Z0-9_.-]+)\s+([0-9a-zA-Z.-]+)", line)
+                package_match = _POETRY_PKG_RE.match(line)
                 if package_match:
                     name, version = package_match.groups()
                     current_package = name
                     
-                    # Create a unique key to avoid duplicates
-                    dep_key = f"{name}:{version}"
-                    if dep_key not in processed_deps:
-                        processed_deps.add(dep_key)
-                        dependencies.append({
+                    # Create a unique key to avoid duplicates. A package seen
+                    # before as a dependency of another one is direct as well.
+                    dep_key = (name, version)
+                    existing = processed_deps.get(dep_key)
+                    if existing is not None:
+                        existing["transitive"] = False
+                    else:
+                        processed_deps[dep_key] = dep = {
                             "name": name,
                             "version": version,
                             "type": "python",
                             "transitive": False  # Direct dependency
-                        })
+                        }
+                        dependencies.append(dep)
                 
                 # Dependencies of the current package
                 elif current_package and ("└──" in line or "├──" in line):
-                    dep_match = re.search(r"[└├]──\s+([a-zA-Z0-9_.-]+)\s+([0-9a-zA-Z.-]+)", line)
+                    dep_match = _POETRY_DEP_RE.search(line)
                     if dep_match:
                         name, version = dep_match.groups()
                         
                         # Create a unique key to avoid duplicates
-                        dep_key = f"{name}:{version}"
+                        dep_key = (name, version)
                         if dep_key not in processed_deps:
-                            processed_deps.add(dep_key)
-                            dependencies.append({
+                            processed_deps[dep_key] = dep = {
                                 "name": name,
                                 "version": version,
                                 "type": "python",
                                 "transitive": True  # Transitive dependency
-                            })
+                            }
+                            dependencies.append(dep)
             
             return dependencies
         except Exception as e:
@@ -322,6 +381,7 @@ class PoetryParser(BaseParser):
 class PipenvParser(BaseParser):
     """Parser for Pipenv Pipfile files."""
     
+    @cached_dependencies
     def parse_dependencies(self) -> List[Dict[str, Any]]:
         """Parse dependencies from Pipfile.
         
@@ -329,23 +389,25 @@ class PipenvParser(BaseParser):
             List of dictionaries with dependency information
         """
         pipfile_path = os.path.join(self.project_path, "Pipfile")
-        dependencies = []
         
-        # First parse direct dependencies from Pipfile
-        direct_deps = self._parse_pipfile(pipfile_path)
-        dependencies.extend(direct_deps)
+        # Dependencies keyed by name, keeping the first occurrence
+        by_name = {}
         
-        # Then try to get complete dependency tree using pipenv
-        transitive_deps = self._get_pipenv_dependency_tree()
-        if transitive_deps:
-            # Add only new dependencies that aren't already in the list
-            existing_names = {dep["name"] for dep in dependencies}
-            for dep in transitive_deps:
-                if dep["name"] not in existing_names:
-                    dependencies.append(dep)
-                    existing_names.add(dep["name"])
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Start pipenv graph right away, it is by far the slowest step
+            tree_future = executor.submit(self._get_pipenv_dependency_tree)
+            
+            # Parse direct dependencies from Pipfile meanwhile
+            for dep in self._parse_pipfile(pipfile_path):
+                by_name.setdefault(dep["name"], dep)
+            
+            tree_deps = tree_future.result()
         
-        return dependencies
+        # Then merge in the complete dependency tree from pipenv graph
+        for dep in tree_deps:
+            by_name.setdefault(dep["name"], dep)
+        
+        return list(by_name.values())
     
     def _parse_pipfile(self, pipfile_path: str) -> List[Dict[str, Any]]:
         """Parse a Pipfile.
@@ -359,47 +421,22 @@ class PipenvParser(BaseParser):
         dependencies = []
         
         try:
-            with open(pipfile_path, "r", encoding="utf-8") as f:
-                pipfile = toml.load(f)
+            with open(pipfile_path, "rb") as f:
+                pipfile = tomllib.load(f)
             
             # Get regular dependencies
             deps = pipfile.get("packages", {})
-            for name, version_info in deps.items():
-                if isinstance(version_info, str):
-                    version = version_info
-                elif isinstance(version_info, dict):
-                    version = version_info.get("version", "latest")
-                else:
-                    version = "latest"
-                
-                # Clean up version string
-                version = version.replace("==", "").replace(">=", "").replace("~=", "")
-                
-                dependencies.append({
-                    "name": name,
-                    "version": version,
-                    "type": "python",
-                })
+            dependencies = [
+                _make_toml_dependency(name, version_info, _clean_pipfile_version)
+                for name, version_info in deps.items()
+            ]
             
             # Get dev dependencies
             dev_deps = pipfile.get("dev-packages", {})
-            for name, version_info in dev_deps.items():
-                if isinstance(version_info, str):
-                    version = version_info
-                elif isinstance(version_info, dict):
-                    version = version_info.get("version", "latest")
-                else:
-                    version = "latest"
-                
-                # Clean up version string
-                version = version.replace("==", "").replace(">=", "").replace("~=", "")
-                
-                dependencies.append({
-                    "name": name,
-                    "version": version,
-                    "type": "python",
-                    "dev": True,
-                })
+            dependencies.extend(
+                _make_toml_dependency(name, version_info, _clean_pipfile_version, dev=True)
+                for name, version_info in dev_deps.items()
+            )
         
         except Exception as e:
             print(f"Error parsing Pipfile: {e}")
@@ -413,49 +450,64 @@ class PipenvParser(BaseParser):
             List of dependencies or empty list if command fails
         """
         dependencies = []
-        processed_deps = set()  # To avoid duplicates
+        processed_deps = {}  # Record added for each (name, version), to avoid duplicates
         
         try:
             # Run pipenv graph command
             cmd = ["pipenv", "graph", "--json"]
-            result = subprocess.run(cmd, cwd=self.project_path, capture_output=True, text=True, check=True)
+            result = subprocess.run(cmd, cwd=self.project_path, capture_output=True, check=True)
             
-            # Parse the JSON output
-            packages = json.loads(result.stdout)
+            # Parse the JSON output straight from bytes, without decoding it first
+            packages = json_utils.loads(result.stdout)
             
             # Process the dependency tree
-            for package in packages:
-                self._process_pipenv_package(package, dependencies, processed_deps, is_direct=True)
+            self._process_pipenv_packages(packages, dependencies, processed_deps)
             
             return dependencies
         except Exception as e:
             print(f"Error getting pipenv dependency tree: {e}")
             return []
     
-    def _process_pipenv_package(self, package: Dict, dependencies: List, processed_deps: Set, is_direct: bool = False):
-        """Process a package from pipenv graph output.
+    def _process_pipenv_packages(self, packages: List[Dict], dependencies: List, processed_deps: Dict):
+        """Process packages from pipenv graph output.
+        
+        The graph is walked with an explicit stack rather than recursion, so
+        deeply nested graphs don't run into the interpreter's recursion limit.
         
         Args:
-            package: Package information
+            packages: Top-level packages from pipenv graph
             dependencies: List to add dependencies to
-            processed_deps: Set of already processed dependencies
-            is_direct: Whether this is a direct dependency
+            processed_deps: Records already added, keyed by (name, version)
         """
-        name = package.get("package", {}).get("key", "")
-        version = package.get("package", {}).get("installed", "")
-        
-        if name and version:
-            # Create a unique key to avoid duplicates
-            dep_key = f"{name}:{version}"
-            if dep_key not in processed_deps:
-                processed_deps.add(dep_key)
-                dependencies.append({
+        # Stack entries are (package, is_direct); children are pushed in
+        # reverse so they are visited in the same order as pipenv lists them
+        stack = [(package, True) for package in reversed(packages)]
+        
+        while stack:
+            package, is_direct = stack.pop()
+            
+            name = package.get("package", {}).get("key", "")
+            version = package.get("package", {}).get("installed", "")
+            
+            if name and version:
+                # Use a unique key to avoid duplicates. A package seen before
+                # has already had its dependencies walked, so skip them too,
+                # but keep it direct if this occurrence is.
+                dep_key = (name, version)
+                existing = processed_deps.get(dep_key)
+                if existing is not None:
+                    if is_direct:
+                        existing["transitive"] = False
+                    continue
+                
+                processed_deps[dep_key] = dep = {
                     "name": name,
                     "version": version,
                     "type": "python",
                     "transitive": not is_direct
-                })
-        
-        # Process dependencies recursively
-        for dep in package.get("dependencies", []):
-            self._process_pipenv_package(dep, dependencies, processed_deps, is_direct=False)
+                }
+                dependencies.append(dep)
+            
+            children = package.get("dependencies")
+            if children:
+                stack.extend((child, False) for child in reversed(children))
@@ -11,6 +11,15 @@ from eol_check.reporters.csv_reporter import CsvReporter
 from eol_check.reporters.html_reporter import HtmlReporter
 
 
+# Reporters are stateless, so one shared instance serves every report
+_REPORTERS: Dict[str, BaseReporter] = {
+    "text": TextReporter(),
+    "json": JsonReporter(),
+    "csv": CsvReporter(),
+    "html": HtmlReporter(),
+}
+
+
 def get_reporter(format_name: str) -> BaseReporter:
     """Get a reporter for the specified format.
     
@@ -18,14 +27,6 @@ def get_reporter(format_name: str) -> BaseReporter:
         format_name: Name of the format (text, json, csv, html)
         
     Returns:
-        Reporter instance
+        Shared reporter instance
     """
-    reporters = {
-        "text": TextReporter,
-        "json": JsonReporter,
-        "csv": CsvReporter,
-        "html": HtmlReporter,
-    }
-    
-    reporter_class = reporters.get(format_name.lower(), TextReporter)
-    return reporter_class()
+    return _REPORTERS.get(format_name.lower(), _REPORTERS["text"])
@@ -2,14 +2,39 @@
 Base reporter class for generating reports.
 """
 
+import itertools
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, TextIO
+
+# Order in which dependency statuses are listed in reports, most severe first
+STATUS_ORDER = {"CRITICAL": 0, "WARNING": 1, "OK": 2, "UNKNOWN": 3, "ERROR": 4}
 
 
 class BaseReporter(ABC):
     """Base class for report generators."""
     
+    @staticmethod
+    def _sort_by_status(dependencies: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Order dependencies by status, most severe first.
+        
+        Dependencies are partitioned into one bucket per status in a single
+        pass rather than sorted. Order within a status is preserved, and
+        statuses not in STATUS_ORDER come last.
+        
+        Args:
+            dependencies: Dependency results
+            
+        Returns:
+            Iterator over the dependencies ordered by status
+        """
+        buckets = {status: [] for status in STATUS_ORDER}
+        other = []
+        bucket_for = buckets.get
+        for dep in dependencies:
+            bucket_for(dep["status"], other).append(dep)
+        return itertools.chain(*buckets.values(), other)
+    
     @abstractmethod
     def generate_report(
         self,
@@ -32,3 +57,33 @@ class BaseReporter(ABC):
             Report as string
         """
         pass
+    
+    def generate_report_to(
+        self,
+        out: TextIO,
+        results: Dict[str, Any],
+        project_path: str,
+        scan_date: datetime,
+        threshold_days: int,
+        execution_time: float = None,
+    ) -> None:
+        """Generate a report from the check results and write it to a file.
+        
+        Reporters that can produce their output incrementally override this
+        to write it piece by piece instead of building the whole report first.
+        
+        Args:
+            out: Text file to write the report to
+            results: Check results
+            project_path: Path to the project
+            scan_date: Date of the scan
+            threshold_days: Days before EOL to start warning
+            execution_time: Total execution time in seconds (optional)
+        """
+        out.write(self.generate_report(
+            results=results,
+            project_path=project_path,
+            scan_date=scan_date,
+            threshold_days=threshold_days,
+            execution_time=execution_time,
+        ))
@@ -5,10 +5,16 @@ CSV reporter for generating CSV reports.
 import csv
 import io
 from datetime import datetime
+from operator import itemgetter
 from typing import Dict, Any
 
 from eol_check.reporters.base import BaseReporter
 
+# Dependency fields written to each row, in column order
+_ROW_FIELDS = ("name", "version", "type", "status", "eol_date", "days_remaining", "recommended_version")
+_ROW_DEFAULTS = dict.fromkeys(_ROW_FIELDS, "")
+_get_row_fields = itemgetter(*_ROW_FIELDS)
+
 
 class CsvReporter(BaseReporter):
     """Reporter for CSV output."""
@@ -19,6 +25,7 @@ class CsvReporter(BaseReporter):
         project_path: str,
         scan_date: datetime,
         threshold_days: int,
+        execution_time: float = None,
     ) -> str:
         """Generate a CSV report.
         
@@ -27,6 +34,7 @@ class CsvReporter(BaseReporter):
             project_path: Path to the project
             scan_date: Date of the scan
             threshold_days: Days before EOL to start warning
+            execution_time: Total execution time in seconds (optional, not included)
             
         Returns:
             Report as CSV string
@@ -49,17 +57,9 @@ class CsvReporter(BaseReporter):
         
         # Write dependencies
         project_name = f"{results.get('project_name', 'Unknown')}"
-        for dep in results.get("dependencies", []):
-            writer.writerow([
-                project_name,
-                dep.get("name", ""),
-                dep.get("version", ""),
-                dep.get("type", ""),
-                dep.get("status", ""),
-                dep.get("eol_date", ""),
-                dep.get("days_remaining", ""),
-                dep.get("recommended_version", ""),
-                "Yes" if dep.get("dev", False) else "No",
-            ])
+        writer.writerows(
+            (project_name, *_get_row_fields({**_ROW_DEFAULTS, **dep}), "Yes" if dep.get("dev", False) else "No")
+            for dep in results.get("dependencies", [])
+        )
         
         return output.getvalue()
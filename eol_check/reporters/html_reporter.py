@@ -2,11 +2,89 @@
 HTML reporter for generating HTML reports.
 """
 
+import io
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, TextIO
 
 from eol_check.reporters.base import BaseReporter
 
+# Document head, identical for every report
+_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>End of Life Checker Report</title>
+  <style>
+    body { font-family: Arial, sans-serif; margin: 20px; }
+    h1 { color: #333; }
+    .summary { margin: 20px 0; }
+    .critical { color: #d9534f; }
+    .warning { color: #f0ad4e; }
+    .ok { color: #5cb85c; }
+    table { border-collapse: collapse; width: 100%; }
+    th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+    th { background-color: #f2f2f2; }
+    tr:nth-child(even) { background-color: #f9f9f9; }
+    .recommended { margin-top: 5px; font-style: italic; }
+  </style>
+</head>
+<body>
+"""
+
+# Opening of the details table, up to and including its header row
+_TABLE_START = """  <div class="details">
+    <h2>Details</h2>
+    <table>
+      <tr>
+        <th>Status</th>
+        <th>Name</th>
+        <th>Version</th>
+        <th>Type</th>
+        <th>EOL Date</th>
+        <th>Days Remaining</th>
+        <th>Recommended Version</th>
+      </tr>
+"""
+
+# One row of the details table
+_ROW_TEMPLATE = """      <tr class="{row_class}">
+        <td>{status}</td>
+        <td>{name}</td>
+        <td>{version}</td>
+        <td>{dep_type}</td>
+        <td>{eol_date}</td>
+        <td>{days_text}</td>
+        <td>{recommended}</td>
+      </tr>
+"""
+
+# Translation table escaping the characters that are special in HTML text
+# and attribute values, applied in a single pass over each string
+_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+
+def _escape(value: Any) -> str:
+    """Escape a value for inclusion in the report's HTML.
+    
+    Args:
+        value: Value to include, converted to a string first
+        
+    Returns:
+        Escaped string
+    """
+    return str(value).translate(_ESCAPE_TABLE)
+
+
+# Statuses whose rows are highlighted, mapped to their row class
+_ROW_CLASSES = {"CRITICAL": "critical", "WARNING": "warning", "OK": "ok"}
+
 
 class HtmlReporter(BaseReporter):
     """Reporter for HTML output."""
@@ -17,6 +95,7 @@ class HtmlReporter(BaseReporter):
         project_path: str,
         scan_date: datetime,
         threshold_days: int,
+        execution_time: float = None,
     ) -> str:
         """Generate an HTML report.
         
@@ -25,128 +104,104 @@ class HtmlReporter(BaseReporter):
             project_path: Path to the project
             scan_date: Date of the scan
             threshold_days: Days before EOL to start warning
+            execution_time: Total execution time in seconds (optional, not shown)
             
         Returns:
             Report as HTML string
         """
+        buf = io.StringIO()
+        self.generate_report_to(buf, results, project_path, scan_date, threshold_days, execution_time)
+        return buf.getvalue()
+    
+    def generate_report_to(
+        self,
+        out: TextIO,
+        results: Dict[str, Any],
+        project_path: str,
+        scan_date: datetime,
+        threshold_days: int,
+        execution_time: float = None,
+    ) -> None:
+        """Generate an HTML report and write it to a file as it is built.
+        
+        Args:
+            out: Text file to write the report to
+            results: Check results
+            project_path: Path to the project
+            scan_date: Date of the scan
+            threshold_days: Days before EOL to start warning
+            execution_time: Total execution time in seconds (optional, not shown)
+        """
         summary = results.get("summary", {})
         critical_count = summary.get("critical", 0)
         warning_count = summary.get("warning", 0)
         ok_count = summary.get("ok", 0)
         unknown_count = summary.get("unknown", 0)
         
-        # Start building HTML
-        html = []
-        html.append("<!DOCTYPE html>")
-        html.append("<html lang=\"en\">")
-        html.append("<head>")
-        html.append("  <meta charset=\"UTF-8\">")
-        html.append("  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">")
-        html.append("  <title>End of Life Checker Report</title>")
-        html.append("  <style>")
-        html.append("    body { font-family: Arial, sans-serif; margin: 20px; }")
-        html.append("    h1 { color: #333; }")
-        html.append("    .summary { margin: 20px 0; }")
-        html.append("    .critical { color: #d9534f; }")
-        html.append("    .warning { color: #f0ad4e; }")
-        html.append("    .ok { color: #5cb85c; }")
-        html.append("    table { border-collapse: collapse; width: 100%; }")
-        html.append("    th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }")
-        html.append("    th { background-color: #f2f2f2; }")
-        html.append("    tr:nth-child(even) { background-color: #f9f9f9; }")
-        html.append("    .recommended { margin-top: 5px; font-style: italic; }")
-        html.append("  </style>")
-        html.append("</head>")
-        html.append("<body>")
+        # Write the report one newline-terminated line at a time
+        w = out.write
+        w(_HEAD)
         
         # Header
-        html.append("  <h1>End of Life Checker Report</h1>")
-        html.append(f"  <p><strong>Project:</strong> {results.get('project_name', 'Unknown')} ({results.get('project_path', project_path)})</p>")
-        html.append(f"  <p><strong>Scan Date:</strong> {scan_date.strftime('%Y-%m-%d')}</p>")
+        w("  <h1>End of Life Checker Report</h1>\n")
+        w(f"  <p><strong>Project:</strong> {_escape(results.get('project_name', 'Unknown'))} ({_escape(results.get('project_path', project_path))})</p>\n")
+        w(f"  <p><strong>Scan Date:</strong> {scan_date.strftime('%Y-%m-%d')}</p>\n")
         
         # Summary
-        html.append("  <div class=\"summary\">")
-        html.append("    <h2>Summary</h2>")
+        w("  <div class=\"summary\">\n")
+        w("    <h2>Summary</h2>\n")
         
         if critical_count > 0:
-            html.append(f"    <p class=\"critical\">CRITICAL: {critical_count} dependencies have reached end of life</p>")
+            w(f"    <p class=\"critical\">CRITICAL: {critical_count} dependencies have reached end of life</p>\n")
         
         if warning_count > 0:
-            html.append(f"    <p class=\"warning\">WARNING: {warning_count} dependencies will reach end of life within {threshold_days} days</p>")
+            w(f"    <p class=\"warning\">WARNING: {warning_count} dependencies will reach end of life within {threshold_days} days</p>\n")
         
         if ok_count > 0:
-            html.append(f"    <p class=\"ok\">OK: {ok_count} dependencies are up to date</p>")
-            
+            w(f"    <p class=\"ok\">OK: {ok_count} dependencies are up to date</p>\n")
+        
         if unknown_count > 0:
-            html.append(f"    <p>UNKNOWN: {unknown_count} dependencies have unknown EOL status</p>")
+            w(f"    <p>UNKNOWN: {unknown_count} dependencies have unknown EOL status</p>\n")
         
         if critical_count == 0 and warning_count == 0 and ok_count == 0 and unknown_count == 0:
-            html.append("    <p>No dependencies found or analyzed</p>")
+            w("    <p>No dependencies found or analyzed</p>\n")
         
-        html.append("  </div>")
+        w("  </div>\n")
         
         # Details
         if results.get("dependencies"):
-            html.append("  <div class=\"details\">")
-            html.append("    <h2>Details</h2>")
-            html.append("    <table>")
-            html.append("      <tr>")
-            html.append("        <th>Status</th>")
-            html.append("        <th>Name</th>")
-            html.append("        <th>Version</th>")
-            html.append("        <th>Type</th>")
-            html.append("        <th>EOL Date</th>")
-            html.append("        <th>Days Remaining</th>")
-            html.append("        <th>Recommended Version</th>")
-            html.append("      </tr>")
+            w(_TABLE_START)
             
             # Sort dependencies by status (critical first, then warning, then ok)
-            sorted_deps = sorted(
-                results["dependencies"],
-                key=lambda d: {"CRITICAL": 0, "WARNING": 1, "OK": 2, "UNKNOWN": 3, "ERROR": 4}.get(d["status"], 5)
-            )
+            sorted_deps = self._sort_by_status(results["dependencies"])
             
+            row = _ROW_TEMPLATE.format
+            row_class_for = _ROW_CLASSES.get
             for dep in sorted_deps:
-                name = dep["name"]
-                version = dep["version"]
                 status = dep["status"]
-                dep_type = dep.get("type", "")
-                eol_date = dep.get("eol_date", "")
                 days_remaining = dep.get("days_remaining")
-                recommended = dep.get("recommended_version", "")
-                
-                # Set row class based on status
-                row_class = status.lower() if status in ["CRITICAL", "WARNING", "OK"] else ""
-                
-                html.append(f"      <tr class=\"{row_class}\">")
-                html.append(f"        <td>{status}</td>")
-                html.append(f"        <td>{name}</td>")
-                html.append(f"        <td>{version}</td>")
-                html.append(f"        <td>{dep_type}</td>")
-                html.append(f"        <td>{eol_date}</td>")
                 
                 # Format days remaining
-                if days_remaining is not None:
-                    if days_remaining < 0:
-                        days_text = f"{abs(days_remaining)} days ago"
-                    else:
-                        days_text = f"{days_remaining} days"
-                    html.append(f"        <td>{days_text}</td>")
-                else:
-                    html.append("        <td>Unknown</td>")
-                
-                # Recommended version
-                if recommended:
-                    html.append(f"        <td>{recommended}</td>")
+                if days_remaining is None:
+                    days_text = "Unknown"
+                elif days_remaining < 0:
+                    days_text = f"{abs(days_remaining)} days ago"
                 else:
-                    html.append("        <td>-</td>")
+                    days_text = f"{days_remaining} days"
                 
-                html.append("      </tr>")
+                w(row(
+                    row_class=row_class_for(status, ""),
+                    status=_escape(status),
+                    name=_escape(dep["name"]),
+                    version=_escape(dep["version"]),
+                    dep_type=_escape(dep.get("type", "")),
+                    eol_date=_escape(dep.get("eol_date", "")),
+                    days_text=days_text,
+                    recommended=_escape(dep.get("recommended_version") or "-"),
+                ))
             
-            html.append("    </table>")
-            html.append("  </div>")
-        
-        html.append("</body>")
-        html.append("</html>")
+            w("    </table>\n")
+            w("  </div>\n")
         
-        return "\n".join(html)
+        w("</body>\n")
+        w("</html>")
@@ -2,11 +2,11 @@
 JSON reporter for generating JSON reports.
 """
 
-import json
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, TextIO
 
 from eol_check.reporters.base import BaseReporter
+from eol_check.utils import json_utils
 
 
 class JsonReporter(BaseReporter):
@@ -18,6 +18,7 @@ class JsonReporter(BaseReporter):
         project_path: str,
         scan_date: datetime,
         threshold_days: int,
+        execution_time: float = None,
     ) -> str:
         """Generate a JSON report.
         
@@ -26,11 +27,68 @@ class JsonReporter(BaseReporter):
             project_path: Path to the project
             scan_date: Date of the scan
             threshold_days: Days before EOL to start warning
+            execution_time: Total execution time in seconds (optional, not included)
             
         Returns:
             Report as JSON string
         """
-        report = {
+        return json_utils.dumps_indented(
+            self._build_report(results, project_path, scan_date, threshold_days)
+        )
+    
+    def generate_report_to(
+        self,
+        out: TextIO,
+        results: Dict[str, Any],
+        project_path: str,
+        scan_date: datetime,
+        threshold_days: int,
+        execution_time: float = None,
+    ) -> None:
+        """Generate a JSON report and write it to a file.
+        
+        The report is serialized straight to UTF-8 bytes and, when the file
+        has an underlying binary buffer, written to it without building a
+        str of the whole report.
+        
+        Args:
+            out: Text file to write the report to
+            results: Check results
+            project_path: Path to the project
+            scan_date: Date of the scan
+            threshold_days: Days before EOL to start warning
+            execution_time: Total execution time in seconds (optional, not included)
+        """
+        data = json_utils.dumps_indented_bytes(
+            self._build_report(results, project_path, scan_date, threshold_days)
+        )
+        
+        buffer = getattr(out, "buffer", None)
+        if buffer is not None and (out.encoding or "").lower().replace("-", "") == "utf8":
+            out.flush()
+            buffer.write(data)
+        else:
+            out.write(data.decode("utf-8"))
+    
+    @staticmethod
+    def _build_report(
+        results: Dict[str, Any],
+        project_path: str,
+        scan_date: datetime,
+        threshold_days: int,
+    ) -> Dict[str, Any]:
+        """Build the JSON report document.
+        
+        Args:
+            results: Check results
+            project_path: Path to the project
+            scan_date: Date of the scan
+            threshold_days: Days before EOL to start warning
+            
+        Returns:
+            Report document
+        """
+        return {
             "project_name": results.get("project_name", "Unknown"),
             "project_path": results.get("project_path", project_path),
             "scan_date": scan_date.isoformat(),
@@ -38,5 +96,3 @@ class JsonReporter(BaseReporter):
             "summary": results.get("summary", {}),
             "dependencies": results.get("dependencies", []),
         }
-        
-        return json.dumps(report, indent=2)
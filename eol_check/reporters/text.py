@@ -2,12 +2,59 @@
 Text reporter for generating plain text reports.
 """
 
+import io
 from datetime import datetime, timedelta
 from typing import Dict, Any
 
 from eol_check.reporters.base import BaseReporter
 
 
+def _has_eol_date(dep: Dict[str, Any]) -> bool:
+    """Check whether a dependency result has both an EOL date and days remaining."""
+    return bool(dep.get("eol_date")) and dep.get("days_remaining") is not None
+
+
+def _describe_critical(dep: Dict[str, Any]) -> str:
+    """Describe a dependency that has reached end of life."""
+    if _has_eol_date(dep):
+        return f"EOL since {dep['eol_date']} ({abs(dep['days_remaining'])} days ago)"
+    return "Has reached end of life"
+
+
+def _describe_warning(dep: Dict[str, Any]) -> str:
+    """Describe a dependency that will reach end of life soon."""
+    if _has_eol_date(dep):
+        return f"EOL in {dep['days_remaining']} days ({dep['eol_date']})"
+    return "Will reach end of life soon"
+
+
+def _describe_ok(dep: Dict[str, Any]) -> str:
+    """Describe a dependency that is up to date."""
+    if _has_eol_date(dep):
+        return f"EOL in {dep['days_remaining']} days ({dep['eol_date']})"
+    return "No EOL date available"
+
+
+def _describe_unknown(dep: Dict[str, Any]) -> str:
+    """Describe a dependency with no EOL information."""
+    return "No EOL information available"
+
+
+def _describe_error(dep: Dict[str, Any]) -> str:
+    """Describe a dependency whose EOL status could not be checked."""
+    return f"Error checking EOL status: {dep.get('error', 'Unknown error')}"
+
+
+# Status line description for each dependency status
+_STATUS_DESCRIBERS = {
+    "CRITICAL": _describe_critical,
+    "WARNING": _describe_warning,
+    "OK": _describe_ok,
+    "UNKNOWN": _describe_unknown,
+    "ERROR": _describe_error,
+}
+
+
 class TextReporter(BaseReporter):
     """Reporter for plain text output."""
     
@@ -40,13 +87,15 @@ class TextReporter(BaseReporter):
         Returns:
             Report as string
         """
-        lines = []
+        # Write the report into a single buffer, one newline-terminated line per write
+        buf = io.StringIO()
+        w = buf.write
         
         # Header
-        lines.append("End of Life Checker Report")
-        lines.append("=========================")
-        lines.append(f"Project: {results.get('project_name', 'Unknown')} ({results.get('project_path', project_path)})")
-        lines.append(f"Scan Date: {scan_date.strftime('%Y-%m-%d %H:%M:%S')}")
+        w("End of Life Checker Report\n")
+        w("=========================\n")
+        w(f"Project: {results.get('project_name', 'Unknown')} ({results.get('project_path', project_path)})\n")
+        w(f"Scan Date: {scan_date.strftime('%Y-%m-%d %H:%M:%S')}\n")
         
         # Add execution time if provided
         if execution_time is not None:
@@ -60,9 +109,13 @@ class TextReporter(BaseReporter):
                 seconds = execution_time % 60
                 time_str = f"{minutes} min {seconds:.2f} sec"
             
-            lines.append(f"Execution Time: {time_str}")
+            w(f"Execution Time: {time_str}\n")
+        
+        w("\n")
         
-        lines.append("")
+        # Bind the emoji lookups once for the whole report
+        emojis = self.STATUS_EMOJIS
+        emoji_for = emojis.get
         
         # Summary
         summary = results.get("summary", {})
@@ -72,75 +125,51 @@ class TextReporter(BaseReporter):
         unknown_count = summary.get("unknown", 0)
         
         if critical_count > 0:
-            lines.append(f"{self.STATUS_EMOJIS['CRITICAL']} {critical_count} dependencies have reached end of life")
+            w(f"{emojis['CRITICAL']} {critical_count} dependencies have reached end of life\n")
         
         if warning_count > 0:
-            lines.append(f"{self.STATUS_EMOJIS['WARNING']} {warning_count} dependencies will reach end of life within {threshold_days} days")
+            w(f"{emojis['WARNING']} {warning_count} dependencies will reach end of life within {threshold_days} days\n")
         
         if ok_count > 0:
-            lines.append(f"{self.STATUS_EMOJIS['OK']} {ok_count} dependencies are up to date")
+            w(f"{emojis['OK']} {ok_count} dependencies are up to date\n")
             
         if unknown_count > 0:
-            lines.append(f"{self.STATUS_EMOJIS['UNKNOWN']} {unknown_count} dependencies have unknown EOL status")
+            w(f"{emojis['UNKNOWN']} {unknown_count} dependencies have unknown EOL status\n")
         
         if critical_count == 0 and warning_count == 0 and ok_count == 0 and unknown_count == 0:
-            lines.append("No dependencies found or analyzed")
+            w("No dependencies found or analyzed\n")
         
-        lines.append("")
+        w("\n")
         
         # Details
         if results.get("dependencies"):
-            lines.append("Details:")
-            lines.append("--------")
+            w("Details:\n")
+            w("--------\n")
             
             # Sort dependencies by status (critical first, then warning, then ok)
-            sorted_deps = sorted(
-                results["dependencies"],
-                key=lambda d: {"CRITICAL": 0, "WARNING": 1, "OK": 2, "UNKNOWN": 3, "ERROR": 4}.get(d["status"], 5)
-            )
+            sorted_deps = self._sort_by_status(results["dependencies"])
             
             for dep in sorted_deps:
                 name = dep["name"]
                 version = dep["version"]
                 status = dep["status"]
-                eol_date = dep.get("eol_date")
-                days_remaining = dep.get("days_remaining")
                 recommended = dep.get("recommended_version")
                 has_breaking_changes = dep.get("has_breaking_changes", False)
                 
-                emoji = self.STATUS_EMOJIS.get(status, "❓")
-                
-                if status == "CRITICAL":
-                    if eol_date and days_remaining is not None:
-                        lines.append(f"{emoji} {name} {version} - EOL since {eol_date} ({abs(days_remaining)} days ago)")
-                    else:
-                        lines.append(f"{emoji} {name} {version} - Has reached end of life")
-                
-                elif status == "WARNING":
-                    if eol_date and days_remaining is not None:
-                        lines.append(f"{emoji} {name} {version} - EOL in {days_remaining} days ({eol_date})")
-                    else:
-                        lines.append(f"{emoji} {name} {version} - Will reach end of life soon")
-                
-                elif status == "OK":
-                    if eol_date and days_remaining is not None:
-                        lines.append(f"{emoji} {name} {version} - EOL in {days_remaining} days ({eol_date})")
-                    else:
-                        lines.append(f"{emoji} {name} {version} - No EOL date available")
-                
-                elif status == "UNKNOWN":
-                    lines.append(f"{emoji} {name} {version} - No EOL information available")
+                emoji = emoji_for(status, "❓")
                 
-                elif status == "ERROR":
-                    lines.append(f"{emoji} {name} {version} - Error checking EOL status: {dep.get('error', 'Unknown error')}")
+                describe = _STATUS_DESCRIBERS.get(status)
+                if describe is not None:
+                    w(f"{emoji} {name} {version} - {describe(dep)}\n")
                 
                 # Add recommendation if available
                 if recommended:
                     breaking_emoji = "⚠️ " if has_breaking_changes else ""
-                    lines.append(f"  → Recommended upgrade: {breaking_emoji}{name} {recommended}")
+                    w(f"  → Recommended upgrade: {breaking_emoji}{name} {recommended}\n")
                     if has_breaking_changes:
-                        lines.append(f"    ⚠️ Warning: This upgrade contains breaking changes (major version change)")
+                        w(f"    ⚠️ Warning: This upgrade contains breaking changes (major version change)\n")
                 
-                lines.append("")
+                w("\n")
         
-        return "\n".join(lines)
+        # Drop the newline after the last line
+        return buf.getvalue()[:-1]
@@ -4,15 +4,16 @@ Main UI module for the End of Life Checker.
 
 import os
 import sys
-import subprocess
 import streamlit as st
 
-from eol_check.ui.tabs.check_project import render_check_project_tab
-from eol_check.ui.tabs.cache_management import render_cache_management_tab
-from eol_check.ui.tabs.about import render_about_tab
-
 def run_ui():
     """Run the Streamlit UI."""
+    # Imported here so launching the UI from the CLI doesn't load the tabs
+    # in the launching process before the Streamlit server is running
+    from eol_check.ui.tabs.check_project import render_check_project_tab
+    from eol_check.ui.tabs.cache_management import render_cache_management_tab
+    from eol_check.ui.tabs.about import render_about_tab
+
     # Set Streamlit page config - MUST be the first Streamlit command
     st.set_page_config(
         page_title="End of Life Checker",
@@ -45,11 +46,25 @@ def run_ui():
 
 def main():
     """Entry point for the UI."""
+    script_path = os.path.abspath(__file__)
+
     try:
-        # 直接尝试启动 Streamlit
-        script_path = os.path.abspath(__file__)
-        cmd = ["streamlit", "run", script_path]
-        subprocess.run(cmd)
+        from streamlit.web import bootstrap
+    except ImportError:
+        bootstrap = None
+
+    try:
+        if bootstrap is not None:
+            # Serve the app from this process instead of starting a second
+            # interpreter through the streamlit command
+            bootstrap.load_config_options(flag_options={})
+            bootstrap.run(script_path, False, [], {})
+        else:
+            # 直接尝试启动 Streamlit
+            import subprocess
+
+            cmd = ["streamlit", "run", script_path]
+            subprocess.run(cmd)
 
     except Exception as e:
         print(f"Error launching UI: {e}")
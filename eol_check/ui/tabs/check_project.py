@@ -3,185 +3,385 @@ Check Project tab for the End of Life Checker UI.
 """
 
 import os
-import time
 from datetime import datetime
 
 import streamlit as st
 
-from eol_check.core import EOLChecker
-from eol_check.reporters import get_reporter
+# The checker, reporters and pandas are imported where they are first used,
+# so rendering the page doesn't wait for them before a check is run
 from eol_check.utils.logger import configure_logger
 from eol_check.ui.utils.cache_utils import parse_cache_ttl
 
+# Manifest and lock files in a project directory that the parsers read
+PROJECT_FILES = (
+    "requirements.txt",
+    "pyproject.toml",
+    "poetry.lock",
+    "Pipfile",
+    "Pipfile.lock",
+    "package.json",
+    "package-lock.json",
+    "yarn.lock",
+    "pom.xml",
+    "build.gradle",
+    "settings.gradle",
+    "gradle.lockfile",
+)
+
+# Cache TTL option matching the checker's defaults, under which the
+# product list keeps its shorter TTL
+DEFAULT_CACHE_TTL_VALUE = "1d"
+
+# Emoji shown next to each dependency status in the results table
+STATUS_EMOJIS = {
+    "CRITICAL": "🔴",
+    "WARNING": "🟠",
+    "OK": "🟢",
+    "UNKNOWN": "❓",
+    "ERROR": "⚠️",
+}
+
+
+@st.cache_resource
+def _dependency_columns():
+    """Column configuration of the dependencies table, built once per server."""
+    return {
+        "Status": st.column_config.TextColumn("Status"),
+        "Name": st.column_config.TextColumn("Name"),
+        "Version": st.column_config.TextColumn("Version"),
+        "EOL Date": st.column_config.TextColumn("EOL Date"),
+        "Days Remaining": st.column_config.TextColumn("Days Remaining"),
+        "Recommended": st.column_config.TextColumn("Recommended"),
+    }
+
+
+@st.cache_resource
+def _get_checker(
+    threshold_days,
+    offline_mode,
+    force_update,
+    verbose,
+    ignore_file,
+    cache_ttl,
+    max_workers,
+):
+    """Get an EOL checker, shared by all runs with the same options.
+
+    Reusing the checker keeps its in-memory API data, HTTP connections and
+    worker pool warm between runs.
+
+    Args:
+        threshold_days: Days before EOL to start warning
+        offline_mode: Use cached EOL data instead of fetching from endoflife.date
+        force_update: Force update of cached EOL data
+        verbose: Show detailed information about the checking process
+        ignore_file: Path to file containing dependencies to ignore
+        cache_ttl: Cache time-to-live in seconds
+        max_workers: Maximum number of parallel workers for API requests
+
+    Returns:
+        EOLChecker: Checker for these options.
+    """
+    from eol_check.core import EOLChecker
+
+    return EOLChecker(
+        threshold_days=threshold_days,
+        offline_mode=offline_mode,
+        force_update=force_update,
+        verbose=verbose,
+        ignore_file=ignore_file,
+        cache_ttl=cache_ttl,
+        max_workers=max_workers,
+    )
 
-def render_check_project_tab():
-    """Render the Check Project tab."""
-    st.header("Check Project")
 
-    # Project path input
-    project_path = st.text_input(
-        "Project Path :red[*]",
-        value=os.getcwd(),
-        help="Path to the project directory to check",
-    )
+def _project_files_signature(project_path, ignore_file):
+    """Identify the current state of the files a check reads.
 
-    # Options section
-    st.subheader("Options")
+    Besides the manifests at the project's top level, this covers the
+    build files the parsers read elsewhere, such as Maven submodule POMs
+    and Gradle subproject build scripts.
 
-    col_a, col_b, col_c = st.columns(3)
+    Args:
+        project_path: Path to the project directory
+        ignore_file: Path to the ignore file, if any
 
-    with col_a:
-        threshold = st.slider(
-            "Warning Threshold (days) :red[*]",
-            min_value=1,
-            max_value=365,
-            value=90,
-            help="Days before EOL to start warning",
-        )
+    Returns:
+        tuple: Path and modification time of each existing file.
+    """
+    from eol_check.parsers import get_parsers_for_project
 
-        format_options = ["text", "json", "csv", "html"]
-        output_format = st.selectbox(
-            "Output Format :red[*]",
-            options=format_options,
-            index=0,
-            help="Format for the output report",
-        )
+    paths = [os.path.join(project_path, name) for name in PROJECT_FILES]
+    for parser in get_parsers_for_project(project_path):
+        paths.extend(parser.build_files())
+    if ignore_file:
+        paths.append(ignore_file)
 
-        max_workers = st.number_input(
-            "Max Workers :red[*]",
-            min_value=1,
-            max_value=32,
-            value=8,
-            help="Maximum number of parallel workers for API requests",
-        )
+    signature = []
+    for path in dict.fromkeys(paths):
+        try:
+            signature.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            pass
+    return tuple(signature)
 
-    with col_b:
-        offline_mode = st.checkbox(
-            "Offline Mode",
-            value=False,
-            help="Use cached EOL data instead of fetching from endoflife.date",
-        )
 
-        force_update = st.checkbox(
-            "Force Update", value=False, help="Force update of cached EOL data"
-        )
+@st.cache_data(ttl=600, show_spinner=False)
+def _run_check(project_path, files_signature, checker_options):
+    """Check a project, reusing results of identical earlier checks.
 
-        verbose = st.checkbox(
-            "Verbose",
-            value=True,
-            help="Show detailed information about the checking process",
-        )
+    Args:
+        project_path: Path to the project directory
+        files_signature: State of the project's files, from
+            _project_files_signature, so any change to them runs a new check
+        checker_options: Keyword arguments for _get_checker
 
-    with col_c:
-        ttl_options = {
-            "30 days": "30d",
-            "7 days": "7d",
-            "3 days": "3d",
-            "1 day": "1d",
-            "12 hours": "12h",
-            "6 hours": "6h",
-            "1 hour": "1h",
-            "30 minutes": "30m",
-        }
-        cache_ttl = st.selectbox(
-            "Cache TTL :red[*]",
-            options=list(ttl_options.keys()),
-            index=3,
-            help="Cache time-to-live duration",
-        )
-        cache_ttl_value = ttl_options[cache_ttl]
+    Returns:
+        dict: Check results.
+    """
+    return _get_checker(**checker_options).check_project(project_path)
 
-        # Ignore file
-        ignore_file = st.text_input(
-            "Ignore File",
-            value="",
-            help="Path to file containing dependencies to ignore (one per line)",
-        )
 
-        # Output file
-        output_file = st.text_input(
-            "Output File",
-            value="",
-            help="Save report to file instead of displaying in UI (optional)",
+def reset_checks():
+    """Drop the shared checkers and the results of earlier checks.
+
+    The next check then starts afresh, e.g. after the ignore file was edited
+    or the EOL cache was cleared.
+    """
+    _get_checker.clear()
+    _run_check.clear()
+
+
+def _dependency_table(dependencies):
+    """Build the dependencies table shown below the report.
+
+    Columns are derived from the check results a whole column at a time.
+
+    Args:
+        dependencies: Dependency check results
+
+    Returns:
+        pandas.DataFrame: One row per dependency.
+    """
+    import pandas as pd
+
+    deps = pd.DataFrame.from_records(dependencies).reindex(
+        columns=[
+            "status", "name", "version", "eol_date", "days_remaining",
+            "recommended_version", "has_breaking_changes",
+        ]
+    )
+
+    status = deps["status"].astype(str)
+    days = pd.to_numeric(deps["days_remaining"], errors="coerce").astype("Int64")
+    days_suffix = (days < 0).fillna(False).map({True: " days ago", False: " days"})
+    breaking = deps["has_breaking_changes"].fillna(False).astype(bool)
+
+    return pd.DataFrame({
+        "Status": status.map(STATUS_EMOJIS).fillna("") + " " + status,
+        "Name": deps["name"],
+        "Version": deps["version"],
+        "EOL Date": deps["eol_date"].fillna(""),
+        "Days Remaining": (days.abs().astype(str) + days_suffix).where(days.notna(), ""),
+        "Recommended": (
+            deps["recommended_version"].fillna("").astype(str)
+            + breaking.map({True: " ⚠️", False: ""})
+        ).str.strip(),
+    })
+
+
+def render_check_project_tab():
+    """Render the Check Project tab."""
+    st.header("Check Project")
+
+    # Options are batched in a form, so changing them doesn't rerun the
+    # script until the check is run
+    with st.form("check_opts"):
+        # Project path input
+        project_path = st.text_input(
+            "Project Path :red[*]",
+            value=os.getcwd(),
+            help="Path to the project directory to check",
         )
 
-    # Command preview and run button
-    st.subheader("Run Check")
+        # Options section
+        st.subheader("Options")
+
+        col_a, col_b, col_c = st.columns(3)
+
+        with col_a:
+            threshold = st.slider(
+                "Warning Threshold (days) :red[*]",
+                min_value=1,
+                max_value=365,
+                value=90,
+                help="Days before EOL to start warning",
+            )
+
+            format_options = ["text", "json", "csv", "html"]
+            output_format = st.selectbox(
+                "Output Format :red[*]",
+                options=format_options,
+                index=0,
+                help="Format for the output report",
+            )
+
+            max_workers = st.number_input(
+                "Max Workers :red[*]",
+                min_value=1,
+                max_value=32,
+                value=8,
+                help="Maximum number of parallel workers for API requests",
+            )
+
+        with col_b:
+            offline_mode = st.checkbox(
+                "Offline Mode",
+                value=False,
+                help="Use cached EOL data instead of fetching from endoflife.date",
+            )
+
+            force_update = st.checkbox(
+                "Force Update", value=False, help="Force update of cached EOL data"
+            )
+
+            verbose = st.checkbox(
+                "Verbose",
+                value=True,
+                help="Show detailed information about the checking process",
+            )
+
+        with col_c:
+            ttl_options = {
+                "30 days": "30d",
+                "7 days": "7d",
+                "3 days": "3d",
+                "1 day": "1d",
+                "12 hours": "12h",
+                "6 hours": "6h",
+                "1 hour": "1h",
+                "30 minutes": "30m",
+            }
+            cache_ttl = st.selectbox(
+                "Cache TTL :red[*]",
+                options=list(ttl_options.keys()),
+                index=3,
+                help="Cache time-to-live duration. With 1 day, the endoflife.date product list is kept for 6 hours.",
+            )
+            cache_ttl_value = ttl_options[cache_ttl]
+
+            # Ignore file
+            ignore_file = st.text_input(
+                "Ignore File",
+                value="",
+                help="Path to file containing dependencies to ignore (one per line)",
+            )
+
+            # Output file
+            output_file = st.text_input(
+                "Output File",
+                value="",
+                help="Save report to file instead of displaying in UI (optional)",
+            )
+
+        run_button = st.form_submit_button("Run Check", type="primary")
+
+    # Command preview of the submitted options
+    st.subheader("CLI Command")
 
     col_cmd, col_btn = st.columns([3, 1])
 
     with col_cmd:
-        # Generate CLI command preview
-        cli_command = f"eol-check {project_path}"
+        # Generate CLI command preview, collecting the arguments and joining
+        # them once
+        cli_args = ["eol-check", project_path]
         if threshold != 90:
-            cli_command += f" --threshold {threshold}"
+            cli_args += ["--threshold", str(threshold)]
         if output_format != "text":
-            cli_command += f" --format {output_format}"
+            cli_args += ["--format", output_format]
         if offline_mode:
-            cli_command += " --offline"
+            cli_args.append("--offline")
         if force_update:
-            cli_command += " --update"
+            cli_args.append("--update")
         if verbose:
-            cli_command += " --verbose"
-        if cache_ttl_value != "1d":
-            cli_command += f" --cache-ttl {cache_ttl_value}"
+            cli_args.append("--verbose")
+        if cache_ttl_value != DEFAULT_CACHE_TTL_VALUE:
+            cli_args += ["--cache-ttl", cache_ttl_value]
         if ignore_file:
-            cli_command += f" --ignore-file {ignore_file}"
+            cli_args += ["--ignore-file", ignore_file]
         if output_file:
-            cli_command += f" --output {output_file}"
+            cli_args += ["--output", output_file]
         if max_workers != 8:
-            cli_command += f" --max-workers {max_workers}"
+            cli_args += ["--max-workers", str(max_workers)]
 
-        st.code(cli_command, language="bash")
+        st.code(" ".join(cli_args), language="bash")
 
     with col_btn:
-        run_button = st.button(
-            "Run Check", type="primary", use_container_width=True
-        )
+        if st.button(
+            "Reset Checker",
+            use_container_width=True,
+            help="Start the next check afresh with a new checker, e.g. after editing the ignore file",
+        ):
+            reset_checks()
 
     # Results section (displayed below the options)
     if run_button:
-        if not os.path.exists(project_path):
-            st.error(f"Project path '{project_path}' does not exist.")
+        if not os.path.isdir(project_path):
+            st.error(f"Project path '{project_path}' is not an existing directory.")
         else:
             with st.spinner("Checking dependencies..."):
                 try:
                     # Configure logger
                     configure_logger(verbose=verbose)
 
-                    # Initialize the checker
-                    checker = EOLChecker(
-                        threshold_days=threshold,
-                        offline_mode=offline_mode,
-                        force_update=force_update,
-                        verbose=verbose,
-                        ignore_file=ignore_file if ignore_file else None,
-                        cache_ttl=parse_cache_ttl(cache_ttl_value),
-                        max_workers=max_workers,
-                    )
-
-                    # Run the check
-                    start_time = time.time()
-                    results = checker.check_project(project_path)
-                    end_time = time.time()
-                    execution_time = end_time - start_time
-
+                    checker_options = {
+                        "threshold_days": threshold,
+                        "offline_mode": offline_mode,
+                        "force_update": force_update,
+                        "verbose": verbose,
+                        "ignore_file": ignore_file if ignore_file else None,
+                        # Leave the default to the checker, as the CLI does, so
+                        # its per-endpoint TTLs apply
+                        "cache_ttl": (
+                            None if cache_ttl_value == DEFAULT_CACHE_TTL_VALUE
+                            else parse_cache_ttl(cache_ttl_value)
+                        ),
+                        "max_workers": max_workers,
+                    }
+
+                    # Run the check. Unless fresh data is forced, a repeated
+                    # check of an unchanged project reuses the earlier results.
+                    if force_update:
+                        results = _get_checker(**checker_options).check_project(project_path)
+                    else:
+                        results = _run_check(
+                            project_path,
+                            _project_files_signature(project_path, checker_options["ignore_file"]),
+                            checker_options,
+                        )
                     # Generate the report
+                    from eol_check.reporters import get_reporter
+
                     reporter = get_reporter(output_format)
-                    report = reporter.generate_report(
-                        results=results,
-                        project_path=project_path,
-                        scan_date=datetime.now(),
-                        threshold_days=threshold,
-                        execution_time=execution_time,
-                    )
-
-                    # Save to file if specified
+                    report_args = {
+                        "results": results,
+                        "project_path": project_path,
+                        "scan_date": datetime.now(),
+                        "threshold_days": threshold,
+                        # Measured by the check itself, as results may be reused
+                        "execution_time": results.get("execution_time"),
+                    }
+
+                    # Save to file if specified, writing the report straight to it
                     if output_file:
                         with open(output_file, "w", encoding="utf-8") as f:
-                            f.write(report)
+                            reporter.generate_report_to(f, **report_args)
                         st.success(f"Report saved to {output_file}")
 
+                    # JSON results are displayed as they are, not as a report
+                    if output_format != "json":
+                        report = reporter.generate_report(**report_args)
+
                     # Display the report
                     st.subheader("Results")
 
@@ -231,58 +431,12 @@ def render_check_project_tab():
                         st.subheader("Dependencies")
 
                         # Prepare data for table
-                        table_data = []
-                        for dep in results["dependencies"]:
-                            status = dep["status"]
-                            status_emoji = {
-                                "CRITICAL": "🔴",
-                                "WARNING": "🟠",
-                                "OK": "🟢",
-                                "UNKNOWN": "❓",
-                                "ERROR": "⚠️",
-                            }.get(status, "")
-
-                            eol_date = dep.get("eol_date", "")
-                            days_remaining = dep.get("days_remaining")
-                            if days_remaining is not None:
-                                if days_remaining < 0:
-                                    days_text = f"{abs(days_remaining)} days ago"
-                                else:
-                                    days_text = f"{days_remaining} days"
-                            else:
-                                days_text = ""
-
-                            recommended = dep.get("recommended_version", "")
-                            has_breaking = (
-                                "⚠️" if dep.get("has_breaking_changes") else ""
-                            )
-
-                            table_data.append(
-                                {
-                                    "Status": f"{status_emoji} {status}",
-                                    "Name": dep["name"],
-                                    "Version": dep["version"],
-                                    "EOL Date": eol_date,
-                                    "Days Remaining": days_text,
-                                    "Recommended": f"{recommended} {has_breaking}".strip(),
-                                }
-                            )
+                        table_data = _dependency_table(results["dependencies"])
 
                         st.dataframe(
                             table_data,
                             use_container_width=True,
-                            column_config={
-                                "Status": st.column_config.TextColumn("Status"),
-                                "Name": st.column_config.TextColumn("Name"),
-                                "Version": st.column_config.TextColumn("Version"),
-                                "EOL Date": st.column_config.TextColumn("EOL Date"),
-                                "Days Remaining": st.column_config.TextColumn(
-                                    "Days Remaining"
-                                ),
-                                "Recommended": st.column_config.TextColumn(
-                                    "Recommended"
-                                ),
-                            },
+                            column_config=_dependency_columns(),
                         )
                 except Exception as e:
                     st.error(f"Error checking project: {e}")
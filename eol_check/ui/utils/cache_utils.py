@@ -2,91 +2,489 @@
 Cache utilities for the End of Life Checker UI.
 """
 
-import json
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import streamlit as st
 
-from eol_check.utils.cache import Cache
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
 
+from eol_check.utils import json_utils
+from eol_check.utils.cache import default_cache_dir
+from eol_check.utils.time_parser import parse_ttl
+
+# Maximum number of threads reading or removing cache files
+IO_MAX_WORKERS = 16
+
+# Content summary of cache entries for products that weren't found
+NOT_FOUND_CONTENT = "Empty (Not Found)"
+
+# Summaries of cache files already read, keyed by path. Each holds the
+# file's (mtime_ns, size) when read, its expiry time and its cache data item,
+# so a file is only parsed again once it changes.
+_SUMMARIES = {}
+
+# Fingerprints of watched cache directories, keyed by directory. An entry is
+# dropped as soon as anything in its directory changes, so while it is
+# present the directory doesn't need to be listed again.
+_FINGERPRINTS = {}
+
+# Observers watching cache directories, keyed by directory, and the number
+# of changes seen in each, guarded by _WATCH_LOCK
+_OBSERVERS = {}
+_CHANGES = {}
+_WATCH_LOCK = threading.Lock()
+
+
+def _read_cache_file(file_path, now, size=None, mtime_ns=None):
+    """Read and summarize one cache file.
+
+    When the file's modification time is given, its summary is kept and
+    reused, without reading the file, for as long as the file is unchanged.
+
+    Args:
+        file_path: Path to the cache file
+        now: Current time, for checking expiry
+        size: Size of the file in bytes, if known
+        mtime_ns: Modification time of the file in nanoseconds, if known
+
+    Returns:
+        tuple: Cache data item, or None, and error message, or None.
+    """
+    if mtime_ns is not None:
+        summary = _SUMMARIES.get(file_path)
+        if summary is not None and summary[0] == (mtime_ns, size):
+            return dict(summary[2], is_expired=summary[1] < now), None
+
+    filename = os.path.basename(file_path)
+    try:
+        with open(file_path, "rb") as f:
+            data = json_utils.load_file(f, size)
+
+        # Extract key information
+        key = filename.replace(".json", "").replace("_", "/")
+        expires_at = data.get("expires_at", 0)
+        # Kept as a datetime to the second, formatted only when displayed
+        expires_date = datetime.fromtimestamp(int(expires_at))
+        is_expired = expires_at < now
+
+        # Try to determine if this is product availability data
+        is_availability = "product_availability" in key
+
+        # For product availability, the value is a boolean
+        if is_availability:
+            is_available = data.get('value', False)
+            value_summary = f"API {'Available' if is_available else 'Unavailable'}"
+            item_type = "Product Availability"
+        else:
+            # For regular API data, summarize the content
+            value = data.get("value", {})
+            if isinstance(value, dict):
+                if not value:
+                    value_summary = NOT_FOUND_CONTENT
+                else:
+                    value_summary = f"{len(value)} items"
+            elif isinstance(value, list):
+                value_summary = f"{len(value)} versions"
+            else:
+                text = str(value)
+                value_summary = text[:50] + "..." if len(text) > 50 else text
+
+            item_type = "API Data"
+
+        item = {
+            "key": key,
+            "type": item_type,
+            "content": value_summary,
+            "expires_at": expires_date,
+            "is_expired": is_expired,
+            "file_path": file_path,
+        }
+        if mtime_ns is not None:
+            _SUMMARIES[file_path] = ((mtime_ns, size), expires_at, item)
+        return dict(item), None
+
+    except Exception as e:
+        return None, f"Error reading cache file {filename}: {e}"
+
+
+def _cache_dir_fingerprint(cache_dir):
+    """Identify the current state of the cache files in a directory.
+
+    Any file being added, removed or rewritten, even in place, changes the
+    fingerprint, which the directory's own modification time alone can miss.
+
+    Args:
+        cache_dir: Cache directory
+
+    Returns:
+        tuple: Sorted name, modification time in nanoseconds and size of
+        each cache file.
+    """
+    fingerprint = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                fingerprint.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    fingerprint.sort()
+    return tuple(fingerprint)
+
+
+class _CacheDirHandler(FileSystemEventHandler):
+    """Forget a cache directory's fingerprint whenever anything in it changes."""
+
+    def __init__(self, cache_dir):
+        super().__init__()
+        self.cache_dir = cache_dir
+
+    def _forget(self, event):
+        """Forget the fingerprint after a change to the cache directory.
+
+        Only creations, modifications, deletions and moves are handled, so
+        the open and close events of reading the cache files, which the
+        UI itself does, don't invalidate it.
+
+        Args:
+            event: Watchdog file system event
+        """
+        with _WATCH_LOCK:
+            _CHANGES[self.cache_dir] = _CHANGES.get(self.cache_dir, 0) + 1
+            _FINGERPRINTS.pop(self.cache_dir, None)
+
+    on_created = on_modified = on_deleted = on_moved = _forget
+
+
+def _watch_cache_dir(cache_dir):
+    """Start watching a cache directory for changes, if watchdog is installed.
+
+    Args:
+        cache_dir: Cache directory
+
+    Returns:
+        bool: True if the directory is being watched.
+    """
+    if Observer is None:
+        return False
+
+    with _WATCH_LOCK:
+        if cache_dir in _OBSERVERS:
+            return True
+
+        try:
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(_CacheDirHandler(cache_dir), cache_dir, recursive=False)
+            observer.start()
+        except Exception:
+            # e.g. the inotify watch limit is reached; fall back to listing
+            return False
+
+        _OBSERVERS[cache_dir] = observer
+        return True
+
+
+def _current_fingerprint(cache_dir):
+    """Get the fingerprint of a cache directory, listing it only if needed.
+
+    With watchdog installed, the directory is watched and its fingerprint
+    kept until a change is seen, so reruns with an unchanged cache don't
+    list the directory at all. Without it, the directory is listed on every
+    call.
+
+    Args:
+        cache_dir: Cache directory
+
+    Returns:
+        tuple: Fingerprint from _cache_dir_fingerprint.
+    """
+    fingerprint = _FINGERPRINTS.get(cache_dir)
+    if fingerprint is not None:
+        return fingerprint
+
+    if not _watch_cache_dir(cache_dir):
+        return _cache_dir_fingerprint(cache_dir)
+
+    changes = _CHANGES.get(cache_dir, 0)
+    fingerprint = _cache_dir_fingerprint(cache_dir)
+
+    # Only keep it if nothing changed while the directory was being listed
+    with _WATCH_LOCK:
+        if _CHANGES.get(cache_dir, 0) == changes:
+            _FINGERPRINTS[cache_dir] = fingerprint
+    return fingerprint
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _read_cache_dir(cache_dir, fingerprint, expired_only=False):
+    """Read and summarize the cache files in a directory.
+
+    Results are cached by Streamlit, keyed by the directory's fingerprint,
+    so reruns with unchanged cache files don't open any of them.
+
+    Files are read in a small thread pool, overlapping the time spent
+    waiting on the file system. Files unchanged since they were last read
+    reuse their earlier summaries instead.
+
+    The cache stamps each file's expiry time on it as its mtime, so a file
+    with an mtime in the future holds a valid entry. When only expired
+    entries are wanted, those files are skipped without being parsed.
+    Files with an mtime in the past may predate the stamping and are always
+    parsed.
+
+    Args:
+        cache_dir: Cache directory
+        fingerprint: Cache files in the directory, from _cache_dir_fingerprint
+        expired_only: Only read expired entries
+
+    Returns:
+        tuple: List of cache data items and list of error messages.
+    """
+    now = time.time()
+    now_ns = time.time_ns()
+
+    # The fingerprint's sizes save the reader a stat call per file
+    files = [
+        (os.path.join(cache_dir, name), size, mtime_ns)
+        for name, mtime_ns, size in fingerprint
+        if not (expired_only and mtime_ns > now_ns)
+    ]
+
+    # Forget summaries of files that are gone
+    if not expired_only:
+        for file_path in _SUMMARIES.keys() - {file[0] for file in files}:
+            _SUMMARIES.pop(file_path, None)
+
+    if not files:
+        return [], []
+
+    with ThreadPoolExecutor(max_workers=min(IO_MAX_WORKERS, len(files))) as executor:
+        results = list(executor.map(lambda file: _read_cache_file(file[0], now, *file[1:]), files))
+
+    cache_data = [
+        item for item, _ in results
+        if item is not None and (item["is_expired"] or not expired_only)
+    ]
+    errors = [error for _, error in results if error is not None]
+    return cache_data, errors
+
+
+def _load_from_cache_dir(read, expired_only):
+    """Read the cache directory with a cached reader, reporting problems.
+
+    A missing cache directory is left to the caller to report, keeping the
+    loaders free of UI output for that case.
+
+    Args:
+        read: _read_cache_dir or _read_cache_table
+        expired_only: Only load expired entries
 
-def load_cache_data():
-    """Load and display cache data.
-    
     Returns:
-        list: List of cache data items.
+        The reader's result, or None if there is no cache directory.
     """
-    cache = Cache()
-    cache_dir = cache.cache_dir
+    # Constructing a Cache would create the directory, so only look for it
+    cache_dir = default_cache_dir()
 
     if not os.path.exists(cache_dir):
-        st.warning(f"Cache directory does not exist: {cache_dir}")
-        return []
+        return None
+
+    result, errors = read(cache_dir, _current_fingerprint(cache_dir), expired_only)
 
-    cache_files = [f for f in os.listdir(cache_dir) if f.endswith(".json")]
+    for message in errors:
+        st.error(message)
 
-    if not cache_files:
+    if not len(result) and not errors and not expired_only:
         st.info("No cached data found.")
-        return []
 
-    cache_data = []
-    for filename in cache_files:
-        try:
-            file_path = os.path.join(cache_dir, filename)
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Extract key information
-            key = filename.replace(".json", "").replace("_", "/")
-            expires_at = data.get("expires_at", 0)
-            expires_date = datetime.fromtimestamp(expires_at).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
-            is_expired = expires_at < time.time()
-
-            # Try to determine if this is product availability data
-            is_availability = "product_availability" in key
-
-            # For product availability, the value is a boolean
-            if is_availability:
-                product_name = key.split("_")[-1]
-                is_available = data.get('value', False)
-                value_summary = f"API {'Available' if is_available else 'Unavailable'}"
-                item_type = "Product Availability"
-            else:
-                # For regular API data, summarize the content
-                value = data.get("value", {})
-                if isinstance(value, dict):
-                    if not value:
-                        value_summary = "Empty (Not Found)"
-                    else:
-                        value_summary = f"{len(value)} items"
-                elif isinstance(value, list):
-                    value_summary = f"{len(value)} versions"
-                else:
-                    value_summary = (
-                        str(value)[:50] + "..." if len(str(value)) > 50 else str(value)
-                    )
+    return result
+
+
+def load_cache_data(expired_only=False):
+    """Load and display cache data.
+
+    Args:
+        expired_only: Only load expired entries
+    
+    Returns:
+        list: List of cache data items, or None if there is no cache directory.
+    """
+    return _load_from_cache_dir(_read_cache_dir, expired_only)
+
 
-                item_type = "API Data"
+def load_cache_table(expired_only=False):
+    """Load cache data as the table shown in the Cache Management tab.
 
-            cache_data.append(
-                {
-                    "key": key,
-                    "type": item_type,
-                    "content": value_summary,
-                    "expires_at": expires_date,
-                    "is_expired": is_expired,
-                    "file_path": file_path,
-                }
-            )
+    Args:
+        expired_only: Only load expired entries
+
+    Returns:
+        pyarrow.Table: Table built by build_cache_table, or None if there is
+        no cache directory.
+    """
+    return _load_from_cache_dir(_read_cache_table, expired_only)
+
+
+# Status shown for each cache entry, keyed by its status filter
+CACHE_STATUSES = {
+    "Valid": "✅ Valid",
+    "Expired": "⏱️ Expired",
+    "Not Found": "❓ Not Found",
+}
+
+def build_cache_table(cache_data):
+    """Build the table of cache entries shown in the Cache Management tab.
+
+    The table is built as an Arrow table, which Streamlit sends to the
+    browser as is instead of converting it through pandas on every rerun,
+    and which can be filtered without going back to Python objects.
+
+    Args:
+        cache_data: List of cache data items
 
-        except Exception as e:
-            st.error(f"Error reading cache file {filename}: {e}")
+    Returns:
+        pyarrow.Table: Table with Status, Package, Content and Cache Expiry
+        columns.
+    """
+    # pyarrow comes with Streamlit; imported here as only this tab needs it
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    # Convert the items to columns in one go, then derive the displayed
+    # columns a whole column at a time. Statuses are dictionary-encoded, as
+    # there are only a few distinct ones, and expiry times kept as
+    # timestamps, keeping the table and what's sent to the browser small.
+    items = pa.Table.from_pylist(
+        cache_data,
+        schema=pa.schema(
+            [
+                ("key", pa.string()),
+                ("content", pa.string()),
+                ("expires_at", pa.timestamp("s")),
+                ("is_expired", pa.bool_()),
+            ]
+        ),
+    )
+    not_found = pc.equal(items["content"], NOT_FOUND_CONTENT)
+    statuses = pc.if_else(
+        not_found,
+        CACHE_STATUSES["Not Found"],
+        pc.if_else(items["is_expired"], CACHE_STATUSES["Expired"], CACHE_STATUSES["Valid"]),
+    )
+
+    return pa.table(
+        {
+            "Status": statuses.dictionary_encode(),
+            # Just the package name from the key
+            "Package": pc.replace_substring_regex(items["key"], r"^.*/", ""),
+            "Content": items["content"],
+            "Cache Expiry": items["expires_at"],
+        }
+    )
+
+
+@st.cache_resource
+def cache_table_columns():
+    """Column configuration of the cache table, built once per server.
+
+    Returns:
+        dict: Column configuration for st.dataframe.
+    """
+    return {
+        "Cache Expiry": st.column_config.DatetimeColumn(
+            "Cache Expiry", format="YYYY-MM-DD HH:mm:ss"
+        ),
+    }
 
-    return cache_data
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _read_cache_table(cache_dir, fingerprint, expired_only=False):
+    """Read the cache files in a directory into a cache table.
+
+    Like _read_cache_dir, results are cached by Streamlit, keyed by the
+    directory's fingerprint, so an unchanged cache's table is only built
+    once.
+
+    Args:
+        cache_dir: Cache directory
+        fingerprint: Cache files in the directory, from _cache_dir_fingerprint
+        expired_only: Only read expired entries
+
+    Returns:
+        tuple: Table built by build_cache_table and list of error messages.
+    """
+    cache_data, errors = _read_cache_dir(cache_dir, fingerprint, expired_only)
+    return build_cache_table(cache_data), errors
+
+
+def bucket_cache_table(cache_table):
+    """Split the cache table into the rows shown by each status filter.
+
+    Done once when the cache data is loaded, so changing the filter only
+    looks up its rows instead of filtering the table again.
+
+    Args:
+        cache_table: Table built by build_cache_table
+
+    Returns:
+        dict: Table of rows for each filter, keyed by filter name.
+    """
+    import pyarrow.compute as pc
+
+    statuses = cache_table["Status"]
+    return {
+        "All": cache_table,
+        "Valid": cache_table.filter(pc.equal(statuses, CACHE_STATUSES["Valid"])),
+        "Not Found": cache_table.filter(pc.equal(statuses, CACHE_STATUSES["Not Found"])),
+    }
+
+
+def _remove_file(file_path):
+    """Remove a file if it still exists.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        bool: True if the file was removed.
+    """
+    try:
+        os.unlink(file_path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def remove_cache_files(file_paths):
+    """Remove cache files, several at a time.
+
+    Args:
+        file_paths: Paths to the cache files
+
+    Returns:
+        int: Number of files removed.
+    """
+    if not file_paths:
+        return 0
+
+    with ThreadPoolExecutor(max_workers=min(IO_MAX_WORKERS, len(file_paths))) as executor:
+        return sum(executor.map(_remove_file, file_paths))
+
+
+def clear_loaded_cache_data():
+    """Drop cache data kept from earlier load_cache_data and load_cache_table calls."""
+    _read_cache_dir.clear()
+    _read_cache_table.clear()
 
 
 def parse_cache_ttl(value):
@@ -98,23 +496,7 @@ def parse_cache_ttl(value):
     Returns:
         Cache TTL in seconds
     """
-    if value.endswith("d"):
-        try:
-            days = int(value[:-1])
-            return days * 24 * 60 * 60
-        except ValueError:
-            pass
-    elif value.endswith("h"):
-        try:
-            hours = int(value[:-1])
-            return hours * 60 * 60
-        except ValueError:
-            pass
-    elif value.endswith("m"):
-        try:
-            minutes = int(value[:-1])
-            return minutes * 60
-        except ValueError:
-            pass
-
-    return 24 * 60 * 60  # Default to 1 day
+    seconds = parse_ttl(value)
+    if seconds is None:
+        return 24 * 60 * 60  # Default to 1 day
+    return seconds
@@ -2,17 +2,52 @@
 Cache utility for storing API responses.
 """
 
-import json
+import atexit
 import os
+import threading
 import time
-from typing import Any, Dict, Optional
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
 
-from eol_check.utils.logger import debug, info
+from eol_check.utils import json_utils
+from eol_check.utils.logger import debug, info, is_debug_enabled
+
+# Translation table mapping characters not allowed in cache filenames to "_"
+_FILENAME_TRANS = str.maketrans("/:", "__")
+
+# Caches with writes not yet flushed to disk, flushed on interpreter exit
+_unflushed_caches: "weakref.WeakSet[Cache]" = weakref.WeakSet()
+
+
+def default_cache_dir() -> str:
+    """Return the cache directory used when none is given, without creating it.
+    
+    Returns:
+        Path of ~/.cache/eol-check/
+    """
+    return os.path.join(os.path.expanduser("~"), ".cache", "eol-check")
+
+
+@atexit.register
+def _flush_all() -> None:
+    """Flush pending writes of every cache instance."""
+    for cache in list(_unflushed_caches):
+        cache.flush()
 
 
 class Cache:
     """Simple file-based cache for API responses."""
     
+    # Maximum number of entries kept in memory in front of the cache files
+    MEMORY_MAXSIZE = 4096
+    
+    # Number of pending writes that triggers a flush to disk
+    WRITE_BATCH_SIZE = 64
+    
+    # Serialized entries larger than this many bytes are stored gzip-compressed
+    COMPRESS_THRESHOLD = 8192
+    
     def __init__(self, cache_dir: Optional[str] = None):
         """Initialize the cache.
         
@@ -20,13 +55,24 @@ class Cache:
             cache_dir: Directory to store cache files. Defaults to ~/.cache/eol-check/
         """
         if cache_dir is None:
-            home_dir = os.path.expanduser("~")
-            cache_dir = os.path.join(home_dir, ".cache", "eol-check")
+            cache_dir = default_cache_dir()
         
         self.cache_dir = cache_dir
         
         # Create cache directory if it doesn't exist
         os.makedirs(self.cache_dir, exist_ok=True)
+        
+        # Prefix of every cache file path, so paths are built by concatenation
+        self._path_prefix = os.path.join(self.cache_dir, "")
+        
+        # Recently used entries keyed by cache file path, so repeated lookups
+        # skip reading and parsing the file. Entries keep their "expires_at",
+        # so expiry is still checked on every get.
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+        
+        # Entries written with set() but not yet flushed, keyed by file path
+        self._pending: Dict[str, Dict[str, Any]] = {}
     
     def _get_cache_path(self, key: str) -> str:
         """Get the file path for a cache key.
@@ -38,53 +84,153 @@ class Cache:
             Path to cache file
         """
         # Convert key to a valid filename
-        filename = key.replace("/", "_").replace(":", "_")
+        filename = key.translate(_FILENAME_TRANS)
         
         # Remove .json extension if it's already in the key to avoid double extension
         if filename.endswith(".json"):
             filename = filename[:-5]
             
-        return os.path.join(self.cache_dir, f"{filename}.json")
+        return f"{self._path_prefix}{filename}.json"
     
-    def get(self, key: str) -> Optional[Any]:
-        """Get a value from the cache.
+    def _remember(self, cache_path: str, cache_data: Dict[str, Any]) -> None:
+        """Store a cache entry in memory, evicting the least recently used one.
+        
+        Args:
+            cache_path: Path to the cache file
+            cache_data: Cache entry
+        """
+        with self._memory_lock:
+            self._memory[cache_path] = cache_data
+            self._memory.move_to_end(cache_path)
+            if len(self._memory) > self.MEMORY_MAXSIZE:
+                self._memory.popitem(last=False)
+    
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read the raw cache entry for a key, ignoring expiry.
         
         Args:
             key: Cache key
             
         Returns:
-            Cached value or None if not found or expired
+            Cache entry with "value" and "expires_at", or None if not found
         """
         cache_path = self._get_cache_path(key)
         
-        if not os.path.exists(cache_path):
-            debug(f"Cache miss for {key} (file not found)")
+        with self._memory_lock:
+            cache_data = self._memory.get(cache_path) or self._pending.get(cache_path)
+            if cache_data is not None:
+                if cache_path in self._memory:
+                    self._memory.move_to_end(cache_path)
+                return cache_data
+        
+        # Open directly rather than checking existence first, saving a stat call
+        try:
+            with open(cache_path, "rb") as f:
+                cache_data = json_utils.load_file(f)
+        except FileNotFoundError:
+            debug("Cache miss for %s (file not found)", key)
+            return None
+        except Exception as e:
+            debug(f"Error reading cache for {key}: {e}")
             return None
         
+        self._remember(cache_path, cache_data)
+        return cache_data
+    
+    def preload(self, keys: Iterable[str]) -> int:
+        """Read the cache entries for several keys into memory in one pass.
+        
+        Keys without a cache file are skipped using a single directory scan,
+        rather than a failed open per key, and the rest are read one after
+        another so later lookups are served from memory.
+        
+        Args:
+            keys: Cache keys expected to be looked up soon
+            
+        Returns:
+            Number of entries loaded
+        """
         try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
+            with os.scandir(self.cache_dir) as entries:
+                existing = {entry.path for entry in entries}
+        except OSError as e:
+            debug(f"Error scanning cache directory {self.cache_dir}: {e}")
+            return 0
+        
+        loaded = 0
+        for key in keys:
+            if self._get_cache_path(key) in existing and self._read(key) is not None:
+                loaded += 1
+        return loaded
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value from the cache.
+        
+        Args:
+            key: Cache key
             
+        Returns:
+            Cached value or None if not found or expired
+        """
+        cache_data = self._read(key)
+        if cache_data is None:
+            return None
+        
+        try:
             # Check if cache is expired
             if "expires_at" in cache_data and cache_data["expires_at"] < time.time():
-                debug(f"Cache expired for {key} (expired at {time.ctime(cache_data['expires_at'])})")
+                if is_debug_enabled():
+                    debug(f"Cache expired for {key} (expired at {time.ctime(cache_data['expires_at'])})")
                 return None
             
             # Cache hit
-            debug(f"Cache hit for {key} (expires at {time.ctime(cache_data['expires_at'])})")
+            if is_debug_enabled():
+                debug(f"Cache hit for {key} (expires at {time.ctime(cache_data['expires_at'])})")
             return cache_data["value"]
         
         except Exception as e:
             debug(f"Error reading cache for {key}: {e}")
             return None
     
-    def set(self, key: str, value: Any, ttl: int = 86400) -> None:
+    def get_stale(self, key: str) -> Optional[Any]:
+        """Get a value from the cache even if it has expired.
+        
+        Used as a fallback when fresh data cannot be fetched.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value or None if not found
+        """
+        cache_data = self._read(key)
+        if cache_data is None:
+            return None
+        return cache_data.get("value")
+    
+    def get_metadata(self, key: str) -> Dict[str, Any]:
+        """Get the metadata stored alongside a value, even if it has expired.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Metadata dictionary, empty if not found
+        """
+        cache_data = self._read(key)
+        if cache_data is None:
+            return {}
+        return cache_data.get("metadata") or {}
+    
+    def set(self, key: str, value: Any, ttl: int = 86400, metadata: Optional[Dict[str, Any]] = None) -> None:
         """Set a value in the cache.
         
         Args:
             key: Cache key
             value: Value to cache
             ttl: Time to live in seconds (default: 1 day)
+            metadata: Optional extra data to store with the value, such as
+                HTTP validators used to revalidate it
         """
         cache_path = self._get_cache_path(key)
         
@@ -92,22 +238,84 @@ class Cache:
             "value": value,
             "expires_at": time.time() + ttl,
         }
+        if metadata:
+            cache_data["metadata"] = metadata
         
-        try:
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f)
+        self._remember(cache_path, cache_data)
+        
+        # Writes are batched; flush() writes them out
+        with self._memory_lock:
+            self._pending[cache_path] = cache_data
+            batch_full = len(self._pending) >= self.WRITE_BATCH_SIZE
+        _unflushed_caches.add(self)
+        
+        if is_debug_enabled():
             debug(f"Cache updated for {key} (expires at {time.ctime(cache_data['expires_at'])})")
-        except Exception as e:
-            debug(f"Error writing cache for {key}: {e}")
-            # Ignore cache write errors
-            pass
+        
+        if batch_full:
+            self.flush()
     
-    def clear(self) -> None:
-        """Clear all cached data."""
-        for filename in os.listdir(self.cache_dir):
-            if filename.endswith(".json"):
+    def flush(self) -> None:
+        """Write all pending cache entries to disk."""
+        with self._memory_lock:
+            pending = self._pending
+            self._pending = {}
+        
+        for cache_path, cache_data in pending.items():
+            # Write to a temporary file and rename it over the cache file, so
+            # an interrupted write never leaves a truncated entry behind
+            tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                blob = json_utils.dumps(cache_data)
+                if len(blob) > self.COMPRESS_THRESHOLD:
+                    blob = json_utils.compress(blob)
+                with open(tmp_path, "wb") as f:
+                    f.write(blob)
+                # Stamp the entry's expiry time on the file as its mtime, so
+                # valid entries can be told apart without parsing them
+                os.utime(tmp_path, (time.time(), cache_data["expires_at"]))
+                os.replace(tmp_path, cache_path)
+            except Exception as e:
+                debug(f"Error writing cache file {cache_path}: {e}")
+                # Ignore cache write errors
                 try:
-                    os.remove(os.path.join(self.cache_dir, filename))
-                except Exception:
+                    os.remove(tmp_path)
+                except OSError:
                     pass
+    
+    def sync(self) -> None:
+        """Write all pending cache entries to disk and make them durable.
+        
+        Files are not synced one by one; instead the cache directory is
+        synced once, committing all renames made by flush() together.
+        """
+        self.flush()
+        
+        try:
+            dir_fd = os.open(self.cache_dir, os.O_RDONLY)
+        except OSError as e:
+            # Directories can't be opened on some platforms, e.g. Windows
+            debug(f"Could not open cache directory for syncing: {e}")
+            return
+        
+        try:
+            os.fsync(dir_fd)
+        except OSError as e:
+            debug(f"Error syncing cache directory {self.cache_dir}: {e}")
+        finally:
+            os.close(dir_fd)
+    
+    def clear(self) -> None:
+        """Clear all cached data."""
+        with self._memory_lock:
+            self._memory.clear()
+            self._pending.clear()
+        
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith((".json", ".tmp")):
+                    try:
+                        os.remove(entry.path)
+                    except Exception:
+                        pass
         info(f"Cache cleared from {self.cache_dir}")
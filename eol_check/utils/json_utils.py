@@ -0,0 +1,142 @@
+"""
+JSON helpers that use orjson when it is available.
+"""
+
+import json
+import mmap
+import os
+import zlib
+from typing import Any, BinaryIO, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Files larger than this are memory-mapped instead of read into a bytes copy.
+# Below it, setting up the mapping costs more than copying the file.
+MMAP_THRESHOLD = 64 * 1024
+
+# First bytes of a gzip stream, which no JSON document can start with
+GZIP_MAGIC = b"\x1f\x8b"
+
+# zlib window bits value that selects the gzip container format
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document.
+    
+    Uses orjson if installed, falling back to the standard library.
+    
+    Args:
+        data: JSON document as str or bytes
+        
+    Returns:
+        Parsed Python object
+        
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to a UTF-8 encoded JSON document.
+    
+    Uses orjson if installed, falling back to the standard library.
+    
+    Args:
+        obj: Python object to serialize
+        
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # Match orjson's compact output, which keeps cache files small
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps_indented(obj: Any) -> str:
+    """Serialize an object to a human-readable JSON string.
+    
+    Uses orjson if installed, falling back to the standard library. Output is
+    indented by two spaces either way.
+    
+    Args:
+        obj: Python object to serialize
+        
+    Returns:
+        Indented JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
+
+def dumps_indented_bytes(obj: Any) -> bytes:
+    """Serialize an object to a human-readable, UTF-8 encoded JSON document.
+    
+    Like dumps_indented(), but for writing to binary files: with orjson
+    installed the document is never built as a str.
+    
+    Args:
+        obj: Python object to serialize
+        
+    Returns:
+        Indented JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def compress(data: bytes) -> bytes:
+    """Compress a serialized JSON document with gzip.
+    
+    Args:
+        data: JSON document as bytes
+        
+    Returns:
+        gzip-compressed document, which load_file() reads transparently
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, _GZIP_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def load_file(f: BinaryIO, size: Optional[int] = None) -> Any:
+    """Parse a JSON document from a file opened in binary mode.
+    
+    gzip-compressed files, as written with compress(), are decompressed
+    first. With orjson installed, larger uncompressed files are
+    memory-mapped and parsed in place, avoiding a copy of the whole file into
+    a bytes object.
+    
+    Args:
+        f: File object opened in binary mode
+        size: Size of the file in bytes, if already known from a directory
+            scan, saving a stat call
+        
+    Returns:
+        Parsed Python object
+        
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+        zlib.error: If a compressed document is corrupt
+    """
+    if orjson is not None:
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        if size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm[:2] != GZIP_MAGIC:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+    
+    data = f.read()
+    if data[:2] == GZIP_MAGIC:
+        data = zlib.decompress(data, _GZIP_WBITS)
+    return loads(data)
@@ -3,6 +3,7 @@ Logging utility for the End of Life Checker.
 """
 
 import logging
+import os
 import sys
 from typing import Optional
 
@@ -21,77 +22,91 @@ console_handler.setFormatter(formatter)
 # Add handler to logger
 logger.addHandler(console_handler)
 
-# Flag to track if logger has been configured
-_logger_configured = False
-
 
 def configure_logger(verbose: bool = False, log_file: Optional[str] = None):
     """Configure the logger.
     
+    Can be called again to change the configuration; a log file is only
+    attached once.
+    
     Args:
         verbose: If True, set log level to DEBUG
         log_file: Path to log file (optional)
     """
-    global _logger_configured
-    
-    if _logger_configured:
-        return
+    level = logging.DEBUG if verbose else logging.INFO
     
     # Set log level based on verbose flag
-    if verbose:
-        logger.setLevel(logging.DEBUG)
-        console_handler.setLevel(logging.DEBUG)
+    logger.setLevel(level)
+    console_handler.setLevel(level)
     
     # Add file handler if log file is specified
     if log_file:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG if verbose else logging.INFO)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        log_path = os.path.abspath(log_file)
+        for handler in logger.handlers:
+            if isinstance(handler, logging.FileHandler) and handler.baseFilename == log_path:
+                file_handler = handler
+                break
+        else:
+            file_handler = logging.FileHandler(log_file)
+            file_handler.setFormatter(formatter)
+            logger.addHandler(file_handler)
+        file_handler.setLevel(level)
+
+
+def is_debug_enabled() -> bool:
+    """Check whether debug messages are currently logged.
     
-    _logger_configured = True
+    Returns:
+        True if the logger is at DEBUG level
+    """
+    return logger.isEnabledFor(logging.DEBUG)
 
 
-def debug(message: str):
+def debug(message: str, *args):
     """Log a debug message.
     
     Args:
         message: Message to log
+        *args: Values %-formatted into the message, only if it is logged
     """
-    logger.debug(message)
+    logger.debug(message, *args)
 
 
-def info(message: str):
+def info(message: str, *args):
     """Log an info message.
     
     Args:
         message: Message to log
+        *args: Values %-formatted into the message, only if it is logged
     """
-    logger.info(message)
+    logger.info(message, *args)
 
 
-def warning(message: str):
+def warning(message: str, *args):
     """Log a warning message.
     
     Args:
         message: Message to log
+        *args: Values %-formatted into the message, only if it is logged
     """
-    logger.warning(message)
+    logger.warning(message, *args)
 
 
-def error(message: str):
+def error(message: str, *args):
     """Log an error message.
     
     Args:
         message: Message to log
+        *args: Values %-formatted into the message, only if it is logged
     """
-    logger.error(message)
+    logger.error(message, *args)
 
 
-def critical(message: str):
+def critical(message: str, *args):
     """Log a critical message.
     
     Args:
         message: Message to log
+        *args: Values %-formatted into the message, only if it is logged
     """
-    logger.critical(message)
+    logger.critical(message, *args)
@@ -5,7 +5,8 @@ Request pool for parallel API requests.
 import concurrent.futures
 import multiprocessing
 import os
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Generic
+import weakref
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar, Generic
 
 T = TypeVar('T')
 
@@ -20,12 +21,23 @@ class RequestPool:
             max_workers: Maximum number of worker threads. Defaults to CPU count * 2.
         """
         if max_workers is None:
-            # Default to CPU count * 2
-            max_workers = os.cpu_count() * 2 if os.cpu_count() else 4
+            max_workers = self.default_max_workers()
         
         self.max_workers = max_workers
         self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
-        self._futures = []
+        
+        # Futures drop out of this set once nothing else references them, so a
+        # long-lived pool doesn't accumulate every task it has ever run
+        self._futures: "weakref.WeakSet[concurrent.futures.Future]" = weakref.WeakSet()
+    
+    @staticmethod
+    def default_max_workers() -> int:
+        """Get the number of worker threads used when none is configured.
+        
+        Returns:
+            CPU count * 2, or 4 if the CPU count is unknown
+        """
+        return os.cpu_count() * 2 if os.cpu_count() else 4
     
     def map(self, func: Callable[[Any], T], items: List[Any]) -> List[T]:
         """Execute a function for each item in parallel.
@@ -52,6 +64,21 @@ class RequestPool:
         
         return results
     
+    def imap(self, func: Callable[[Any], T], items: Iterable[Any]) -> Iterator[T]:
+        """Execute a function for each item in parallel, yielding results.
+        
+        Results are yielded in the order of the items as soon as each one is
+        ready. Unlike map(), exceptions raised by func propagate.
+        
+        Args:
+            func: Function to execute
+            items: Items to process
+            
+        Returns:
+            Iterator over the results
+        """
+        return self._executor.map(func, items)
+    
     def submit(self, func: Callable[[Any], T], *args, **kwargs) -> concurrent.futures.Future:
         """Submit a task to the pool.
         
@@ -64,12 +91,16 @@ class RequestPool:
             Future object
         """
         future = self._executor.submit(func, *args, **kwargs)
-        self._futures.append(future)
+        self._futures.add(future)
         return future
     
     def wait_for_completion(self):
-        """Wait for all submitted tasks to complete."""
-        concurrent.futures.wait(self._futures)
+        """Wait for all submitted tasks that are still referenced to complete.
+        
+        Only tasks from submit() are waited for; results from imap() are
+        waited for by iterating over them.
+        """
+        concurrent.futures.wait(list(self._futures))
     
     def shutdown(self):
         """Shutdown the executor."""
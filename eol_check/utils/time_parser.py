@@ -2,10 +2,26 @@
 Utility for parsing time duration strings.
 """
 
+import functools
 import re
 from typing import Optional
 
+# Time units in seconds, keyed by their suffix
+_UNITS = {
+    'd': 86400,  # days
+    'h': 3600,   # hours
+    'm': 60,     # minutes
+    's': 1       # seconds
+}
 
+# One time component of a duration, e.g. "12h"
+_DURATION_RE = re.compile(r'(\d+)([dhms])')
+
+# Seconds in each cache TTL unit, keyed by its suffix
+TTL_UNIT_SECONDS = {"d": 24 * 60 * 60, "h": 60 * 60, "m": 60}
+
+
+@functools.lru_cache(maxsize=128)
 def parse_duration(duration_str: str) -> Optional[int]:
     """Parse a duration string into seconds.
     
@@ -33,28 +49,43 @@ def parse_duration(duration_str: str) -> Optional[int]:
     if duration_str.isdigit():
         return int(duration_str)
     
-    # Define time units in seconds
-    units = {
-        'd': 86400,  # days
-        'h': 3600,   # hours
-        'm': 60,     # minutes
-        's': 1       # seconds
-    }
-    
     # Extract all time components
-    pattern = r'(\d+)([dhms])'
-    matches = re.findall(pattern, duration_str)
+    matches = _DURATION_RE.findall(duration_str)
     
     if not matches:
         return None
     
     total_seconds = 0
     for value, unit in matches:
-        total_seconds += int(value) * units[unit]
+        total_seconds += int(value) * _UNITS[unit]
     
     return total_seconds
 
 
+@functools.lru_cache(maxsize=128)
+def parse_ttl(value: str) -> Optional[int]:
+    """Parse a cache TTL string into seconds.
+    
+    Unlike parse_duration, a TTL is a single number with a day, hour or
+    minute suffix. Shared by the CLI and the UI, neither of which needs to
+    import the other's dependencies for it.
+    
+    Args:
+        value: Cache TTL string (e.g., "1d", "12h", "30m")
+        
+    Returns:
+        Cache TTL in seconds or None if invalid format
+    """
+    unit_seconds = TTL_UNIT_SECONDS.get(value[-1:])
+    if unit_seconds is not None:
+        try:
+            return int(value[:-1]) * unit_seconds
+        except ValueError:
+            pass
+    
+    return None
+
+
 def format_duration(seconds: int) -> str:
     """Format seconds into a human-readable duration string.
     
@@ -2,24 +2,31 @@
 Version utility functions.
 """
 
+import functools
 import re
-from typing import List, Optional, Tuple
+from typing import Optional, Tuple
 
+# Runs of digits in a version string
+_VERSION_PARTS_RE = re.compile(r'\d+')
 
-def parse_version(version_str: str) -> List[int]:
-    """Parse a version string into a list of integers.
+# Leading major.minor of a version string
+_MAJOR_MINOR_RE = re.compile(r'^(\d+\.\d+)')
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_version(version_str: str) -> Tuple[int, ...]:
+    """Parse a version string into a tuple of integers.
+    
+    Results are memoized, as a project only has a few distinct versions.
     
     Args:
         version_str: Version string (e.g., "1.2.3")
         
     Returns:
-        List of integers (e.g., [1, 2, 3])
+        Tuple of integers (e.g., (1, 2, 3))
     """
-    # Extract numbers from version string
-    parts = re.findall(r'\d+', version_str)
-    
-    # Convert to integers
-    return [int(part) for part in parts]
+    # Extract numbers from version string and convert them to integers
+    return tuple(int(part) for part in _VERSION_PARTS_RE.findall(version_str))
 
 
 def compare_versions(version1: str, version2: str) -> int:
@@ -35,19 +42,15 @@ def compare_versions(version1: str, version2: str) -> int:
     v1_parts = parse_version(version1)
     v2_parts = parse_version(version2)
     
-    # Compare parts
-    for i in range(max(len(v1_parts), len(v2_parts))):
-        v1_part = v1_parts[i] if i < len(v1_parts) else 0
-        v2_part = v2_parts[i] if i < len(v2_parts) else 0
-        
-        if v1_part < v2_part:
-            return -1
-        elif v1_part > v2_part:
-            return 1
+    # Pad the shorter version with zeros and let tuple comparison do the rest
+    length = max(len(v1_parts), len(v2_parts))
+    v1_parts += (0,) * (length - len(v1_parts))
+    v2_parts += (0,) * (length - len(v2_parts))
     
-    return 0
+    return (v1_parts > v2_parts) - (v1_parts < v2_parts)
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_version(version_str: str) -> str:
     """Normalize a version string.
     
@@ -57,16 +60,14 @@ def normalize_version(version_str: str) -> str:
     Returns:
         Normalized version string
     """
-    # Remove common prefixes
-    version_str = re.sub(r'^v', '', version_str)
-    
-    # Extract version numbers
+    # Extract version numbers, which also drops prefixes such as "v"
     parts = parse_version(version_str)
     
     # Join with dots
     return ".".join(str(part) for part in parts)
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_major_minor(version: str) -> str:
     """Extract major.minor version from a version string.
     
@@ -77,12 +78,13 @@ def extract_major_minor(version: str) -> str:
         Major.minor version (e.g., "2.7")
     """
     # Extract first two version components (major.minor)
-    match = re.match(r'^(\d+\.\d+)', version)
+    match = _MAJOR_MINOR_RE.match(version)
     if match:
         return match.group(1)
     return version
 
 
+@functools.lru_cache(maxsize=4096)
 def has_major_version_change(current_version: str, recommended_version: str) -> bool:
     """Check if there is a major version change between two versions.
     
@@ -95,6 +97,15 @@ def has_major_version_change(current_version: str, recommended_version: str) ->
     """
     if not current_version or not recommended_version:
         return False
+    
+    if current_version == recommended_version:
+        return False
+    
+    # Fast path for the common dotted-numeric case, e.g. "2.7.16"
+    current_major = current_version.lstrip("v").partition(".")[0]
+    recommended_major = recommended_version.lstrip("v").partition(".")[0]
+    if current_major.isdecimal() and recommended_major.isdecimal():
+        return int(current_major) != int(recommended_major)
         
     current_parts = parse_version(current_version)
     recommended_parts = parse_version(recommended_version)
@@ -0,0 +1,76 @@
+"""
+Tests for the command line interface.
+"""
+
+import csv
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from eol_check import cli
+
+
+class CliReportTest(unittest.TestCase):
+    """Run the CLI end to end on a small offline project."""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        
+        # Keep the EOL cache out of the real home directory
+        home = os.path.join(self.tmp_dir.name, "home")
+        patcher = mock.patch.dict(os.environ, {"HOME": home, "USERPROFILE": home})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.project_path = os.path.join(self.tmp_dir.name, "project")
+        os.makedirs(self.project_path)
+        with open(os.path.join(self.project_path, "requirements.txt"), "w") as f:
+            f.write("requests==2.25.0\n")
+    
+    def run_cli(self, *args):
+        """Run the CLI with the given arguments.
+        
+        Returns:
+            Tuple of (exit code, standard output)
+        """
+        argv = ["eol-check", self.project_path, "--offline", "--direct-only", *args]
+        stdout = io.StringIO()
+        with mock.patch.object(sys, "argv", argv), redirect_stdout(stdout):
+            with self.assertRaises(SystemExit) as cm:
+                cli.main()
+        return cm.exception.code, stdout.getvalue()
+    
+    def test_csv_report(self):
+        code, output = self.run_cli("--format", "csv")
+        
+        self.assertEqual(code, 0)
+        # Progress messages are printed to stdout ahead of the report
+        report = output[output.index("Project,Name"):]
+        rows = list(csv.reader(io.StringIO(report, newline="")))
+        self.assertEqual(rows[0][:3], ["Project", "Name", "Version"])
+        self.assertIn(["requests", "2.25.0"], [row[1:3] for row in rows[1:]])
+    
+    def test_csv_report_to_file(self):
+        output_path = os.path.join(self.tmp_dir.name, "report.csv")
+        code, _ = self.run_cli("--format", "csv", "--output", output_path)
+        
+        self.assertEqual(code, 0)
+        with open(output_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        self.assertIn(["requests", "2.25.0"], [row[1:3] for row in rows[1:]])
+    
+    def test_every_format(self):
+        for format_name in ("text", "json", "csv", "html"):
+            with self.subTest(format=format_name):
+                code, output = self.run_cli("--format", format_name)
+                self.assertEqual(code, 0)
+                self.assertIn("requests", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
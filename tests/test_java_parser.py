@@ -0,0 +1,199 @@
+"""
+Tests for the Maven and Gradle dependency tree parsers.
+"""
+
+import os
+import stat
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from eol_check.parsers import java
+from eol_check.parsers.java import GradleParser, MavenParser
+
+# jackson-databind is declared directly and also pulled in by
+# spring-boot-starter-web, which is listed first
+MAVEN_TREE = """\
+[INFO] com.example:app:jar:1.0
+[INFO] +- org.springframework.boot:spring-boot-starter-web:jar:3.1.0:compile
+[INFO] |  \\- com.fasterxml.jackson.core:jackson-databind:jar:2.15.0:compile
+[INFO] \\- com.fasterxml.jackson.core:jackson-databind:jar:2.15.0:compile
+"""
+
+GRADLE_TREE = """\
++--- org.springframework.boot:spring-boot-starter-web:3.1.0
+|    +--- com.fasterxml.jackson.core:jackson-databind:2.15.0
+|    \\--- org.springframework:spring-web:6.0.9
+\\--- com.fasterxml.jackson.core:jackson-databind:2.15.0 (*)
+"""
+
+
+def write_script(path, output):
+    """Write an executable shell script that prints the given output.
+    
+    Each run also appends a line to the file at path + ".calls".
+    """
+    with open(path, "w") as f:
+        f.write("#!/bin/sh\necho run >> '" + path + ".calls'\ncat <<'EOF'\n" + output + "EOF\n")
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+
+
+@unittest.skipIf(os.name == "nt", "build tools are stubbed with shell scripts")
+class DependencyTreeTest(unittest.TestCase):
+    """Parse dependency trees printed by stubbed build tools."""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        
+        # Keep the tree cache out of the real home directory and put the
+        # stubbed mvn ahead of any real one
+        home = os.path.join(self.tmp_dir.name, "home")
+        bin_dir = os.path.join(self.tmp_dir.name, "bin")
+        os.makedirs(bin_dir)
+        self.mvn_path = os.path.join(bin_dir, "mvn")
+        write_script(self.mvn_path, MAVEN_TREE)
+        patcher = mock.patch.dict(os.environ, {
+            "HOME": home,
+            "PATH": bin_dir + os.pathsep + os.environ.get("PATH", ""),
+        })
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.project_path = os.path.join(self.tmp_dir.name, "project")
+        os.makedirs(self.project_path)
+    
+    def write_file(self, name, content):
+        path = os.path.join(self.project_path, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+    
+    def write_pom(self, directory, modules=(), artifact=None):
+        module_list = "".join(f"<module>{module}</module>" for module in modules)
+        dependency = ""
+        if artifact:
+            dependency = (
+                "<dependencies><dependency><groupId>org.example</groupId>"
+                f"<artifactId>{artifact}</artifactId><version>1.0</version>"
+                "</dependency></dependencies>"
+            )
+        self.write_file(
+            os.path.join(directory, "pom.xml"),
+            '<project xmlns="http://maven.apache.org/POM/4.0.0">'
+            f"<modules>{module_list}</modules>{dependency}</project>\n",
+        )
+    
+    def make_maven_project(self, modules=()):
+        self.write_pom("", modules)
+        for module in modules:
+            self.write_pom(module)
+    
+    def make_gradle_project(self):
+        with open(os.path.join(self.project_path, "build.gradle"), "w") as f:
+            f.write("dependencies {\n}\n")
+        write_script(os.path.join(self.project_path, "gradlew"), GRADLE_TREE)
+    
+    def count_calls(self, tool_path):
+        try:
+            with open(tool_path + ".calls") as f:
+                return len(f.readlines())
+        except OSError:
+            return 0
+    
+    def find(self, dependencies, name):
+        return [dep for dep in dependencies if dep["name"] == name]
+    
+    def test_maven_direct_dependency_seen_first_as_transitive(self):
+        self.make_maven_project()
+        
+        dependencies = MavenParser(self.project_path).parse_dependencies()
+        self.assertEqual(
+            [dep["transitive"] for dep in self.find(dependencies, "jackson-databind")], [False]
+        )
+        
+        direct = MavenParser(self.project_path, include_transitive=False).parse_dependencies()
+        self.assertEqual(
+            sorted(dep["name"] for dep in direct),
+            ["jackson-databind", "spring-boot-starter-web"],
+        )
+    
+    def test_gradle_direct_dependency_seen_first_as_transitive(self):
+        self.make_gradle_project()
+        
+        dependencies = GradleParser(self.project_path).parse_dependencies()
+        self.assertEqual(
+            [dep["transitive"] for dep in self.find(dependencies, "jackson-databind")], [False]
+        )
+        self.assertTrue(self.find(dependencies, "spring-web")[0]["transitive"])
+        
+        direct = GradleParser(self.project_path, include_transitive=False).parse_dependencies()
+        self.assertEqual(
+            sorted(dep["name"] for dep in direct),
+            ["jackson-databind", "spring-boot-starter-web"],
+        )
+
+    
+    def test_maven_tree_cache_covers_submodule_poms(self):
+        self.make_maven_project(modules=["core"])
+        
+        MavenParser(self.project_path).parse_dependencies()
+        MavenParser(self.project_path).parse_dependencies()
+        self.assertEqual(self.count_calls(self.mvn_path), 1)
+        
+        self.write_file(
+            os.path.join("core", "pom.xml"),
+            '<project xmlns="http://maven.apache.org/POM/4.0.0"><version>2</version></project>\n',
+        )
+        MavenParser(self.project_path).parse_dependencies()
+        self.assertEqual(self.count_calls(self.mvn_path), 2)
+    
+    def test_gradle_tree_cache_covers_catalog_and_subprojects(self):
+        self.make_gradle_project()
+        gradlew_path = os.path.join(self.project_path, "gradlew")
+        self.write_file("settings.gradle", "include ':app', ':lib:core'\n")
+        
+        GradleParser(self.project_path).parse_dependencies()
+        GradleParser(self.project_path).parse_dependencies()
+        self.assertEqual(self.count_calls(gradlew_path), 1)
+        
+        self.write_file(os.path.join("gradle", "libs.versions.toml"), "[versions]\n")
+        GradleParser(self.project_path).parse_dependencies()
+        self.assertEqual(self.count_calls(gradlew_path), 2)
+        
+        self.write_file(os.path.join("lib", "core", "build.gradle.kts"), "dependencies {}\n")
+        GradleParser(self.project_path).parse_dependencies()
+        self.assertEqual(self.count_calls(gradlew_path), 3)
+
+    
+    def test_module_poms_parsed_in_spawned_pool(self):
+        # Two levels of modules, the second reached through the first
+        modules = [f"m{i}" for i in range(4)]
+        self.write_pom("", modules)
+        for module in modules:
+            self.write_pom(module, ["sub"], artifact=f"{module}-lib")
+            self.write_pom(os.path.join(module, "sub"), artifact=f"{module}-sub-lib")
+        
+        pom_path = os.path.join(self.project_path, "pom.xml")
+        parser = MavenParser(self.project_path)
+        serial = parser._parse_module_poms(pom_path, modules)
+        
+        # Parse from a worker thread, as the checker does, with a pool of
+        # two workers whatever the CPU count
+        with mock.patch.object(java, "POM_PROCESS_POOL_MIN", 2), \
+                mock.patch.object(java.os, "cpu_count", return_value=2), \
+                mock.patch.object(java, "ProcessPoolExecutor", wraps=java.ProcessPoolExecutor) as pool:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pooled = executor.submit(parser._parse_module_poms, pom_path, modules).result(timeout=120)
+        
+        pool.assert_called_once()
+        self.assertEqual(pooled, serial)
+        self.assertEqual(
+            sorted(dep["name"] for _, deps in pooled for dep in deps),
+            sorted([f"{module}-lib" for module in modules] + [f"{module}-sub-lib" for module in modules]),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()